@@ -0,0 +1,68 @@
+"""
+Measures the time spent to convert date and date range answers to
+localized datetimes, with the local time zone, with a growing number of
+answers spread over a few years of dates, one at a time and in bulk.
+
+Usage:
+
+    $ python benchmarks/date_conversion.py [--days N]
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+
+from interrogatio.handlers.builtins import DateHandler, DateRangeHandler
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def get_dates(size, days):
+    start = date(2020, 1, 1)
+    return [(start + timedelta(days=i % days)).isoformat() for i in range(size)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=1_000)
+    args = parser.parse_args()
+
+    date_handler = DateHandler({"name": "date", "type": "date"})
+    range_handler = DateRangeHandler({"name": "range", "type": "daterange"})
+    for size in SIZES:
+        dates = get_dates(size, args.days)
+        ranges = [{"from": value, "to": value} for value in dates]
+
+        start = time.perf_counter()
+        for value in dates:
+            date_handler.value_to_python(value)
+        dates_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in ranges:
+            range_handler.value_to_python(value)
+        ranges_elapsed = time.perf_counter() - start
+
+        print(
+            f"{'scalar':<6} {size:>9} answers "
+            f"{dates_elapsed * 1000:10.1f} ms dates "
+            f"{ranges_elapsed * 1000:10.1f} ms ranges",
+        )
+
+        start = time.perf_counter()
+        date_handler.values_to_python(dates)
+        dates_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        range_handler.values_to_python(ranges)
+        ranges_elapsed = time.perf_counter() - start
+
+        print(
+            f"{'bulk':<6} {size:>9} answers "
+            f"{dates_elapsed * 1000:10.1f} ms dates "
+            f"{ranges_elapsed * 1000:10.1f} ms ranges",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Measures the time needed to import interrogatio and its entry points.
+
+Usage:
+
+    $ python benchmarks/import_time.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+TARGETS = [
+    "interrogatio",
+    "interrogatio.main",
+    "interrogatio.core.headless",
+    "interrogatio.core.prompt",
+]
+
+
+def measure(module, runs):
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            _, cumulative, name = (part.strip() for part in line.split("|"))
+            if name == module:
+                timings.append(int(cumulative))
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    for module in TARGETS:
+        print(f"{module:<30} {measure(module, args.runs) / 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
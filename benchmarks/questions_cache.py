@@ -0,0 +1,45 @@
+"""
+Measures the time spent loading a large YAML questions file with and
+without the on-disk cache used by the console entry points.
+"""
+
+import os
+import tempfile
+import time
+
+import yaml
+
+from interrogatio.core.cache import QuestionsCache
+from interrogatio.main import _get_deserializer
+
+QUESTIONS = 10000
+
+
+def main():
+    questions = [
+        {
+            "name": f"question{i}",
+            "type": "selectone",
+            "message": f"Question {i}",
+            "description": "A generated question.",
+            "values": [[f"v{j}", f"Value {j}"] for j in range(10)],
+            "validators": [{"name": "required"}],
+        }
+        for i in range(QUESTIONS)
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "questions.yaml")
+        with open(path, "w") as f:
+            yaml.dump(questions, f)
+        cache = QuestionsCache(os.path.join(tmp_dir, "cache"))
+        deserialize = _get_deserializer("yaml")
+        for label in ("cold", "warm"):
+            start = time.perf_counter()
+            with open(path) as f:
+                cache.load(f, deserialize, "yaml")
+            elapsed = time.perf_counter() - start
+            print(f"{label}: {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Measures the time needed to render a frame of SelectOne and SelectMany
+widgets with a growing number of options.
+
+Usage:
+
+    $ python benchmarks/select_render.py [--frames N]
+"""
+
+import argparse
+import timeit
+
+from interrogatio.widgets import SelectMany, SelectOne
+
+SIZES = [100, 10_000, 1_000_000]
+
+
+def render_frame(widget):
+    # Invalidate the cached fragments as a key press would do.
+    widget._selected_index = (widget._selected_index + 1) % len(widget.values)
+    widget.control.create_content(width=80, height=25)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in SIZES:
+        values = [(f"value{i}", f"Option {i}") for i in range(size)]
+        for widget_class in (SelectOne, SelectMany):
+            widget = widget_class(values=values)
+            elapsed = timeit.timeit(
+                lambda w=widget: render_frame(w),
+                number=args.frames,
+            )
+            print(
+                f"{widget_class.__name__:<10} {size:>9} options "
+                f"{elapsed / args.frames * 1000:10.3f} ms/frame",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compares the per question cost of computing the prompt style without and
+with the compiled style cache of themes.
+
+Each iteration simulates a question: the style is obtained and a few style
+strings used by the question widgets are resolved, as the renderer does.
+
+Usage:
+
+    $ python benchmarks/theme_styles.py [--questions N]
+"""
+
+import argparse
+import timeit
+
+from prompt_toolkit.styles import Style, default_ui_style, merge_styles
+
+from interrogatio.themes.builtins import DefaultTheme
+
+STYLE_STRINGS = [
+    "class:input.question",
+    "class:input.answer",
+    "class:error",
+]
+
+
+def _render(style):
+    for style_str in STYLE_STRINGS:
+        style.get_attrs_for_style_str(style_str)
+
+
+def uncached(theme):
+    style = merge_styles(
+        [
+            default_ui_style(),
+            Style(list(theme._prompt_styles.items())),
+        ]
+    )
+    _render(style)
+
+
+def cached(theme):
+    _render(theme.for_prompt())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--questions", type=int, default=1000)
+    args = parser.parse_args()
+
+    theme = DefaultTheme()
+    theme.for_prompt()
+
+    for name, func in (("uncached", uncached), ("cached", cached)):
+        elapsed = timeit.timeit(lambda f=func: f(theme), number=args.questions)
+        print(f"{name:<10} {elapsed / args.questions * 1e6:10.1f} us/question")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Measures the time spent to validate empty, invalid and valid answers of a
+question with the required, url and email validators, reporting all the
+errors and stopping at the first one.
+
+Usage:
+
+    $ python benchmarks/validators_pipeline.py [--runs N]
+"""
+
+import argparse
+import time
+
+from interrogatio.handlers import get_instance
+from interrogatio.validators import EmailValidator, RequiredValidator, URLValidator
+
+VALUES = {
+    "empty": "",
+    "invalid": "not an url",
+    "valid": "https://example.com",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for fail_fast in (False, True):
+        handler = get_instance(
+            {
+                "name": "website",
+                "type": "input",
+                "message": "Website",
+                "fail_fast": fail_fast,
+                "validators": [URLValidator(), EmailValidator(), RequiredValidator()],
+            },
+        )
+        handler.validate_value(VALUES["valid"])
+        for name, value in VALUES.items():
+            start = time.perf_counter()
+            for _ in range(args.runs):
+                handler.validate_value(value)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{'fail fast' if fail_fast else 'all errors':<10} {name:<8} "
+                f"{elapsed / args.runs * 1_000_000:8.1f} us/value",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measures the time needed to redraw the steps of a wizard whose questions
+have a ``disabled`` condition, with and without reusing the conditions
+results between redraws.
+
+Usage:
+
+    $ python benchmarks/wizard_disabled.py [--steps N] [--frames N]
+"""
+
+import argparse
+import time
+import timeit
+from unittest import mock
+
+from interrogatio.handlers import get_instance
+from interrogatio.widgets.wizard import WizardDialog
+
+
+def is_disabled(name):
+    def _disabled(answers):
+        # Simulates a non trivial condition.
+        time.sleep(0.0001)
+        return answers.get(name) == "skip"
+
+    return _disabled
+
+
+def render_frame(wizard, cached=True):
+    if not cached:
+        wizard._disabled_cache.clear()
+    wizard.sidebar._get_text_fragments()
+    wizard.set_buttons_labels()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=300)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    questions = [
+        {
+            "name": f"question{i}",
+            "type": "input",
+            "message": f"Question {i}",
+            "disabled": is_disabled(f"question{i - 1}"),
+        }
+        for i in range(args.steps)
+    ]
+    with mock.patch("interrogatio.widgets.wizard.get_app"):
+        wizard = WizardDialog(
+            "benchmark",
+            [get_instance(q) for q in questions],
+        )
+        for _ in range(args.steps // 2):
+            wizard.next()
+
+    for cached in (False, True):
+        elapsed = timeit.timeit(
+            lambda c=cached: render_frame(wizard, c),
+            number=args.frames,
+        )
+        print(
+            f"{'cached' if cached else 'uncached':<9} {args.steps} steps "
+            f"{elapsed / args.frames * 1000:10.3f} ms/frame",
+        )
+
+
+if __name__ == "__main__":
+    main()
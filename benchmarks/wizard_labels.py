@@ -0,0 +1,77 @@
+"""
+Measures the memory allocated, with tracemalloc, and the time spent to
+build the steps labels of a wizard for a frame, with a growing number of
+steps, building all the labels from scratch and updating only those whose
+style changed.
+
+The memory is reported as the number of blocks still allocated after the
+frame and the peak of the memory allocated during the frame.
+
+Usage:
+
+    $ python benchmarks/wizard_labels.py [--frames N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from unittest import mock
+
+from interrogatio.handlers import get_instance
+from interrogatio.widgets.wizard import WizardDialog
+
+SIZES = [100, 1_000, 10_000]
+
+
+def render_frame(wizard, cached=True):
+    if not cached:
+        wizard.sidebar._labels.clear()
+    wizard.sidebar._get_text_fragments()
+
+
+def measure(wizard, frames, cached):
+    blocks = 0
+    peak = 0
+    elapsed = 0
+    for _ in range(frames):
+        tracemalloc.start()
+        render_frame(wizard, cached)
+        snapshot = tracemalloc.take_snapshot()
+        peak += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        blocks += sum(stat.count for stat in snapshot.statistics("filename"))
+        start = time.perf_counter()
+        render_frame(wizard, cached)
+        elapsed += time.perf_counter() - start
+    return blocks / frames, peak / frames, elapsed / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    for size in SIZES:
+        questions = [
+            {"name": f"question{i}", "type": "input", "message": f"Question {i}"}
+            for i in range(size)
+        ]
+        with mock.patch("interrogatio.widgets.wizard.get_app"):
+            wizard = WizardDialog(
+                "benchmark",
+                [get_instance(q) for q in questions],
+            )
+            wizard.go_to_step(size // 2)
+        render_frame(wizard)
+
+        for cached in (False, True):
+            blocks, peak, elapsed = measure(wizard, args.frames, cached)
+            print(
+                f"{'cached' if cached else 'uncached':<9} {size:>6} steps "
+                f"{blocks:8.0f} blocks {peak / 1024:8.1f} KiB peak "
+                f"{elapsed * 1000:8.3f} ms/frame",
+            )
+
+
+if __name__ == "__main__":
+    main()
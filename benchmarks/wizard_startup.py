@@ -0,0 +1,68 @@
+"""
+Measures the time spent and the peak of the memory allocated, with
+tracemalloc, to build a wizard and the layout of its first step, with a
+growing number of selectone questions with many values each, building
+only the first step and building the layouts of all the steps up front.
+
+Usage:
+
+    $ python benchmarks/wizard_startup.py [--values N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from unittest import mock
+
+from interrogatio.handlers import get_instance
+from interrogatio.widgets.wizard import WizardDialog
+
+SIZES = [10, 50, 200]
+
+
+def build(questions, eager):
+    wizard = WizardDialog("benchmark", [get_instance(q) for q in questions])
+    wizard.get_current_step_container()
+    if eager:
+        for step in wizard.steps:
+            wizard._get_layout(step)
+    return wizard
+
+
+def measure(questions, eager):
+    tracemalloc.start()
+    build(questions, eager)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    build(questions, eager)
+    return peak, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--values", type=int, default=1_000)
+    args = parser.parse_args()
+
+    values = [(f"value{i}", f"Value {i}") for i in range(args.values)]
+    for size in SIZES:
+        questions = [
+            {
+                "name": f"question{i}",
+                "type": "selectone",
+                "message": f"Question {i}",
+                "values": values,
+            }
+            for i in range(size)
+        ]
+        with mock.patch("interrogatio.widgets.wizard.get_app"):
+            for eager in (True, False):
+                peak, elapsed = measure(questions, eager)
+                print(
+                    f"{'eager' if eager else 'lazy':<6} {size:>4} steps "
+                    f"{peak / 1024:10.1f} KiB peak {elapsed * 1000:8.1f} ms",
+                )
+
+
+if __name__ == "__main__":
+    main()
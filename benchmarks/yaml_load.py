@@ -0,0 +1,49 @@
+"""
+Compares the time spent loading a questions file with 10k questions, and
+dumping the answers, with the pure Python and the libyaml based PyYAML
+loaders and dumpers.
+"""
+
+import time
+
+import yaml
+
+QUESTIONS = 10000
+
+
+def _measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    questions = [
+        {
+            "name": f"question{i}",
+            "type": "selectone",
+            "message": f"Question {i}",
+            "description": "A generated question.",
+            "values": [[f"v{j}", f"Value {j}"] for j in range(10)],
+            "validators": [{"name": "required"}],
+        }
+        for i in range(QUESTIONS)
+    ]
+    answers = {f"question{i}": f"v{i % 10}" for i in range(QUESTIONS)}
+    content = yaml.dump(questions)
+    print(f"PyYAML {yaml.__version__}, libyaml: {yaml.__with_libyaml__}")
+
+    python_load = _measure(yaml.load, content, Loader=yaml.FullLoader)
+    python_dump = _measure(yaml.dump, answers, Dumper=yaml.Dumper)
+    print(f"FullLoader:  {python_load * 1000:.0f}ms")
+    print(f"Dumper:      {python_dump * 1000:.0f}ms")
+    if not yaml.__with_libyaml__:
+        return
+    c_load = _measure(yaml.load, content, Loader=yaml.CFullLoader)
+    c_dump = _measure(yaml.dump, answers, Dumper=yaml.CDumper)
+    print(f"CFullLoader: {c_load * 1000:.0f}ms ({python_load / c_load:.1f}x)")
+    print(f"CDumper:     {c_dump * 1000:.0f}ms ({python_dump / c_dump:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
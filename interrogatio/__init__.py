@@ -1,13 +1,41 @@
-from importlib_metadata import version
+import importlib
 
-from interrogatio.core.dialog import dialogus
-from interrogatio.core.prompt import interrogatio
+__all__ = (
+    "compile_questions",
+    "dialogus",
+    "dialogus_async",
+    "evaluate",
+    "interrogatio",
+    "interrogatio_async",
+)
 
-__all__ = ("dialogus", "interrogatio")
 
+_LAZY_ATTRIBUTES = {
+    "compile_questions": "interrogatio.core.plan",
+    "dialogus": "interrogatio.core.dialog",
+    "dialogus_async": "interrogatio.core.dialog",
+    "evaluate": "interrogatio.core.headless",
+    "interrogatio": "interrogatio.core.prompt",
+    "interrogatio_async": "interrogatio.core.prompt",
+}
 
-__version__ = version("interrogatio")
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name == "__version__":
+        from importlib_metadata import version
+
+        value = version("interrogatio")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"__version__"})
 
 
 def get_version():
-    return __version__
+    return __getattr__("__version__")
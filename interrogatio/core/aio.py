@@ -0,0 +1,44 @@
+import asyncio
+import inspect
+import threading
+
+
+async def maybe_await(value):
+    """
+    Awaits the given value if it is awaitable, otherwise returns it as is.
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def run_sync(value):
+    """
+    Returns the result of the given value, running it to completion if it
+    is awaitable.
+
+    If an event loop is already running in the current thread (i.e. within
+    a prompt_toolkit application), the awaitable is run in a new event loop
+    within a worker thread, blocking the caller until it completes.
+    """
+    if not inspect.isawaitable(value):
+        return value
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(maybe_await(value))
+
+    outcome = {}
+
+    def _target():
+        try:
+            outcome["result"] = asyncio.run(maybe_await(value))
+        except BaseException as e:  # noqa: B036
+            outcome["error"] = e
+
+    worker = threading.Thread(target=_target)
+    worker.start()
+    worker.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
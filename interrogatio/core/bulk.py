@@ -0,0 +1,122 @@
+import csv
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from interrogatio.core.headless import process
+from interrogatio.core.plan import compile_questions
+
+__all__ = ["BulkValidator", "read_csv", "read_jsonl"]
+
+
+RECORD_ERROR_KEY = "__record__"
+
+_worker_questions = None
+
+
+def read_jsonl(f):
+    """
+    Yields the non empty lines of a JSONL file.
+    Lines are decoded by the workers that validate them.
+    """
+    for line in f:
+        if line.strip():
+            yield line
+
+
+def read_csv(f):
+    """
+    Yields the rows of a CSV file with a header row as dictionaries.
+    Cells are plain strings, so they can't answer ``selectmany`` and
+    ``daterange`` questions.
+    """
+    yield from csv.DictReader(f)
+
+
+def _check_records(questions, chunk):
+    invalid = []
+    for index, record in chunk:
+        if isinstance(record, str):
+            try:
+                record = json.loads(record)
+            except ValueError as e:
+                invalid.append((index, {RECORD_ERROR_KEY: [f"invalid record: {e}"]}))
+                continue
+        if not isinstance(record, dict):
+            invalid.append((index, {RECORD_ERROR_KEY: ["record must be an object"]}))
+            continue
+        try:
+            _, errors = process(questions, record)
+        except Exception as e:
+            errors = {RECORD_ERROR_KEY: [f"record could not be validated: {e!r}"]}
+        if errors:
+            invalid.append((index, errors))
+    return len(chunk), invalid
+
+
+def _init_worker(questions):
+    global _worker_questions
+    _worker_questions = questions
+
+
+def _check_records_in_worker(chunk):
+    return _check_records(_worker_questions, chunk)
+
+
+class BulkValidator:
+    """
+    Validates a stream of answer records against a set of questions.
+
+    Records are read lazily and distributed in chunks to a pool of worker
+    processes. At most two chunks per worker are in flight at the same time,
+    so memory usage does not depend on the number of records.
+    """
+
+    def __init__(self, questions, jobs=1, chunk_size=1000):
+        self.questions = questions
+        self.jobs = jobs
+        self.chunk_size = chunk_size
+        self.total = 0
+        self.invalid = 0
+
+    def _chunks(self, records):
+        numbered = enumerate(records, start=1)
+        while True:
+            chunk = list(islice(numbered, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _collect(self, result):
+        count, invalid = result
+        self.total += count
+        self.invalid += len(invalid)
+        for index, errors in invalid:
+            yield {"record": index, "errors": errors}
+
+    def validate(self, records):
+        """
+        Validates the records and yields a dictionary with the record number
+        (starting from 1) and the errors for each invalid record, in input order.
+
+        :param records: an iterable of answer dictionaries or JSON strings.
+        """
+        plan = compile_questions(self.questions)
+        if self.jobs <= 1:
+            for chunk in self._chunks(records):
+                yield from self._collect(_check_records(plan, chunk))
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_worker,
+            initargs=(plan,),
+        ) as executor:
+            pending = deque()
+            for chunk in self._chunks(records):
+                pending.append(executor.submit(_check_records_in_worker, chunk))
+                if len(pending) >= self.jobs * 2:
+                    yield from self._collect(pending.popleft().result())
+            while pending:
+                yield from self._collect(pending.popleft().result())
@@ -0,0 +1,155 @@
+import hashlib
+import io
+import os
+import pickle
+import stat
+import tempfile
+from functools import lru_cache
+
+from interrogatio.core.plan import compile_questions
+
+__all__ = ["QuestionsCache", "get_default_cache_dir", "get_package_fingerprint"]
+
+
+CACHE_VERSION = 2
+
+# The modules whose classes end up pickled in a compiled plan.
+_PICKLED_PACKAGES = ("core", "handlers", "validators")
+
+
+@lru_cache(maxsize=None)
+def get_package_fingerprint():
+    """
+    Returns a digest of the interrogatio version and of the size and the
+    modification time of the modules whose objects are pickled in the
+    cache, so that entries written by another version, or by a modified
+    installation, are not loaded.
+    """
+    from interrogatio import get_version
+
+    fingerprint = hashlib.blake2b(get_version().encode(), digest_size=16)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for package in _PICKLED_PACKAGES:
+        directory = os.path.join(root, package)
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                st = os.stat(os.path.join(directory, name))
+                fingerprint.update(
+                    f"{package}/{name}:{st.st_size}:{st.st_mtime_ns}".encode(),
+                )
+    return fingerprint.hexdigest()
+
+
+def _is_trusted(path):
+    # Unpickling runs arbitrary code: only files and directories owned by
+    # the current user that nobody else can write to are trusted.
+    if os.name != "posix":  # pragma: no cover
+        return True
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def get_default_cache_dir():
+    """
+    Returns the directory used to cache the compiled questions files,
+    ``$XDG_CACHE_HOME/interrogatio`` or ``~/.cache/interrogatio``.
+    """
+    base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"),
+        ".cache",
+    )
+    return os.path.join(base_dir, "interrogatio")
+
+
+class QuestionsCache:
+    """
+    Keeps the questions loaded from a file, parsed and compiled into a
+    :class:`~interrogatio.core.plan.QuestionsPlan`, in a pickle file.
+
+    An entry is reused only if the path, the format, the modification time
+    and the content hash of the questions file and the installed
+    interrogatio are unchanged.
+
+    Loading a pickle file can run arbitrary code, so the cache directory
+    must be trusted: entries are read only if both the directory and the
+    entry are owned by the current user and are not writable by the group
+    or by others.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or get_default_cache_dir()
+
+    def _get_entry_path(self, path, fmt):
+        key = hashlib.blake2b(
+            f"{fmt}:{os.path.abspath(path)}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.pickle")
+
+    def _read_entry(self, entry_path):
+        if not (_is_trusted(self.cache_dir) and _is_trusted(entry_path)):
+            return None
+        try:
+            with open(entry_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def _write_entry(self, entry_path, entry):
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except Exception:
+            # The cache is best effort: questions that can't be pickled or
+            # an unwritable cache directory must not prevent running.
+            os.unlink(tmp_path)
+
+    def load(self, f, deserialize, fmt="json"):
+        """
+        Returns the compiled questions of an open questions file, parsing
+        and compiling them only if they are not cached yet.
+
+        :param f: the questions file.
+        :param deserialize: the function used to parse the file.
+        :param fmt: the name of the file format.
+        :type fmt: str
+
+        :return: the compiled questions.
+        :rtype: QuestionsPlan
+        """
+        content = f.read()
+        digest = hashlib.blake2b(content.encode()).hexdigest()
+        mtime = os.stat(f.name).st_mtime_ns
+        entry_path = self._get_entry_path(f.name, fmt)
+
+        entry = self._read_entry(entry_path)
+        if (
+            isinstance(entry, dict)
+            and entry.get("version") == CACHE_VERSION
+            and entry.get("fingerprint") == get_package_fingerprint()
+            and entry.get("mtime") == mtime
+            and entry.get("digest") == digest
+        ):
+            return entry["plan"]
+
+        plan = compile_questions(deserialize(io.StringIO(content)))
+        self._write_entry(
+            entry_path,
+            {
+                "version": CACHE_VERSION,
+                "fingerprint": get_package_fingerprint(),
+                "mtime": mtime,
+                "digest": digest,
+                "plan": plan,
+            },
+        )
+        return plan
@@ -0,0 +1,77 @@
+import json
+import os
+import tempfile
+
+__all__ = ["load_checkpoint", "remove_checkpoint", "save_checkpoint"]
+
+
+CHECKPOINT_VERSION = 1
+
+
+def load_checkpoint(path):
+    """
+    Returns the checkpoint saved in a file or None if the file doesn't exist
+    or it is not a valid checkpoint.
+
+    :param path: the path of the checkpoint file.
+    :type path: str
+
+    :return: the checkpoint.
+    :rtype: dict
+    """
+    try:
+        with open(path) as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(checkpoint, dict)
+        or checkpoint.get("version") != CHECKPOINT_VERSION
+        or not isinstance(checkpoint.get("names"), list)
+        or not isinstance(checkpoint.get("step"), int)
+        or not isinstance(checkpoint.get("values"), dict)
+    ):
+        return None
+    return checkpoint
+
+
+def save_checkpoint(path, checkpoint):
+    """
+    Atomically writes a checkpoint to a file: the checkpoint is written to a
+    temporary file in the same directory that then replaces the old one, so
+    an interrupted write never leaves a truncated checkpoint behind.
+
+    :param path: the path of the checkpoint file.
+    :type path: str
+    :param checkpoint: the checkpoint as returned by
+                       :meth:`~interrogatio.widgets.wizard.WizardDialog.get_checkpoint`.
+    :type checkpoint: dict
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                dict(checkpoint, version=CHECKPOINT_VERSION),
+                f,
+                default=str,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def remove_checkpoint(path):
+    """
+    Removes a checkpoint file if it exists.
+
+    :param path: the path of the checkpoint file.
+    :type path: str
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
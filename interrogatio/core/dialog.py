@@ -1,12 +1,51 @@
+import asyncio
+from functools import partial
+
 from prompt_toolkit.application import Application
 from prompt_toolkit.layout import Layout
 
+from interrogatio.core.checkpoint import (
+    load_checkpoint,
+    remove_checkpoint,
+    save_checkpoint,
+)
+from interrogatio.core.plan import QuestionsPlan
 from interrogatio.core.utils import validate_questions
 from interrogatio.handlers import get_instance
 from interrogatio.themes import for_dialog, set_theme
 from interrogatio.widgets.wizard import WizardDialog
 
-__all__ = ["dialogus"]
+__all__ = ["dialogus", "dialogus_async"]
+
+
+def _create_handlers(questions):
+    if isinstance(questions, QuestionsPlan):
+        return questions.create_handlers()
+    return [get_instance(q) for q in questions]
+
+
+def _save_checkpoint(path, wizard):
+    try:
+        save_checkpoint(path, wizard.get_checkpoint())
+    except OSError:
+        # Checkpoints are a safety net: failing to write one must not
+        # interrupt the dialog.
+        pass
+
+
+def _create_application(title, handlers, resume=None, **kwargs):
+    wizard = WizardDialog(title, handlers, **kwargs)
+    if resume:
+        checkpoint = load_checkpoint(resume)
+        if checkpoint:
+            wizard.restore(checkpoint)
+        wizard.on_change = partial(_save_checkpoint, resume)
+    return Application(
+        layout=Layout(wizard),
+        mouse_support=False,
+        style=for_dialog(),
+        full_screen=True,
+    )
 
 
 def show_dialog(
@@ -19,31 +58,72 @@ def show_dialog(
     previous_text="Previous",
     cancel_text="Cancel",
     finish_text="Finish",
+    resume=None,
+    release_steps=False,
 ):
-    handlers = [get_instance(q) for q in questions]
-    app = Application(
-        layout=Layout(
-            WizardDialog(
-                title,
-                handlers,
-                intro=intro,
-                summary=summary,
-                fast_forward=fast_forward,
-                next_text=next_text,
-                previous_text=previous_text,
-                cancel_text=cancel_text,
-                finish_text=finish_text,
-            ),
-        ),
-        mouse_support=False,
-        style=for_dialog(),
-        full_screen=True,
+    handlers = _create_handlers(questions)
+    app = _create_application(
+        title,
+        handlers,
+        intro=intro,
+        summary=summary,
+        fast_forward=fast_forward,
+        next_text=next_text,
+        previous_text=previous_text,
+        cancel_text=cancel_text,
+        finish_text=finish_text,
+        resume=resume,
+        release_steps=release_steps,
     )
 
     if not app.run():
         return
+    if resume:
+        remove_checkpoint(resume)
+    answers = {}
+    for handler in handlers:
+        if not handler.is_disabled(answers):
+            answers.update(handler.get_answer())
+    return answers
+
+
+async def show_dialog_async(
+    questions,
+    title,
+    intro=None,
+    summary=False,
+    fast_forward=False,
+    next_text="Next",
+    previous_text="Previous",
+    cancel_text="Cancel",
+    finish_text="Finish",
+    resume=None,
+    release_steps=False,
+):
+    handlers = _create_handlers(questions)
+    await asyncio.gather(*(handler.resolve({}) for handler in handlers))
+    app = _create_application(
+        title,
+        handlers,
+        intro=intro,
+        summary=summary,
+        fast_forward=fast_forward,
+        next_text=next_text,
+        previous_text=previous_text,
+        cancel_text=cancel_text,
+        finish_text=finish_text,
+        resume=resume,
+        release_steps=release_steps,
+        run_async=True,
+    )
+
+    if not await app.run_async():
+        return
+    if resume:
+        remove_checkpoint(resume)
     answers = {}
     for handler in handlers:
+        await handler.resolve(answers, ("disabled",))
         if not handler.is_disabled(answers):
             answers.update(handler.get_answer())
     return answers
@@ -60,13 +140,15 @@ def dialogus(
     cancel_text="Cancel",
     finish_text="Finish",
     theme="default",
+    resume=None,
+    release_steps=False,
 ):
     """
     Show a dialog with inputs as defined in the questions parameter and returns
     a dictionary with the answers.
 
-    :param questions: a list of questions.
-    :type questions: list
+    :param questions: a list of questions or a compiled plan.
+    :type questions: list or QuestionsPlan
 
     :param title: the title of the dialog.
     :type title: str
@@ -77,6 +159,17 @@ def dialogus(
     :param cancel: the cancel button text.
     :type cancel: str
 
+    :param resume: the path of a file where the answers and the current step
+                   are saved after each step. If the file exists, the dialog
+                   resumes from the saved step. The file is removed once the
+                   dialog is finished.
+    :type resume: str
+
+    :param release_steps: release the widgets of the questions once they
+                          are answered, keeping only their values, to limit
+                          the memory used by long dialogs.
+    :type release_steps: bool
+
     :return: a dictionary with the answers.
     :rtype: dict
 
@@ -105,7 +198,8 @@ def dialogus(
         )
     """
     set_theme(theme)
-    validate_questions(questions)
+    if not isinstance(questions, QuestionsPlan):
+        validate_questions(questions)
     return show_dialog(
         questions,
         title,
@@ -116,4 +210,53 @@ def dialogus(
         previous_text=previous_text,
         cancel_text=cancel_text,
         finish_text=finish_text,
+        resume=resume,
+        release_steps=release_steps,
+    )
+
+
+async def dialogus_async(
+    questions,
+    title,
+    intro=None,
+    summary=False,
+    fast_forward=False,
+    next_text="Next",
+    previous_text="Previous",
+    cancel_text="Cancel",
+    finish_text="Finish",
+    theme="default",
+    resume=None,
+    release_steps=False,
+):
+    """
+    Coroutine version of :func:`dialogus` to be used within a running
+    asyncio event loop.
+
+    The ``values``, ``default`` and ``disabled`` attributes of the questions
+    can also be coroutine functions: they are awaited in background tasks
+    while moving between the steps of the dialog.
+
+    Usage:
+
+    .. code-block:: python
+
+        from interrogatio import dialogus_async
+        answers = await dialogus_async(questions, title='Tell me something')
+    """
+    set_theme(theme)
+    if not isinstance(questions, QuestionsPlan):
+        validate_questions(questions)
+    return await show_dialog_async(
+        questions,
+        title,
+        intro=intro,
+        summary=summary,
+        fast_forward=fast_forward,
+        next_text=next_text,
+        previous_text=previous_text,
+        cancel_text=cancel_text,
+        finish_text=finish_text,
+        resume=resume,
+        release_steps=release_steps,
     )
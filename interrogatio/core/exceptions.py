@@ -10,6 +10,25 @@ class ThemeNotFoundError(Exception):
     pass
 
 
+class InvalidAnswersError(Exception):
+    """
+    Exception raised when answers supplied in headless mode are invalid.
+    """
+
+    def __init__(self, errors):
+        super().__init__()
+        self._errors = errors
+
+    def __str__(self):
+        return "; ".join(
+            f"{name}: {', '.join(messages)}" for name, messages in self._errors.items()
+        )
+
+    @property
+    def errors(self):
+        return self._errors
+
+
 class ValidationError(Exception):
     """
     Exception raised when validation fails.
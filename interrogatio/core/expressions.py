@@ -0,0 +1,375 @@
+import ast
+import operator
+
+from interrogatio.core.exceptions import InvalidQuestionError
+
+__all__ = ["Expression", "compile_expression"]
+
+
+ANSWERS = "answers"
+
+# The largest string, list or tuple that can be built by repetition,
+# counting the characters and the items of the nested values too.
+MAX_REPETITION = 10_000
+
+# The errors that make an expression evaluate to None.
+_EVALUATION_ERRORS = (TypeError, ValueError, KeyError, IndexError, ZeroDivisionError)
+
+
+def _propagate_none(func):
+    # An answer not given yet is None: operations and functions applied to
+    # it result in None instead of raising a TypeError.
+    def wrapper(*args):
+        if any(arg is None for arg in args):
+            return None
+        return func(*args)
+
+    return wrapper
+
+
+def _ordering(func):
+    # Answers not given yet can't be ordered: the comparison is False.
+    def wrapper(left, right):
+        if left is None or right is None:
+            return False
+        return func(left, right)
+
+    return wrapper
+
+
+def _contains(func):
+    # Nothing can be looked up in an answer not given yet: the result is None.
+    def wrapper(left, right):
+        if right is None:
+            return None
+        return func(left, right)
+
+    return wrapper
+
+
+def _size(value, limit):
+    # Counts the characters and the items of a value and of the values it
+    # contains, stopping as soon as the count exceeds the limit.
+    size = 0
+    stack = [value]
+    while stack and size <= limit:
+        item = stack.pop()
+        if isinstance(item, str):
+            size += len(item)
+        elif isinstance(item, (list, tuple, set)):
+            size += len(item)
+            if size <= limit:
+                stack.extend(item)
+        elif isinstance(item, dict):
+            size += len(item)
+            if size <= limit:
+                stack.extend(item.keys())
+                stack.extend(item.values())
+    return size
+
+
+def _multiply(left, right):
+    for sequence, times in ((left, right), (right, left)):
+        if (
+            isinstance(sequence, (str, list, tuple))
+            and isinstance(times, int)
+            and times > 0
+            and _size(sequence, MAX_REPETITION) * times > MAX_REPETITION
+        ):
+            raise ValueError(
+                f"the result of a repetition can't be longer than "
+                f"{MAX_REPETITION} items",
+            )
+    return left * right
+
+
+def _modulo(left, right):
+    if isinstance(left, str):
+        raise ValueError("strings can't be formatted with %")
+    return left % right
+
+
+_BINARY_OPERATORS = {
+    ast.Add: _propagate_none(operator.add),
+    ast.Sub: _propagate_none(operator.sub),
+    ast.Mult: _propagate_none(_multiply),
+    ast.Div: _propagate_none(operator.truediv),
+    ast.FloorDiv: _propagate_none(operator.floordiv),
+    ast.Mod: _propagate_none(_modulo),
+}
+
+_UNARY_OPERATORS = {
+    ast.Not: operator.not_,
+    ast.USub: _propagate_none(operator.neg),
+    ast.UAdd: _propagate_none(operator.pos),
+}
+
+_COMPARISON_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: _ordering(operator.lt),
+    ast.LtE: _ordering(operator.le),
+    ast.Gt: _ordering(operator.gt),
+    ast.GtE: _ordering(operator.ge),
+    ast.In: _contains(lambda left, right: left in right),
+    ast.NotIn: _contains(lambda left, right: left not in right),
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+
+_FUNCTIONS = {
+    "abs": _propagate_none(abs),
+    "bool": bool,
+    "float": _propagate_none(float),
+    "int": _propagate_none(int),
+    "len": _propagate_none(len),
+    "max": _propagate_none(max),
+    "min": _propagate_none(min),
+    "str": _propagate_none(str),
+}
+
+
+class _Compiler:
+    """
+    Compiles the nodes of a parsed expression into nested closures that
+    take the answers as their only argument, collecting the names of the
+    answers the expression reads.
+
+    Only the nodes with a ``compile_<NodeName>`` method are allowed.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.dependencies = set()
+
+    def error(self, reason):
+        return InvalidQuestionError(f"Invalid expression {self.source}: {reason}.")
+
+    def compile(self, node):
+        method = getattr(self, f"compile_{type(node).__name__}", None)
+        if method is None:
+            raise self.error(f"unsupported syntax {type(node).__name__}")
+        return method(node)
+
+    def compile_answer(self, name):
+        self.dependencies.add(name)
+        return lambda answers: answers.get(name)
+
+    def compile_Constant(self, node):
+        value = node.value
+        if not isinstance(value, (str, int, float, bool, type(None))):
+            raise self.error(f"unsupported constant {value!r}")
+        return lambda answers: value
+
+    def compile_Name(self, node):
+        if node.id == ANSWERS:
+            raise self.error(f"{ANSWERS} must be followed by a question name")
+        raise self.error(f"unknown name {node.id}")
+
+    def compile_Attribute(self, node):
+        if isinstance(node.value, ast.Name) and node.value.id == ANSWERS:
+            return self.compile_answer(node.attr)
+        raise self.error("attributes can only be read from answers")
+
+    def compile_Subscript(self, node):
+        index = node.slice
+        if type(index).__name__ == "Index":  # pragma: no cover
+            # Python 3.8 wraps the subscript in an Index node.
+            index = index.value
+        if isinstance(node.value, ast.Name) and node.value.id == ANSWERS:
+            if isinstance(index, ast.Constant) and isinstance(index.value, str):
+                return self.compile_answer(index.value)
+            raise self.error("answers must be indexed by a question name")
+        value = self.compile(node.value)
+        key = self.compile(index)
+
+        def _subscript(answers):
+            container = value(answers)
+            if container is None:
+                return None
+            return container[key(answers)]
+
+        return _subscript
+
+    def compile_BoolOp(self, node):
+        values = [self.compile(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+
+            def _and(answers):
+                for value in values:
+                    result = value(answers)
+                    if not result:
+                        return result
+                return result
+
+            return _and
+
+        def _or(answers):
+            for value in values:
+                result = value(answers)
+                if result:
+                    return result
+            return result
+
+        return _or
+
+    def compile_UnaryOp(self, node):
+        op = _UNARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise self.error(f"unsupported operator {type(node.op).__name__}")
+        operand = self.compile(node.operand)
+        return lambda answers: op(operand(answers))
+
+    def compile_BinOp(self, node):
+        op = _BINARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise self.error(f"unsupported operator {type(node.op).__name__}")
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        return lambda answers: op(left(answers), right(answers))
+
+    def compile_Compare(self, node):
+        ops = [_COMPARISON_OPERATORS[type(op)] for op in node.ops]
+        left = self.compile(node.left)
+        comparators = [self.compile(comparator) for comparator in node.comparators]
+        if len(ops) == 1:
+            op, right = ops[0], comparators[0]
+            return lambda answers: op(left(answers), right(answers))
+
+        def _compare(answers):
+            left_value = left(answers)
+            for op, right in zip(ops, comparators):
+                right_value = right(answers)
+                if not op(left_value, right_value):
+                    return False
+                left_value = right_value
+            return True
+
+        return _compare
+
+    def compile_IfExp(self, node):
+        test = self.compile(node.test)
+        body = self.compile(node.body)
+        orelse = self.compile(node.orelse)
+        return lambda answers: body(answers) if test(answers) else orelse(answers)
+
+    def compile_Call(self, node):
+        if not isinstance(node.func, ast.Name) or node.func.id not in _FUNCTIONS:
+            functions = ", ".join(sorted(_FUNCTIONS))
+            raise self.error(f"only the functions {functions} can be called")
+        if node.keywords or any(isinstance(arg, ast.Starred) for arg in node.args):
+            raise self.error("functions only accept positional arguments")
+        func = _FUNCTIONS[node.func.id]
+        args = [self.compile(arg) for arg in node.args]
+        return lambda answers: func(*(arg(answers) for arg in args))
+
+    def compile_List(self, node):
+        elts = [self.compile(elt) for elt in node.elts]
+        return lambda answers: [elt(answers) for elt in elts]
+
+    def compile_Tuple(self, node):
+        elts = [self.compile(elt) for elt in node.elts]
+        return lambda answers: tuple(elt(answers) for elt in elts)
+
+    def compile_Set(self, node):
+        elts = [self.compile(elt) for elt in node.elts]
+        return lambda answers: {elt(answers) for elt in elts}
+
+    def compile_Dict(self, node):
+        if any(key is None for key in node.keys):
+            raise self.error("dictionary unpacking is not supported")
+        items = [
+            (self.compile(key), self.compile(value))
+            for key, value in zip(node.keys, node.values)
+        ]
+        return lambda answers: {key(answers): value(answers) for key, value in items}
+
+
+class Expression:
+    """
+    A condition or a value computed from the answers, written with a safe
+    subset of the Python expressions syntax so that it can be stored in a
+    JSON or YAML questions file.
+
+    The answers are read with ``answers.name`` or ``answers['name']``; an
+    answer that has not been given yet is None. Literals, boolean,
+    comparison and arithmetic operators, conditional expressions and the
+    ``abs``, ``bool``, ``float``, ``int``, ``len``, ``max``, ``min`` and
+    ``str`` functions are supported.
+
+    Arithmetic operators, functions (but ``bool``), ``in``, ``not in`` and
+    subscripts applied to None result in None and ordering comparisons with
+    None are False, so that expressions can be evaluated before the answers
+    they read are given. An expression that can't be evaluated with the
+    given answers, for example ``int(answers.age)`` with an empty age,
+    results in None as well. Repeating a string, a list or a tuple can't
+    build one with more than :data:`MAX_REPETITION` items and characters,
+    nested values included.
+
+    Use :func:`compile_expression` to create it.
+    """
+
+    def __init__(self, source):
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise InvalidQuestionError(
+                f"Invalid expression {source}: {e.msg}.",
+            ) from None
+        compiler = _Compiler(source)
+        self._evaluate = compiler.compile(tree.body)
+        self._source = source
+        self._dependencies = frozenset(compiler.dependencies)
+
+    @property
+    def source(self):
+        """
+        The text of the expression.
+
+        :rtype: str
+        """
+        return self._source
+
+    @property
+    def dependencies(self):
+        """
+        The names of the answers the expression reads.
+
+        :rtype: frozenset
+        """
+        return self._dependencies
+
+    def __call__(self, answers=None):
+        try:
+            return self._evaluate({} if answers is None else answers)
+        except _EVALUATION_ERRORS:
+            return None
+
+    def __reduce__(self):
+        return compile_expression, (self._source,)
+
+    def __eq__(self, other):
+        return isinstance(other, Expression) and other._source == self._source
+
+    def __hash__(self):
+        return hash(self._source)
+
+    def __repr__(self):
+        return f"Expression({self._source!r})"
+
+
+def compile_expression(source):
+    """
+    Parses an expression and compiles it into a callable that takes the
+    answers and returns the value of the expression.
+
+    :param source: the text of the expression.
+    :type source: str
+
+    :return: the compiled expression.
+    :rtype: Expression
+
+    :raise InvalidQuestionError: if the expression is not valid or uses
+                                 unsupported syntax.
+    """
+    return Expression(source)
@@ -0,0 +1,91 @@
+from interrogatio.core.exceptions import InvalidAnswersError, ValidationError
+from interrogatio.core.plan import QuestionsPlan, get_handlers
+from interrogatio.core.utils import validate_questions
+
+__all__ = ["evaluate"]
+
+
+def _get_raw_value(handler, answers, context):
+    name = handler.get_variable_name()
+    if name in answers:
+        return answers[name]
+    default = handler.get_default(context)
+    if default:
+        return default
+    return handler.get_empty_value(context)
+
+
+def process(questions, answers):
+    """
+    Walks an already validated list of questions applying the supplied
+    answers without building any widget or layout.
+
+    :param questions: a list of validated questions or a compiled plan.
+    :type questions: list or QuestionsPlan
+    :param answers: a dictionary with the supplied answers.
+    :type answers: dict
+
+    :return: a tuple with the dictionary of the converted answers and a
+             dictionary of the error messages keyed by question name.
+    :rtype: tuple
+    """
+    result = {}
+    errors = {}
+    for handler in get_handlers(questions):
+        if handler.is_disabled(context=result):
+            continue
+        try:
+            value = handler.clean_value(
+                _get_raw_value(handler, answers, result),
+                context=result,
+            )
+        except ValidationError as ve:
+            errors[handler.get_variable_name()] = [str(ve)]
+            continue
+        if not handler.validate_value(value, context=result):
+            errors[handler.get_variable_name()] = handler.errors
+            continue
+        result[handler.get_variable_name()] = handler.value_to_python(value)
+    return result, errors
+
+
+def evaluate(questions, answers):
+    """
+    Evaluates the questions against the supplied answers without a terminal
+    and returns a dictionary with the answers as :func:`interrogatio` would.
+
+    Missing answers are replaced with the question default.
+
+    :param questions: a list of questions or a compiled plan.
+    :type questions: list or QuestionsPlan
+    :param answers: a dictionary with the supplied answers.
+    :type answers: dict
+
+    :return: a dictionary with the answers.
+    :rtype: dict
+
+    :raise InvalidQuestionError: if there is an error in the question
+                                 definition.
+    :raise InvalidAnswersError: if any of the supplied answers is invalid.
+
+    Usage:
+
+    .. code-block:: python
+
+        from interrogatio import evaluate
+        questions = [
+            {
+                'name': 'name',
+                'type': 'input',
+                'message': 'What is your name',
+                'validators': [{'name': 'required'}],
+            },
+        ]
+        answers = evaluate(questions, {'name': 'John'})
+    """
+    if not isinstance(questions, QuestionsPlan):
+        validate_questions(questions)
+    result, errors = process(questions, answers)
+    if errors:
+        raise InvalidAnswersError(errors)
+    return result
@@ -0,0 +1,189 @@
+from types import MappingProxyType
+
+from interrogatio.core.exceptions import InvalidQuestionError
+from interrogatio.core.expressions import Expression
+from interrogatio.core.utils import validate_questions
+from interrogatio.handlers import registry
+
+__all__ = ["QuestionsPlan", "compile_questions", "get_handlers"]
+
+
+DYNAMIC_ATTRIBUTES = ("disabled", "values", "default")
+
+
+class QuestionsPlan:
+    """
+    An immutable set of validated questions.
+
+    The questions are frozen copies of the original ones with the validators
+    already instantiated and the label filled in, so the same plan can be
+    shared across sessions and threads.
+
+    Use :func:`compile_questions` to create it.
+    """
+
+    def __init__(self, questions, handler_classes, dependencies):
+        self._questions = tuple(questions)
+        self._handler_classes = tuple(handler_classes)
+        self._names = tuple(q["name"] for q in self._questions)
+        self._memos = tuple({} for _ in self._questions)
+        self._dependencies = MappingProxyType(dependencies)
+        dependents = {name: set() for name in self._names}
+        for name, depends_on in dependencies.items():
+            for dependency in depends_on:
+                dependents[dependency].add(name)
+        self._dependents = MappingProxyType(
+            {name: frozenset(names) for name, names in dependents.items()},
+        )
+
+    def __iter__(self):
+        return iter(self._questions)
+
+    def __len__(self):
+        return len(self._questions)
+
+    def __getitem__(self, idx):
+        return self._questions[idx]
+
+    def __reduce__(self):
+        return _restore_plan, (
+            [dict(q) for q in self._questions],
+            self._handler_classes,
+            dict(self._dependencies),
+        )
+
+    @property
+    def names(self):
+        """
+        The names of the questions in order.
+
+        :rtype: tuple
+        """
+        return self._names
+
+    @property
+    def dependencies(self):
+        """
+        A read-only mapping from the name of each question to the names of
+        the questions its ``disabled``, ``values`` and ``default``
+        attributes depend on.
+
+        If a question doesn't declare them with ``depends_on`` and has any
+        callable attribute, it depends on all the questions that precede it.
+
+        :rtype: mapping
+        """
+        return self._dependencies
+
+    @property
+    def dependents(self):
+        """
+        A read-only mapping from the name of each question to the names of
+        the questions that directly depend on it.
+
+        :rtype: mapping
+        """
+        return self._dependents
+
+    def get_label(self, name):
+        return self._questions[self._names.index(name)]["label"]
+
+    def create_handlers(self):
+        """
+        Returns a new list of handlers, one for each question. The values
+        the handlers compute from their question alone, like the set of the
+        values of static choices, are shared by all the handlers created by
+        the plan.
+
+        :rtype: list
+        """
+        handlers = []
+        for clazz, question, memo in zip(
+            self._handler_classes,
+            self._questions,
+            self._memos,
+        ):
+            handler = clazz(question)
+            handler._memo = memo
+            handlers.append(handler)
+        return handlers
+
+
+def _restore_plan(questions, handler_classes, dependencies):
+    return QuestionsPlan(
+        [MappingProxyType(q) for q in questions],
+        handler_classes,
+        dependencies,
+    )
+
+
+def _check_dependencies(question, dependencies, preceding):
+    unknown = [name for name in dependencies if name not in preceding]
+    if unknown:
+        raise InvalidQuestionError(
+            f'Question {question["name"]} depends on unknown or following '
+            f'questions: {", ".join(unknown)}.',
+        )
+
+
+def _get_dependencies(question, preceding):
+    if "depends_on" in question:
+        _check_dependencies(question, question["depends_on"], preceding)
+        return frozenset(question["depends_on"])
+    dependencies = set()
+    for attr in DYNAMIC_ATTRIBUTES:
+        value = question.get(attr)
+        if isinstance(value, Expression):
+            dependencies.update(value.dependencies)
+        elif callable(value):
+            return frozenset(preceding)
+    _check_dependencies(question, sorted(dependencies), preceding)
+    return frozenset(dependencies)
+
+
+def compile_questions(questions):
+    """
+    Validates a list of questions and returns an immutable
+    :class:`QuestionsPlan` that can be passed to :func:`interrogatio`,
+    :func:`dialogus` and :func:`evaluate` in place of the list.
+
+    The list of questions is not modified.
+
+    :param questions: a list of questions.
+    :type questions: list
+
+    :return: the compiled questions.
+    :rtype: QuestionsPlan
+
+    :raise InvalidQuestionError: if there is an error in the question
+                                 definition.
+    """
+    if isinstance(questions, QuestionsPlan):
+        return questions
+    copies = [dict(q) for q in questions]
+    validate_questions(copies)
+    frozen = []
+    handler_classes = []
+    dependencies = {}
+    preceding = []
+    for q in copies:
+        if q["name"] in dependencies:
+            raise InvalidQuestionError(f'Duplicated question name: {q["name"]}.')
+        if "validators" in q:
+            q["validators"] = tuple(q["validators"])
+        q.setdefault("label", q["name"].capitalize())
+        dependencies[q["name"]] = _get_dependencies(q, preceding)
+        handler_classes.append(registry.get_registry()[q["type"]])
+        frozen.append(MappingProxyType(q))
+        preceding.append(q["name"])
+    return QuestionsPlan(frozen, handler_classes, dependencies)
+
+
+def get_handlers(questions):
+    """
+    Returns an iterable of new handlers for a plan or an already validated
+    list of questions.
+    """
+    if isinstance(questions, QuestionsPlan):
+        return questions.create_handlers()
+    return (registry.get_instance(q) for q in questions)
@@ -1,26 +1,238 @@
 from prompt_toolkit.application import Application
+from prompt_toolkit.filters import Condition
 from prompt_toolkit.formatted_text import FormattedText
-from prompt_toolkit.key_binding import merge_key_bindings
+from prompt_toolkit.key_binding import (
+    DynamicKeyBindings,
+    KeyBindings,
+    merge_key_bindings,
+)
 from prompt_toolkit.key_binding.defaults import load_key_bindings
-from prompt_toolkit.layout import HorizontalAlign, Layout
+from prompt_toolkit.keys import Keys
+from prompt_toolkit.layout import (
+    ConditionalContainer,
+    DynamicContainer,
+    HorizontalAlign,
+    HSplit,
+    Layout,
+    Window,
+)
+from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.shortcuts import print_formatted_text
 
+from interrogatio.core.plan import QuestionsPlan, get_handlers
 from interrogatio.core.utils import validate_questions
-from interrogatio.handlers import get_instance
 from interrogatio.themes import for_prompt, set_theme
 
-__all__ = ["interrogatio"]
+__all__ = ["interrogatio", "interrogatio_async"]
 
 
-def interrogatio(questions, theme="default"):
+class SingleAppSession:
+    """
+    Runs a whole set of questions within a single long-lived Application.
+
+    The layout and the key bindings of the current question are swapped in
+    place once the answer is accepted, so the terminal is set up and torn
+    down only once for the whole set of questions.
+    """
+
+    def __init__(self, questions, on_answer=None):
+        self._handlers = iter(get_handlers(questions))
+        self._on_answer = on_answer
+        self._run_async = False
+        self.answers = {}
+        self.handler = None
+        self.container = None
+        self.keybindings = None
+        self.error = ""
+        self.loading = False
+        self._pending_accepts = 0
+
+    def get_container(self):
+        return self.container
+
+    def get_keybindings(self):
+        return self.keybindings
+
+    def get_error(self):
+        return FormattedText([("class:error", self.error)])
+
+    def _show(self, handler):
+        handler.set_context(self.answers)
+        layout = handler.get_layout()
+        layout.align = HorizontalAlign.LEFT
+        self.handler = handler
+        self.container = layout
+        # Built once per question: prompt_toolkit caches the merged key
+        # bindings as long as the same object is returned.
+        self.keybindings = handler.get_keybindings()
+
+    def advance(self):
+        """
+        Moves to the next enabled question.
+
+        :return: False if there are no more questions, True otherwise.
+        :rtype: bool
+        """
+        for handler in self._handlers:
+            if handler.is_disabled(context=self.answers):
+                continue
+            self._show(handler)
+            return True
+        return False
+
+    async def advance_async(self):
+        """
+        Same as :meth:`advance` but awaits the coroutine attributes of the
+        questions.
+        """
+        for handler in self._handlers:
+            await handler.resolve(self.answers, ("disabled",))
+            if handler.is_disabled(context=self.answers):
+                continue
+            await handler.resolve(self.answers)
+            self._show(handler)
+            return True
+        return False
+
+    def _advanced(self, app, advanced):
+        if not advanced:
+            app.exit(result=True)
+            return
+        app.layout.focus(self.container)
+
+    def _start_accept_async(self, app):
+        self.loading = True
+        app.create_background_task(self._accept_async(app))
+
+    async def _accept_async(self, app):
+        try:
+            if not await self.handler.is_valid_async(self.answers):
+                self.error = self.handler.errors[0]
+                self._pending_accepts = 0
+                return
+            self.error = ""
+            _store_answer(self.answers, self.handler, self._on_answer)
+            self._advanced(app, await self.advance_async())
+        finally:
+            self.loading = False
+            if self._pending_accepts and not app.is_done:
+                self._pending_accepts -= 1
+                self._start_accept_async(app)
+            app.invalidate()
+
+    def accept(self, event):
+        if self.loading:
+            # Enter has been pressed again while the answer is validated:
+            # accept the next question once it is shown, unless this answer
+            # turns out to be invalid.
+            self._pending_accepts += 1
+            return
+        if self._run_async:
+            self._start_accept_async(event.app)
+            return
+        if not self.handler.is_valid(self.answers):
+            self.error = self.handler.errors[0]
+            return
+        self.error = ""
+        _store_answer(self.answers, self.handler, self._on_answer)
+        self._advanced(event.app, self.advance())
+
+    def create_application(self):
+        session_bindings = KeyBindings()
+
+        @session_bindings.add(Keys.ControlC)
+        def _ctrl_c(event):
+            event.app.exit(result=False)
+
+        @session_bindings.add(Keys.Enter)
+        def _enter(event):
+            self.accept(event)
+
+        error_window = ConditionalContainer(
+            Window(FormattedTextControl(self.get_error), height=1),
+            filter=Condition(lambda: bool(self.error)),
+        )
+
+        return Application(
+            layout=Layout(
+                HSplit([DynamicContainer(self.get_container), error_window]),
+            ),
+            key_bindings=merge_key_bindings(
+                [
+                    load_key_bindings(),
+                    DynamicKeyBindings(self.get_keybindings),
+                    session_bindings,
+                ],
+            ),
+            style=for_prompt(),
+            mouse_support=False,
+        )
+
+    def run(self):
+        if not self.advance():
+            return self.answers
+        if not self.create_application().run():
+            return
+        return self.answers
+
+    async def run_async(self):
+        self._run_async = True
+        if not await self.advance_async():
+            return self.answers
+        if not await self.create_application().run_async():
+            return
+        return self.answers
+
+
+def _create_application(handler):
+    layout = handler.get_layout()
+    layout.align = HorizontalAlign.LEFT
+
+    bindings = [load_key_bindings()]
+
+    handler_bindings = handler.get_keybindings()
+
+    if handler_bindings:  # pragma: no branch
+        bindings.append(handler_bindings)
+
+    return Application(
+        layout=Layout(layout),
+        key_bindings=merge_key_bindings(bindings),
+        style=for_prompt(),
+        mouse_support=False,
+    )
+
+
+def _store_answer(answers, handler, on_answer):
+    answer = handler.get_answer()
+    answers.update(answer)
+    if on_answer:
+        for name, value in answer.items():
+            on_answer(name, value)
+
+
+def _print_error(handler):
+    print_formatted_text(
+        FormattedText([("class:error", handler.errors[0])]),
+        style=for_prompt(),
+    )
+
+
+def interrogatio(questions, theme="default", single_app=False, on_answer=None):
     """
     Prompts user for inputs as defined in the questions parameter and returns
     a dictionary with the answers.
 
-    :param questions: a list of questions.
-    :type questions: list
+    :param questions: a list of questions or a compiled plan.
+    :type questions: list or QuestionsPlan
     :param theme: the name of the theme to use.
     :type theme: string
+    :param single_app: run all the questions within a single application
+                       instead of starting a new one for each question.
+    :type single_app: bool
+    :param on_answer: a callable invoked with the name and the value of each
+                      answer as soon as it is accepted.
+    :type on_answer: callable
 
     :return: a dictionary with the answers.
     :rtype: dict
@@ -49,40 +261,83 @@ def interrogatio(questions, theme="default"):
         answers = interrogatio(questions, theme='purple')
     """
     set_theme(theme)
+    if not isinstance(questions, QuestionsPlan):
+        validate_questions(questions)
+    if single_app:
+        return SingleAppSession(questions, on_answer=on_answer).run()
     answers = {}
-    validate_questions(questions)
-    for q in questions:
-        handler = get_instance(q)
+    for handler in get_handlers(questions):
         if handler.is_disabled(context=answers):
             continue
         handler.set_context(answers)
-        layout = handler.get_layout()
-        layout.align = HorizontalAlign.LEFT
+        app = _create_application(handler)
 
-        bindings = [load_key_bindings()]
+        while True:
+            result = app.run()
+            if not result:
+                return
+            if handler.is_valid(answers):
+                _store_answer(answers, handler, on_answer)
+                break
+            else:
+                _print_error(handler)
+    return answers
 
-        handler_bindings = handler.get_keybindings()
 
-        if handler_bindings:  # pragma: no branch
-            bindings.append(handler_bindings)
+async def interrogatio_async(
+    questions,
+    theme="default",
+    single_app=False,
+    on_answer=None,
+):
+    """
+    Coroutine version of :func:`interrogatio` to be used within a running
+    asyncio event loop.
 
-        app = Application(
-            layout=Layout(layout),
-            key_bindings=merge_key_bindings(bindings),
-            style=for_prompt(),
-            mouse_support=False,
-        )
+    The ``values``, ``default`` and ``disabled`` attributes of the questions
+    can also be coroutine functions: they are awaited before the question
+    is shown, so other tasks keep running meanwhile.
+
+    Usage:
+
+    .. code-block:: python
+
+        from interrogatio import interrogatio_async
+
+        async def get_pets(answers):
+            return await fetch_pets()
+
+        questions = [
+            {
+                'name': 'favorite_pet',
+                'type': 'selectone',
+                'message': 'What is your favorite pet',
+                'values': get_pets,
+            }
+        ]
+        answers = await interrogatio_async(questions)
+    """
+    set_theme(theme)
+    if not isinstance(questions, QuestionsPlan):
+        validate_questions(questions)
+    if single_app:
+        return await SingleAppSession(questions, on_answer=on_answer).run_async()
+    answers = {}
+    for handler in get_handlers(questions):
+        await handler.resolve(answers, ("disabled",))
+        if handler.is_disabled(context=answers):
+            continue
+        await handler.resolve(answers)
+        handler.set_context(answers)
+        app = _create_application(handler)
 
         while True:
-            result = app.run()
+            result = await app.run_async()
             if not result:
                 return
-            if handler.is_valid(answers):
-                answers.update(handler.get_answer())
+            if await handler.is_valid_async(answers):
+                _store_answer(answers, handler, on_answer)
                 break
             else:
-                print_formatted_text(
-                    FormattedText([("class:error", handler.errors[0])]),
-                    style=for_prompt(),
-                )
+                _print_error(handler)
     return answers
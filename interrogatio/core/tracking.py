@@ -0,0 +1,75 @@
+__all__ = ["TrackingDict"]
+
+
+class TrackingDict(dict):
+    """
+    A copy of the answers that records which of them are read, so that the
+    result of a callable question attribute can be reused until one of the
+    answers it depends on changes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._accessed = set()
+        self._accessed_all = False
+
+    @property
+    def accessed_keys(self):
+        """
+        The keys that have been read, or None if the whole dictionary has
+        been read (i.e. iterating over it).
+
+        :rtype: frozenset
+        """
+        if self._accessed_all:
+            return None
+        return frozenset(self._accessed)
+
+    def _access_all(self):
+        self._accessed_all = True
+
+    def __getitem__(self, key):
+        self._accessed.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self._accessed.add(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self._accessed.add(key)
+        return super().get(key, default)
+
+    def __iter__(self):
+        self._access_all()
+        return super().__iter__()
+
+    def __len__(self):
+        self._access_all()
+        return super().__len__()
+
+    def __eq__(self, other):
+        self._access_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        self._access_all()
+        return super().__ne__(other)
+
+    __hash__ = None
+
+    def keys(self):
+        self._access_all()
+        return super().keys()
+
+    def values(self):
+        self._access_all()
+        return super().values()
+
+    def items(self):
+        self._access_all()
+        return super().items()
+
+    def copy(self):
+        self._access_all()
+        return super().copy()
@@ -1,5 +1,6 @@
 from interrogatio import handlers, validators
 from interrogatio.core.exceptions import InvalidQuestionError
+from interrogatio.core.expressions import compile_expression
 
 
 def _validate_validator_object(obj):
@@ -14,6 +15,21 @@ def _validate_validator_object(obj):
     if "args" in obj and not isinstance(obj["args"], dict):
         raise InvalidQuestionError("Validator arguments must be a dictionary.")
 
+    if "timeout" in obj and not isinstance(obj["timeout"], (int, float)):
+        raise InvalidQuestionError("Validator timeout must be a number.")
+
+
+def _compile_expressions(q):
+    if isinstance(q.get("disabled"), str):
+        q["disabled"] = compile_expression(q["disabled"])
+    if isinstance(q.get("values"), str):
+        q["values"] = compile_expression(q["values"])
+    default = q.get("default")
+    if isinstance(default, dict) and list(default) == ["expr"]:
+        if not isinstance(default["expr"], str):
+            raise InvalidQuestionError("Default expression must be a string.")
+        q["default"] = compile_expression(default["expr"])
+
 
 def _validate_question(q):  # noqa: CCR001
     if "name" not in q:
@@ -28,6 +44,8 @@ def _validate_question(q):  # noqa: CCR001
             f"Unsupported question type: {q_type}.",
         )
 
+    _compile_expressions(q)
+
     if q_type in ("selectone", "selectmany"):
         if "values" not in q:
             raise InvalidQuestionError(
@@ -72,6 +90,15 @@ def _validate_question(q):  # noqa: CCR001
                 validator_instances.append(v)
         q["validators"] = validator_instances
 
+    if "depends_on" in q and not (
+        isinstance(q["depends_on"], (list, tuple))
+        and all(isinstance(name, str) for name in q["depends_on"])
+    ):
+        raise InvalidQuestionError("Depends on must be a list of question names.")
+
+    if "fail_fast" in q and not isinstance(q["fail_fast"], bool):
+        raise InvalidQuestionError("Fail fast flag must be a boolean.")
+
     if "disabled" in q:
         if not (isinstance(q["disabled"], bool) or callable(q["disabled"])):
             raise InvalidQuestionError(
@@ -1,10 +1,11 @@
+import asyncio
+import inspect
 from abc import ABCMeta, abstractmethod
 
-from prompt_toolkit.application.current import get_app
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.keys import Keys
-
+from interrogatio.core.aio import maybe_await, run_sync
 from interrogatio.core.exceptions import ValidationError
+from interrogatio.core.expressions import Expression
+from interrogatio.core.tracking import TrackingDict
 
 __all__ = [
     "QHandler",
@@ -17,10 +18,22 @@ class QHandler(metaclass=ABCMeta):
     Each question handler must subclass this class.
     """
 
+    RESOLVABLE_ATTRIBUTES = ("disabled", "values", "default")
+    RESOLVED_CONTEXTS = 2
+    # Answers of sensitive questions are never written to checkpoints.
+    SENSITIVE = False
+
     def __init__(self, question):
         self._question = question
         self._widget = None
         self._errors = []
+        self._resolved = []
+        self._dependencies = {}
+        self._released = None
+        self._pipeline = None
+        # Values computed from the question alone, shared by the handlers
+        # created from the same plan.
+        self._memo = {}
 
     @property
     def errors(self):
@@ -51,23 +64,97 @@ class QHandler(metaclass=ABCMeta):
     def get_question(self):
         return self._question
 
-    @abstractmethod
     def get_value(self):
         """
         Returns the ``value`` part of the answer.
 
+        Once the widget has been released, the value it had is returned
+        without building it again, otherwise it is read from the widget
+        with :meth:`get_widget_value`.
+
+        :return: the ``value`` part of the answer.
+        :rtype: str
+        """
+        if self._released is not None:
+            return self._released[0]
+        return self.get_widget_value()
+
+    def get_widget_value(self):
+        """
+        Returns the ``value`` part of the answer read from the widget.
+
         Subclasses must implement this method.
 
         :return: the ``value`` part of the answer.
         :rtype: str
         """
         raise NotImplementedError(
-            "Subclass must implements `get_value` method.",
+            "Subclass must implements `get_widget_value` method.",
         )
 
+    def set_value(self, value):
+        """
+        Sets the ``value`` part of the answer on the widget, i.e. to restore
+        an answer previously returned by :meth:`get_value`.
+
+        :param value: the ``value`` part of the answer.
+        """
+        self.get_widget().value = value
+
     def get_formatted_value(self):
+        """
+        Returns the ``value`` part of the answer formatted to be shown to
+        the user, i.e. in the wizard summary.
+
+        Once the widget has been released, the formatted value it had is
+        returned, otherwise it is computed by
+        :meth:`get_widget_formatted_value`.
+        """
+        if self._released is not None:
+            return self._released[1]
+        return self.get_widget_formatted_value()
+
+    def get_widget_formatted_value(self):
+        """
+        Returns the ``value`` part of the answer formatted to be shown to
+        the user, reading it from the widget if needed.
+
+        By default it is the value itself.
+        """
         return self.get_value()
 
+    def get_default(self, context=None):
+        """
+        Returns the default value of the question, evaluating it against
+        the context if it is a callable.
+
+        :return: the default value or None if not specified.
+        """
+        return self.evaluate_attribute("default", context=context)
+
+    def get_empty_value(self, context=None):
+        """
+        Returns the ``value`` part of the answer when the user
+        does not provide any input.
+
+        :return: the empty value for this QHandler.
+        """
+        return None
+
+    def clean_value(self, value, context=None):
+        """
+        Checks and normalizes a value that has been supplied without
+        going through the widget (i.e. headless mode).
+
+        :param value: the value to clean.
+
+        :raises:
+            ValidationError: if the value cannot be accepted by this QHandler.
+
+        :return: the value as it would be returned by ``get_value``.
+        """
+        return value
+
     @abstractmethod
     def get_widget_init_kwargs(self):
         """
@@ -114,13 +201,37 @@ class QHandler(metaclass=ABCMeta):
         if not self._widget:
             clazz = self.get_widget_class()
             self._widget = clazz(**self.get_widget_init_kwargs())
+            if self._released is not None:
+                value, _, context = self._released
+                self._released = None
+                self.set_context(context)
+                self.set_value(value)
         return self._widget
 
+    def release_widget(self, context=None):
+        """
+        Drops the widget instance, keeping the ``value`` part of the answer
+        and its formatted version, which are returned by :meth:`get_value`
+        and :meth:`get_formatted_value` until the widget is needed again.
+        The widget is then created again with the same value.
+
+        :param context: the answers the widget has been set up with by
+                        :meth:`set_context`.
+        :type context: dict
+        """
+        if self._widget:
+            self._released = (self.get_value(), self.get_formatted_value(), context)
+            self._widget = None
+
     def get_keybindings(self):
         """
         Returns a KeyBindings object to add custom keybindings to this
         QHandler.
         """
+        from prompt_toolkit.application.current import get_app
+        from prompt_toolkit.key_binding import KeyBindings
+        from prompt_toolkit.keys import Keys
+
         bindings = KeyBindings()
 
         @bindings.add(Keys.ControlC)
@@ -133,8 +244,31 @@ class QHandler(metaclass=ABCMeta):
 
         return bindings
 
+    def value_to_python(self, value):
+        """
+        Converts the ``value`` part of the answer to a python object.
+
+        :param value: the value to convert.
+
+        :return: the converted value.
+        """
+        return value
+
+    def values_to_python(self, values):
+        """
+        Converts the ``value`` part of many answers to python objects, as
+        :meth:`value_to_python` does for each of them.
+
+        :param values: the values to convert.
+        :type values: iterable
+
+        :return: the converted values, in the same order.
+        :rtype: list
+        """
+        return [self.value_to_python(value) for value in values]
+
     def to_python(self):
-        return self.get_value()
+        return self.value_to_python(self.get_value())
 
     def get_answer(self):
         """
@@ -163,11 +297,106 @@ class QHandler(metaclass=ABCMeta):
         If disabled flag specified, it is evaluated if needed and returned.
         By default, all questions are enabled.
         """
-        disabled = self._question.get("disabled", False)
-        if callable(disabled):
-            return disabled(context)
-        else:
-            return disabled
+        return self.evaluate_attribute("disabled", context=context, default=False)
+
+    def get_dependencies(self, name):
+        """
+        Returns the names of the answers that the given attribute of the
+        question has read so far, or that it reads if it is an expression.
+
+        :param name: the name of the attribute.
+        :type name: str
+
+        :return: an empty set if the attribute is not a callable, None if
+                 it has not been evaluated yet or it has read all the
+                 answers.
+        :rtype: frozenset
+        """
+        value = self._question.get(name)
+        if isinstance(value, Expression):
+            return value.dependencies
+        if not callable(value):
+            return frozenset()
+        return self._dependencies.get(name)
+
+    def _track(self, context):
+        if isinstance(context, dict):
+            return TrackingDict(context)
+        return context
+
+    def _add_dependencies(self, name, context):
+        keys = (
+            context.accessed_keys if isinstance(context, TrackingDict) else frozenset()
+        )
+        if name in self._dependencies:
+            current = self._dependencies[name]
+            keys = None if current is None or keys is None else current | keys
+        self._dependencies[name] = keys
+
+    def _get_resolved(self, context):
+        context = context or {}
+        for resolved_context, values in self._resolved:
+            if resolved_context == context:
+                return values
+
+    def evaluate_attribute(self, name, context=None, default=None):
+        """
+        Returns the value of the given attribute of the question.
+        If it is a callable, it is called with the context and, if it
+        returns an awaitable, the awaitable is run to completion.
+
+        Values resolved by :meth:`resolve` for an equal context are reused.
+        The answers read by the callable are recorded, see
+        :meth:`get_dependencies`.
+        """
+        value = self._question.get(name, default)
+        if not callable(value):
+            return value
+        if isinstance(value, Expression):
+            return value(context)
+        resolved = self._get_resolved(context)
+        if resolved is not None and name in resolved:
+            return resolved[name]
+        tracked = self._track(context)
+        result = run_sync(value(tracked))
+        self._add_dependencies(name, tracked)
+        return result
+
+    async def resolve(self, context=None, attributes=None):
+        """
+        Evaluates the callable attributes of the question against the
+        context, awaiting coroutines concurrently, so that the following
+        calls made with an equal context don't block the event loop.
+
+        :param context: the answers collected so far.
+        :type context: dict
+        :param attributes: the names of the attributes to resolve, by
+                           default ``disabled``, ``values`` and ``default``.
+        :type attributes: tuple
+        """
+        names = [
+            name
+            for name in attributes or self.RESOLVABLE_ATTRIBUTES
+            if callable(self._question.get(name))
+        ]
+        resolved = self._get_resolved(context)
+        if resolved is None:
+            resolved = {}
+            self._resolved.insert(0, (dict(context or {}), resolved))
+            del self._resolved[self.RESOLVED_CONTEXTS :]
+        names = [name for name in names if name not in resolved]
+        if not names:
+            return
+        contexts = [self._track(context) for _ in names]
+        results = await asyncio.gather(
+            *(
+                maybe_await(self._question[name](tracked))
+                for name, tracked in zip(names, contexts)
+            ),
+        )
+        for name, tracked in zip(names, contexts):
+            self._add_dependencies(name, tracked)
+        resolved.update(zip(names, results))
 
     def is_valid(self, context=None):
         """
@@ -176,11 +405,126 @@ class QHandler(metaclass=ABCMeta):
         If the answer isn't valid, it also set the errors property to a list
         of error messages.
         """
-        validators = self._question.get("validators", [])
+        if not self._question.get("validators"):
+            self._errors = []
+            return True
+        return self.validate_value(self.get_value(), context=context)
+
+    async def is_valid_async(self, context=None):
+        """
+        Same as :meth:`is_valid` but awaits the asynchronous validators
+        within the running event loop.
+        """
+        if not self._question.get("validators"):
+            self._errors = []
+            return True
+        return await self.validate_value_async(self.get_value(), context=context)
+
+    def _get_validators(self, value):
+        """
+        Returns the validators to apply to the value, compiling them the
+        first time: validators that skip empty values are left out if the
+        value is empty and, with the ``fail_fast`` flag, the cheapest ones
+        come first.
+        """
+        if self._pipeline is None:
+            validators = list(self._question.get("validators", []))
+            if self._question.get("fail_fast", False):
+                validators.sort(key=_get_cost)
+            self._pipeline = (
+                validators,
+                [
+                    validator
+                    for validator in validators
+                    if not getattr(validator, "skip_empty", False)
+                ],
+            )
+        validators, empty_validators = self._pipeline
+        return empty_validators if value is None or value == "" else validators
+
+    def validate_value(self, value, context=None):
+        """
+        Apply any specified validator to the given value and return True if
+        it is valid otherwise False.
+        If the value isn't valid, it also set the errors property to a list
+        of error messages.
+
+        If the question has the ``fail_fast`` flag set, validation stops at
+        the first error, running the validators from the cheapest one.
+        """
+        validators = self._get_validators(value)
+        if any(_is_async(validator) for validator in validators):
+            return run_sync(self.validate_value_async(value, context=context))
+        fail_fast = self._question.get("fail_fast", False)
         self._errors = []
         for validator in validators:
             try:
-                validator.validate(self.get_value(), context=context)
+                validator.validate(value, context=context)
             except ValidationError as ve:
                 self._errors.append(str(ve))
+                if fail_fast:
+                    break
         return not self._errors
+
+    async def validate_value_async(self, value, context=None):
+        """
+        Same as :meth:`validate_value` but runs the asynchronous validators
+        concurrently.
+
+        If the question has the ``fail_fast`` flag set, the asynchronous
+        validators are started only if the synchronous ones pass, and the
+        pending ones are cancelled as soon as one of them fails.
+        """
+        validators = self._get_validators(value)
+        self._errors = []
+        if not self._question.get("fail_fast", False):
+            tasks = [
+                asyncio.ensure_future(_run_validator(validator, value, context))
+                for validator in validators
+            ]
+            self._errors = [error for error in await asyncio.gather(*tasks) if error]
+            return not self._errors
+        for validator in validators:
+            if not _is_async(validator):
+                error = await _run_validator(validator, value, context)
+                if error:
+                    self._errors = [error]
+                    return False
+        tasks = [
+            asyncio.ensure_future(_run_validator(validator, value, context))
+            for validator in validators
+            if _is_async(validator)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                error = await task
+                if error:
+                    self._errors = [error]
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+        return not self._errors
+
+
+def _get_cost(validator):
+    return getattr(validator, "cost", 1)
+
+
+def _is_async(validator):
+    return inspect.iscoroutinefunction(validator.validate) or getattr(
+        validator,
+        "timeout",
+        None,
+    )
+
+
+async def _run_validator(validator, value, context):
+    try:
+        result = validator.validate(value, context=context)
+        if inspect.isawaitable(result):
+            await asyncio.wait_for(result, getattr(validator, "timeout", None))
+    except ValidationError as ve:
+        return str(ve)
+    except asyncio.TimeoutError:
+        return validator.timeout_message
@@ -1,26 +1,138 @@
 # pylint: disable=unused-argument
 import string
+from contextlib import suppress
 from datetime import date, datetime
+from functools import lru_cache
 
-import pytz
-from prompt_toolkit.application.current import get_app
-from prompt_toolkit.formatted_text import FormattedText
-from prompt_toolkit.keys import Keys
-from prompt_toolkit.layout import HSplit, VSplit
-from prompt_toolkit.layout.containers import Window
-from prompt_toolkit.layout.controls import FormattedTextControl
-from prompt_toolkit.layout.dimension import Dimension as D
-from prompt_toolkit.widgets import Box, Button, Label, TextArea
-from tzlocal import get_localzone_name
-
+from interrogatio.core.exceptions import ValidationError
 from interrogatio.handlers.base import QHandler
 from interrogatio.handlers.registry import register
-from interrogatio.widgets import DateRange, MaskedInput, SelectMany, SelectOne
+
+
+def _get_choices(handler, context=None):
+    return handler.evaluate_attribute("values", context=context) or []
+
+
+def _get_choice_values(handler, choices):
+    # The values of the choices are collected in a set once for each list of
+    # choices, so that answers are checked without scanning the choices.
+    cached = handler._memo.get("choice_values")
+    if cached is None or cached[0] is not choices:
+        try:
+            values = {choice[0] for choice in choices}
+        except TypeError:
+            values = [choice[0] for choice in choices]
+        cached = handler._memo["choice_values"] = (choices, values)
+    return cached[1]
+
+
+def _is_choice(value, values):
+    try:
+        return value in values
+    except TypeError:
+        return False
+
+
+def _get_layout(question, widget, style, dont_extend_height=True, top=None):
+    # prompt_toolkit is imported here so that evaluating answers in headless
+    # mode does not pay its import time.
+    from prompt_toolkit.formatted_text import FormattedText
+    from prompt_toolkit.layout import HSplit, VSplit
+    from prompt_toolkit.layout.containers import Window
+    from prompt_toolkit.layout.controls import FormattedTextControl
+    from prompt_toolkit.layout.dimension import Dimension as D
+    from prompt_toolkit.widgets import Label
+
+    vsplit_components = [widget]
+    if "message" in question and question["message"]:
+        vsplit_components.insert(
+            0,
+            Label(
+                question["message"],
+                dont_extend_width=True,
+                dont_extend_height=dont_extend_height,
+                style=f"class:{style}.question",
+            ),
+        )
+    hsplit_components = [VSplit(vsplit_components, padding=1)]
+    if top:
+        hsplit_components.insert(0, top)
+    if "description" in question and question["description"]:
+        hsplit_components.insert(
+            0,
+            Window(
+                FormattedTextControl(
+                    FormattedText(
+                        [
+                            (
+                                f"class:{style}.question",
+                                question["description"],
+                            )
+                        ]
+                    ),
+                ),
+                wrap_lines=True,
+                height=D(min=1, max=5, preferred=3),
+            ),
+        )
+    return HSplit(hsplit_components, padding=1)
+
+
+def _clean_date(value):
+    if not value:
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        raise ValidationError("this field is not a valid date")
+    return value
+
+
+@lru_cache(maxsize=None)
+def _get_timezone(name=None):
+    """
+    Returns the time zone with the given name, or the local one, resolving
+    it only once per process. pytz is used if it is installed, otherwise
+    the standard zoneinfo module.
+    """
+    if name is None:
+        from tzlocal import get_localzone_name
+
+        name = get_localzone_name()
+    try:
+        import pytz
+    except ImportError:
+        try:
+            from zoneinfo import ZoneInfo
+        except ImportError:  # pragma: no cover
+            from backports.zoneinfo import ZoneInfo
+
+        return ZoneInfo(name)
+    return pytz.timezone(name)
+
+
+@lru_cache(maxsize=4096)
+def _date_to_python(value, timezone=None):
+    naive = None
+    if len(value) == 10 and value[4] == value[7] == "-":
+        with suppress(ValueError):
+            naive = datetime.fromisoformat(value)
+    if naive is None:
+        year, month, day = value.split("-")
+        naive = datetime(int(year), int(month), int(day))
+    tz = _get_timezone(timezone)
+    if hasattr(tz, "localize"):
+        return tz.localize(naive)
+    return naive.replace(tzinfo=tz)
 
 
 @register("input")
 class StringHandler(QHandler):
     def get_widget_class(self):
+        from prompt_toolkit.widgets import TextArea
+
         return TextArea
 
     def get_widget_init_kwargs(self):
@@ -35,52 +147,39 @@ class StringHandler(QHandler):
 
     def set_context(self, context):
         widget = self.get_widget()
-        default = self.get_question().get("default")
-        if default and callable(default):
-            widget.text = default(context)
+        if callable(self.get_question().get("default")):
+            widget.text = self.get_default(context)
             widget.buffer.cursor_position = len(widget.text)
 
     def get_layout(self):
         widget = self.get_widget()
-        vsplit_components = [widget]
         widget.buffer.cursor_position = len(widget.text)
-        if "message" in self._question and self._question["message"]:
-            vsplit_components.insert(
-                0,
-                Label(
-                    self._question["message"],
-                    dont_extend_width=True,
-                    style="class:input.question",
-                ),
-            )
-        hsplit_components = [VSplit(vsplit_components, padding=1)]
-        if "description" in self._question and self._question["description"]:
-            hsplit_components.insert(
-                0,
-                Window(
-                    FormattedTextControl(
-                        FormattedText(
-                            [
-                                (
-                                    "class:input.question",
-                                    self._question["description"],
-                                )
-                            ]
-                        ),
-                    ),
-                    wrap_lines=True,
-                    height=D(min=1, max=5, preferred=3),
-                ),
-            )
-        return HSplit(hsplit_components, padding=1)
+        return _get_layout(self._question, widget, "input")
 
-    def get_value(self):
+    def get_widget_value(self):
         return self.get_widget().text
 
+    def set_value(self, value):
+        widget = self.get_widget()
+        widget.text = value or ""
+        widget.buffer.cursor_position = len(widget.text)
+
+    def get_empty_value(self, context=None):
+        return ""
+
+    def clean_value(self, value, context=None):
+        if value is None:
+            return ""
+        return str(value)
+
 
 @register("password")
 class PasswordHandler(QHandler):
+    SENSITIVE = True
+
     def get_widget_class(self):
+        from prompt_toolkit.widgets import TextArea
+
         return TextArea
 
     def get_widget_init_kwargs(self):
@@ -96,57 +195,54 @@ class PasswordHandler(QHandler):
 
     def set_context(self, context):
         widget = self.get_widget()
-        default = self.get_question().get("default")
-        if default and callable(default):
-            widget.text = default(context)
+        if callable(self.get_question().get("default")):
+            widget.text = self.get_default(context)
             widget.buffer.cursor_position = len(widget.text)
 
-    def get_value(self):
+    def get_widget_value(self):
         return self.get_widget().text
 
+    def set_value(self, value):
+        widget = self.get_widget()
+        widget.text = value or ""
+        widget.buffer.cursor_position = len(widget.text)
+
+    def get_empty_value(self, context=None):
+        return ""
+
+    def clean_value(self, value, context=None):
+        if value is None:
+            return ""
+        return str(value)
+
     def get_layout(self):
         widget = self.get_widget()
         widget.buffer.cursor_position = len(widget.text)
-        vsplit_components = [widget]
-        if "message" in self._question and self._question["message"]:
-            vsplit_components.insert(
-                0,
-                Label(
-                    self._question["message"],
-                    dont_extend_width=True,
-                    style="class:password.question",
-                ),
-            )
-        hsplit_components = [VSplit(vsplit_components, padding=1)]
-        if "description" in self._question and self._question["description"]:
-            hsplit_components.insert(
-                0,
-                Window(
-                    FormattedTextControl(
-                        FormattedText(
-                            [
-                                (
-                                    "class:password.question",
-                                    self._question["description"],
-                                )
-                            ]
-                        ),
-                    ),
-                    wrap_lines=True,
-                    height=D(min=1, max=5, preferred=3),
-                ),
-            )
-        return HSplit(hsplit_components, padding=1)
+        return _get_layout(self._question, widget, "password")
 
 
 @register("selectone")
 class SelectOneHandler(QHandler):
     def get_widget_class(self):
+        from interrogatio.widgets import SelectOne
+
         return SelectOne
 
-    def get_value(self):
+    def get_widget_value(self):
         return self.get_widget().current_value
 
+    def get_empty_value(self, context=None):
+        choices = _get_choices(self, context)
+        return choices[0][0] if choices else None
+
+    def clean_value(self, value, context=None):
+        choices = _get_choices(self, context)
+        if value is None and not choices:
+            return None
+        if not _is_choice(value, _get_choice_values(self, choices)):
+            raise ValidationError("this field is not a valid choice")
+        return value
+
     def get_widget_init_kwargs(self):
         values = self.get_question()["values"]
         kwargs = {
@@ -161,57 +257,29 @@ class SelectOneHandler(QHandler):
 
     def set_context(self, context):
         widget = self.get_widget()
-        values = self.get_question()["values"]
-        if callable(values):
-            values = values(context)
+        if callable(self.get_question()["values"]):
+            values = self.evaluate_attribute("values", context=context)
             widget.values = values or []
             widget.current_value = values[0][0] if values else None
-        default = self.get_question().get("default")
-        if default and callable(default):
-            widget.value = default(context)
+        if callable(self.get_question().get("default")):
+            widget.value = self.get_default(context)
 
     def get_layout(self):
-        vsplit_components = [self.get_widget()]
-        if "message" in self._question and self._question["message"]:
-            vsplit_components.insert(
-                0,
-                Label(
-                    self._question["message"],
-                    dont_extend_width=True,
-                    dont_extend_height=False,
-                    style="class:selectone.question",
-                ),
-            )
-        hsplit_components = [VSplit(vsplit_components, padding=1)]
-        if "description" in self._question and self._question["description"]:
-            hsplit_components.insert(
-                0,
-                Window(
-                    FormattedTextControl(
-                        FormattedText(
-                            [
-                                (
-                                    "class:selectone.question",
-                                    self._question["description"],
-                                )
-                            ]
-                        ),
-                    ),
-                    wrap_lines=True,
-                    height=D(min=1, max=5, preferred=3),
-                ),
-            )
-        return HSplit(hsplit_components, padding=1)
+        return _get_layout(
+            self._question,
+            self.get_widget(),
+            "selectone",
+            dont_extend_height=False,
+        )
 
-    def get_formatted_value(self):
+    def get_widget_formatted_value(self):
         format = self._question.get(
             "formatting_template",
             "${label} (${value})",
         )
         value = self.get_value()
-        options = {t[0]: t[1] for t in self._question["values"]}
         return string.Template(format).safe_substitute(
-            label=options[value],
+            label=self.get_widget().get_label(value),
             value=value,
         )
 
@@ -219,11 +287,26 @@ class SelectOneHandler(QHandler):
 @register("selectmany")
 class SelectManyHandler(QHandler):
     def get_widget_class(self):
+        from interrogatio.widgets import SelectMany
+
         return SelectMany
 
-    def get_value(self):
+    def get_widget_value(self):
         return self.get_widget().value
 
+    def get_empty_value(self, context=None):
+        return []
+
+    def clean_value(self, value, context=None):
+        if not value:
+            return []
+        if not isinstance(value, (list, tuple, set)):
+            raise ValidationError("this field must be a list of choices")
+        choices = _get_choice_values(self, _get_choices(self, context))
+        if not all(_is_choice(v, choices) for v in value):
+            raise ValidationError("this field contains an invalid choice")
+        return list(value)
+
     def get_widget_init_kwargs(self):
         values = self.get_question()["values"]
         kwargs = {
@@ -238,28 +321,18 @@ class SelectManyHandler(QHandler):
 
     def set_context(self, context):
         widget = self.get_widget()
-        values = self.get_question()["values"]
-        if callable(values):
-            values = values(context)
+        if callable(self.get_question()["values"]):
+            values = self.evaluate_attribute("values", context=context)
             widget.values = values or []
-        default = self.get_question().get("default")
-        if default and callable(default):
-            widget.value = default(context)
+        if callable(self.get_question().get("default")):
+            widget.value = self.get_default(context)
 
     def get_layout(self):
-        widget = self.get_widget()
-        vsplit_components = [widget]
-        if "message" in self._question and self._question["message"]:
-            vsplit_components.insert(
-                0,
-                Label(
-                    self._question["message"],
-                    dont_extend_width=True,
-                    dont_extend_height=False,
-                    style="class:selectone.question",
-                ),
-            )
+        from prompt_toolkit.layout import VSplit
+        from prompt_toolkit.layout.dimension import Dimension as D
+        from prompt_toolkit.widgets import Box, Button
 
+        widget = self.get_widget()
         btn_all = Button("All", widget.select_all)
         btn_none = Button("None", widget.select_none)
         buttons = Box(
@@ -267,29 +340,18 @@ class SelectManyHandler(QHandler):
             height=D(min=1, max=3, preferred=3),
             padding_left=0,
         )
-
-        hsplit_components = [buttons, VSplit(vsplit_components, padding=1)]
-        if "description" in self._question and self._question["description"]:
-            hsplit_components.insert(
-                0,
-                Window(
-                    FormattedTextControl(
-                        FormattedText(
-                            [
-                                (
-                                    "class:selectone.question",
-                                    self._question["description"],
-                                )
-                            ]
-                        ),
-                    ),
-                    wrap_lines=True,
-                    height=D(min=1, max=5, preferred=3),
-                ),
-            )
-        return HSplit(hsplit_components, padding=1)
+        return _get_layout(
+            self._question,
+            widget,
+            "selectone",
+            dont_extend_height=False,
+            top=buttons,
+        )
 
     def get_keybindings(self):
+        from prompt_toolkit.application.current import get_app
+        from prompt_toolkit.keys import Keys
+
         bindings = super().get_keybindings()
 
         @bindings.add(Keys.Tab)
@@ -302,7 +364,7 @@ class SelectManyHandler(QHandler):
 
         return bindings
 
-    def get_formatted_value(self):
+    def get_widget_formatted_value(self):
         format = self._question.get(
             "formatting_template",
             "${label} (${value})",
@@ -311,11 +373,7 @@ class SelectManyHandler(QHandler):
         if not values:
             return ""
 
-        if callable(self._question["values"]):
-            options = {t[0]: t[1] for t in self.get_widget().values}
-        else:
-            options = {t[0]: t[1] for t in self._question["values"]}
-
+        widget = self.get_widget()
         formatted_values = []
 
         for idx, value in enumerate(values):
@@ -324,7 +382,7 @@ class SelectManyHandler(QHandler):
                 break
             formatted_values.append(
                 string.Template(format).safe_substitute(
-                    label=options[value],
+                    label=widget.get_label(value),
                     value=value,
                 ),
             )
@@ -335,6 +393,8 @@ class SelectManyHandler(QHandler):
 @register("maskedinput")
 class MaskedInputHandler(QHandler):
     def get_widget_class(self):
+        from interrogatio.widgets import MaskedInput
+
         return MaskedInput
 
     def get_widget_init_kwargs(self):
@@ -351,50 +411,51 @@ class MaskedInputHandler(QHandler):
 
     def set_context(self, context):
         widget = self.get_widget()
-        default = self.get_question().get("default")
-        if default and callable(default):
-            widget.value = default(context)
+        if callable(self.get_question().get("default")):
+            widget.value = self.get_default(context)
 
     def get_layout(self):
         widget = self.get_widget()
-        vsplit_components = [widget]
-        if "message" in self._question and self._question["message"]:
-            vsplit_components.insert(
-                0,
-                Label(
-                    self._question["message"],
-                    dont_extend_width=True,
-                    style="class:input.question",
-                ),
-            )
-        hsplit_components = [VSplit(vsplit_components, padding=1)]
-        if "description" in self._question and self._question["description"]:
-            hsplit_components.insert(
-                0,
-                Window(
-                    FormattedTextControl(
-                        FormattedText(
-                            [
-                                (
-                                    "class:input.question",
-                                    self._question["description"],
-                                )
-                            ]
-                        ),
-                    ),
-                    wrap_lines=True,
-                    height=D(min=1, max=5, preferred=3),
-                ),
-            )
-        return HSplit(hsplit_components, padding=1)
+        return _get_layout(self._question, widget, "input")
 
-    def get_value(self):
+    def get_widget_value(self):
         return self.get_widget().value
 
+    def set_value(self, value):
+        if value:
+            self.get_widget().value = value
+
+    def clean_value(self, value, context=None):
+        if not value:
+            return None
+        mask = self.get_question()["mask"]
+        value = str(value)
+        if len(value) != len(mask) or any(
+            char != mask_char
+            for char, mask_char in zip(value, mask)
+            if mask_char != "_"
+        ):
+            raise ValidationError(f"this field does not match the mask {mask}")
+        return value
+
+
+def _dates_to_python(values, timezone=None):
+    # Bulk answers repeat the same few dates: each of them is converted once.
+    converted = {None: None, "": None}
+    result = []
+    append = result.append
+    for value in values:
+        if value not in converted:
+            converted[value] = _date_to_python(value, timezone) if value else None
+        append(converted[value])
+    return result
+
 
 @register("date")
 class DateHandler(QHandler):
     def get_widget_class(self):
+        from interrogatio.widgets import MaskedInput
+
         return MaskedInput
 
     def get_widget_init_kwargs(self):
@@ -413,9 +474,8 @@ class DateHandler(QHandler):
 
     def set_context(self, context):
         widget = self.get_widget()
-        default = self.get_question().get("default")
-        if default and callable(default):
-            value = default(context)
+        if callable(self.get_question().get("default")):
+            value = self.get_default(context)
             if isinstance(value, (date, datetime)):
                 widget.value = value.strftime("%Y-%m-%d")
             else:
@@ -423,60 +483,33 @@ class DateHandler(QHandler):
 
     def get_layout(self):
         widget = self.get_widget()
-        vsplit_components = [widget]
-        if "message" in self._question and self._question["message"]:
-            vsplit_components.insert(
-                0,
-                Label(
-                    self._question["message"],
-                    dont_extend_width=True,
-                    style="class:input.question",
-                ),
-            )
-        hsplit_components = [VSplit(vsplit_components, padding=1)]
-        if "description" in self._question and self._question["description"]:
-            hsplit_components.insert(
-                0,
-                Window(
-                    FormattedTextControl(
-                        FormattedText(
-                            [
-                                (
-                                    "class:input.question",
-                                    self._question["description"],
-                                )
-                            ]
-                        ),
-                    ),
-                    wrap_lines=True,
-                    height=D(min=1, max=5, preferred=3),
-                ),
-            )
-        return HSplit(hsplit_components, padding=1)
+        return _get_layout(self._question, widget, "input")
 
-    def to_python(self):
-        value = self.get_value()
+    def clean_value(self, value, context=None):
+        return _clean_date(value)
+
+    def value_to_python(self, value):
         if not value:
             return
 
-        question = self.get_question()
-        if "timezone" in question:
-            tzinfo = pytz.timezone(question["timezone"])
-        else:
-            tzinfo = pytz.timezone(get_localzone_name())
+        return _date_to_python(value, self.get_question().get("timezone"))
 
-        year, month, day = value.split("-")
-        return tzinfo.localize(
-            datetime(int(year), int(month), int(day)),
-        )
+    def values_to_python(self, values):
+        return _dates_to_python(values, self.get_question().get("timezone"))
 
-    def get_value(self):
+    def get_widget_value(self):
         return self.get_widget().value
 
+    def set_value(self, value):
+        if value:
+            self.get_widget().value = value
+
 
 @register("daterange")
 class DateRangeHandler(QHandler):
     def get_widget_class(self):
+        from interrogatio.widgets import DateRange
+
         return DateRange
 
     def get_widget_init_kwargs(self):  # noqa: CCR001
@@ -508,9 +541,8 @@ class DateRangeHandler(QHandler):
 
     def set_context(self, context):
         widget = self.get_widget()
-        default = self.get_question().get("default")
-        if default and callable(default):
-            value = default(context)
+        if callable(self.get_question().get("default")):
+            value = self.get_default(context)
             default_value = {}
             default_from = value.get("from")
             if default_from:
@@ -530,71 +562,63 @@ class DateRangeHandler(QHandler):
 
     def get_layout(self):
         widget = self.get_widget()
-        vsplit_components = [widget]
-        if "message" in self._question and self._question["message"]:
-            vsplit_components.insert(
-                0,
-                Label(
-                    self._question["message"],
-                    dont_extend_width=True,
-                    dont_extend_height=False,
-                    style="class:input.question",
-                ),
-            )
-        hsplit_components = [VSplit(vsplit_components, padding=1)]
-        if "description" in self._question and self._question["description"]:
-            hsplit_components.insert(
-                0,
-                Window(
-                    FormattedTextControl(
-                        FormattedText(
-                            [
-                                (
-                                    "class:input.question",
-                                    self._question["description"],
-                                )
-                            ]
-                        ),
-                    ),
-                    wrap_lines=True,
-                    height=D(min=1, max=5, preferred=3),
-                ),
-            )
-        return HSplit(hsplit_components, padding=1)
-
-    def to_python(self):
-        question = self.get_question()
-        if "timezone" in question:
-            tzinfo = pytz.timezone(question["timezone"])
-        else:
-            tzinfo = pytz.timezone(get_localzone_name())
+        return _get_layout(
+            self._question,
+            widget,
+            "input",
+            dont_extend_height=False,
+        )
 
-        from_date = None
-        to_date = None
+    def get_empty_value(self, context=None):
+        return {"from": None, "to": None}
 
-        value = self.get_value()
+    def clean_value(self, value, context=None):
+        if not value:
+            return self.get_empty_value(context)
+        if not isinstance(value, dict):
+            raise ValidationError("this field must be a date range")
+        return {
+            "from": _clean_date(value.get("from")),
+            "to": _clean_date(value.get("to")),
+        }
 
+    def value_to_python(self, value):
+        timezone = self.get_question().get("timezone")
         from_value = value.get("from")
-        if from_value:
-            year, month, day = from_value.split("-")
-            from_date = tzinfo.localize(
-                datetime(int(year), int(month), int(day)),
-            )
-
         to_value = value.get("to")
-        if to_value:
-            year, month, day = to_value.split("-")
-            to_date = tzinfo.localize(datetime(int(year), int(month), int(day)))
-
         return {
-            "from": from_date,
-            "to": to_date,
+            "from": _date_to_python(from_value, timezone) if from_value else None,
+            "to": _date_to_python(to_value, timezone) if to_value else None,
         }
 
-    def get_value(self):
+    def values_to_python(self, values):
+        timezone = self.get_question().get("timezone")
+        converted = {None: None, "": None}
+        result = []
+        append = result.append
+        for value in values:
+            from_value = value.get("from")
+            to_value = value.get("to")
+            if from_value not in converted:
+                converted[from_value] = (
+                    _date_to_python(from_value, timezone) if from_value else None
+                )
+            if to_value not in converted:
+                converted[to_value] = (
+                    _date_to_python(to_value, timezone) if to_value else None
+                )
+            append({"from": converted[from_value], "to": converted[to_value]})
+        return result
+
+    def get_widget_value(self):
         return self.get_widget().value
 
-    def get_formatted_value(self):
+    def set_value(self, value):
+        self.get_widget().value = {
+            key: item for key, item in (value or {}).items() if item
+        }
+
+    def get_widget_formatted_value(self):
         format = self._question.get(
             "formatting_template",
             "from ${start} - to ${end}",
@@ -606,6 +630,9 @@ class DateRangeHandler(QHandler):
         )
 
     def get_keybindings(self):
+        from prompt_toolkit.application.current import get_app
+        from prompt_toolkit.keys import Keys
+
         bindings = super().get_keybindings()
 
         @bindings.add(Keys.Tab)
@@ -1,30 +1,92 @@
 import argparse
 import json
+import os
 import sys
+import time
 from functools import partial
+from importlib.util import find_spec
 
-try:
-    import yaml
-
+if find_spec("yaml"):
     FORMAT_CHOICES = ["json", "yaml"]
-except ImportError:
-    yaml = None
+else:
     FORMAT_CHOICES = ["json"]
 
 
-from interrogatio import dialogus, interrogatio
+from interrogatio.core.exceptions import InvalidAnswersError
+
+
+def _read_questions(f, fmt, deserialize, args):
+    with f:
+        if args.no_cache or not os.path.isfile(f.name):
+            return deserialize(f)
+
+        from interrogatio.core.cache import QuestionsCache
+
+        return QuestionsCache(args.cache_dir).load(f, deserialize, fmt)
 
 
 def _load_questions(args):
-    with args.input as f:
-        return args.deserialize(f)
+    return _read_questions(
+        args.input,
+        getattr(args, "input_format", "json"),
+        args.deserialize,
+        args,
+    )
+
+
+def _write_answer_line(f, name, value):
+    f.write(json.dumps({name: value}))
+    f.write("\n")
+    f.flush()
 
 
 def _write_answers(args, answers):
     with args.output as f:
+        if args.output_format == "jsonl":
+            for name, value in (answers or {}).items():
+                _write_answer_line(f, name, value)
+            return
         args.serialize(answers, f)
 
 
+def _get_deserializer(fmt):
+    if fmt == "yaml":
+        import yaml
+
+        # Use the libyaml based loader if PyYAML has been built with it.
+        loader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+        return partial(yaml.load, Loader=loader)
+    return json.load
+
+
+def _set_serializers(args):
+    input_format = getattr(args, "input_format", "json")
+    args.deserialize = _get_deserializer(input_format)
+    if input_format == "yaml":
+        import yaml
+
+        dumper = getattr(yaml, "CDumper", yaml.Dumper)
+        args.serialize = partial(yaml.dump, Dumper=dumper)
+    else:
+        args.serialize = json.dump
+
+
+def _add_cache_arguments(parser):
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always parse the questions file instead of using the cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help=(
+            "Directory to cache the parsed questions files to, it must be "
+            "private to the current user "
+            "(Default: $XDG_CACHE_HOME/interrogatio or ~/.cache/interrogatio)"
+        ),
+    )
+
+
 def _add_common_arguments(parser):
     parser.add_argument(
         "--input",
@@ -47,21 +109,27 @@ def _add_common_arguments(parser):
             default="json",
             help="Questions file format (Default: json)",
         )
-        parser.add_argument(
-            "--output-format",
-            choices=FORMAT_CHOICES,
-            default="json",
-            help="Answers file format (Default: json)",
-        )
+    parser.add_argument(
+        "--output-format",
+        choices=FORMAT_CHOICES + ["jsonl"],
+        default="json",
+        help=(
+            "Answers file format, jsonl writes each answer as soon as it is "
+            "accepted (Default: json)"
+        ),
+    )
     parser.add_argument(
         "--theme",
         "-t",
         default="default",
         help="Name of the UI theme to use (Default: default)",
     )
+    _add_cache_arguments(parser)
 
 
 def main_dialogus():
+    from interrogatio import dialogus
+
     parser = argparse.ArgumentParser(
         description="Show a wizard dialog to prompt user for questions.",
     )
@@ -83,6 +151,14 @@ def main_dialogus():
             "Show a summary with answers as the " "latest step (Default: no summary)"
         ),
     )
+    parser.add_argument(
+        "--resume",
+        help=(
+            "Save the progress to a checkpoint file after each step and resume "
+            "from it if it exists; the answers are saved in plain text, except "
+            "passwords (Default: no checkpoint)"
+        ),
+    )
 
     for button in ("previous", "next", "cancel", "finish"):
         cap_btn = button.capitalize()
@@ -96,12 +172,7 @@ def main_dialogus():
 
     args = parser.parse_args()
 
-    if args.input_format == "yaml":
-        args.deserialize = partial(yaml.load, Loader=yaml.FullLoader)
-        args.serialize = yaml.dump
-    else:
-        args.deserialize = json.load
-        args.serialize = json.dump
+    _set_serializers(args)
 
     kwargs = {
         "intro": args.intro,
@@ -111,25 +182,140 @@ def main_dialogus():
         "next_text": args.next,
         "cancel_text": args.cancel,
         "finish_text": args.finish,
+        "resume": args.resume,
     }
 
     _write_answers(args, dialogus(_load_questions(args), **kwargs))
 
 
+def main_validate(argv=None):
+    from interrogatio.core.bulk import BulkValidator, read_csv, read_jsonl
+
+    parser = argparse.ArgumentParser(
+        prog="interrogatio validate",
+        description="Validate answer records against a set of questions.",
+    )
+    parser.add_argument(
+        "--questions",
+        "-q",
+        type=argparse.FileType("r"),
+        required=True,
+        help="Input file with questions",
+    )
+    if len(FORMAT_CHOICES) > 1:
+        parser.add_argument(
+            "--questions-format",
+            choices=FORMAT_CHOICES,
+            default="json",
+            help="Questions file format (Default: json)",
+        )
+    parser.add_argument(
+        "--answers",
+        "-a",
+        type=argparse.FileType("r", encoding="utf-8"),
+        required=True,
+        help="Input file with one answer record per line or row",
+    )
+    parser.add_argument(
+        "--answers-format",
+        choices=["jsonl", "csv"],
+        help="Answers file format (Default: guessed from the file extension)",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=argparse.FileType("w"),
+        default=sys.stdout,
+        help="Output file to write per record errors to (Default: STDOUT)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (Default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Number of records sent to a worker at once (Default: 1000)",
+    )
+    _add_cache_arguments(parser)
+
+    args = parser.parse_args(argv)
+
+    questions_format = getattr(args, "questions_format", "json")
+    questions = _read_questions(
+        args.questions,
+        questions_format,
+        _get_deserializer(questions_format),
+        args,
+    )
+
+    answers_format = args.answers_format
+    if not answers_format:
+        answers_format = "csv" if args.answers.name.endswith(".csv") else "jsonl"
+    reader = read_csv if answers_format == "csv" else read_jsonl
+
+    validator = BulkValidator(questions, jobs=args.jobs, chunk_size=args.chunk_size)
+    start = time.perf_counter()
+    with args.answers as records, args.output as out:
+        for result in validator.validate(reader(records)):
+            out.write(json.dumps(result))
+            out.write("\n")
+    elapsed = time.perf_counter() - start
+
+    sys.stderr.write(
+        f"Validated {validator.total} records ({validator.invalid} invalid) "
+        f"in {elapsed:.2f}s ({validator.total / (elapsed or 1):.0f} records/s)\n",
+    )
+    if validator.invalid:
+        sys.exit(1)
+
+
 def main_interrogatio():
+    if sys.argv[1:2] == ["validate"]:
+        return main_validate(sys.argv[2:])
+
+    from interrogatio import evaluate, interrogatio
+
     parser = argparse.ArgumentParser(
         description="Prompt user for questions.",
     )
     _add_common_arguments(parser)
+    parser.add_argument(
+        "--answers",
+        "-a",
+        type=argparse.FileType("r"),
+        help=(
+            "Evaluate the questions against the answers of this file "
+            "without prompting the user (same format of the input file)"
+        ),
+    )
 
     args = parser.parse_args()
 
-    if args.input_format == "yaml":
-        args.deserialize = partial(yaml.load, Loader=yaml.FullLoader)
-        args.serialize = yaml.dump
-    else:
-        args.deserialize = json.load
-        args.serialize = json.dump
+    _set_serializers(args)
+
+    if args.answers:
+        with args.answers as f:
+            supplied = args.deserialize(f)
+        try:
+            answers = evaluate(_load_questions(args), supplied)
+        except InvalidAnswersError as e:
+            parser.exit(1, f"Invalid answers: {e}\n")
+        _write_answers(args, answers)
+        return
+
+    if args.output_format == "jsonl":
+        with args.output as f:
+            interrogatio(
+                _load_questions(args),
+                theme=args.theme,
+                on_answer=partial(_write_answer_line, f),
+            )
+        return
 
     _write_answers(
         args,
@@ -17,35 +17,74 @@ __all__ = [
 
 
 class Theme:
-    def __init__(self):
+    def __init__(self, filename=None):
         self._prompt_styles = {}
         self._dialog_styles = {}
         self._name = ""
+        self._filename = filename
+        self._compiled_styles = {}
+
+    def _ensure_loaded(self):
+        if self._filename:
+            self.load(self._filename)
+
+    def _get_compiled_style(self, kind, styles):
+        style = self._compiled_styles.get(kind)
+        if style is None:
+            style = merge_styles(
+                [
+                    default_ui_style(),
+                    Style(list(styles.items())),
+                ]
+            )
+            self._compiled_styles[kind] = style
+        return style
 
     def load(self, filename):
+        self._filename = None
         with open(filename) as f:
             tmp = json.load(f)
             self._name = tmp["name"]
             self._prompt_styles = tmp["prompt"]
             self._dialog_styles = tmp["dialog"]
+        self._compiled_styles.clear()
+
+    def set_prompt_style(self, name, style):
+        """
+        Set the style of a class for the prompt mode.
+
+        :param name: the name of the style class (i.e. ``input.question``).
+        :type name: str
+        :param style: the style definition (i.e. ``darkgreen bold``).
+        :type style: str
+        """
+        self._ensure_loaded()
+        self._prompt_styles[name] = style
+        self._compiled_styles.pop("prompt", None)
+
+    def set_dialog_style(self, name, style):
+        """
+        Set the style of a class for the dialog mode.
+
+        :param name: the name of the style class (i.e. ``dialog.body``).
+        :type name: str
+        :param style: the style definition (i.e. ``bg:#ffffff #000000``).
+        :type style: str
+        """
+        self._ensure_loaded()
+        self._dialog_styles[name] = style
+        self._compiled_styles.pop("dialog", None)
 
     def for_prompt(self):
-        return merge_styles(
-            [
-                default_ui_style(),
-                Style(list(self._prompt_styles.items())),
-            ]
-        )
+        self._ensure_loaded()
+        return self._get_compiled_style("prompt", self._prompt_styles)
 
     def for_dialog(self):
-        return merge_styles(
-            [
-                default_ui_style(),
-                Style(list(self._dialog_styles.items())),
-            ]
-        )
+        self._ensure_loaded()
+        return self._get_compiled_style("dialog", self._dialog_styles)
 
     def save(self, filename):
+        self._ensure_loaded()
         with open(filename, "w") as f:
             json.dump(
                 {
@@ -5,13 +5,12 @@ from interrogatio.themes.base import Theme, register
 
 class DefaultTheme(Theme):
     def __init__(self):
-        super().__init__()
-        self.load(
-            os.path.join(
+        super().__init__(
+            filename=os.path.join(
                 os.path.dirname(__file__),
                 "theme_files",
                 "default.json",
-            )
+            ),
         )
 
 
@@ -20,13 +19,12 @@ register("default", DefaultTheme())
 
 class PurpleTheme(Theme):
     def __init__(self):
-        super().__init__()
-        self.load(
-            os.path.join(
+        super().__init__(
+            filename=os.path.join(
                 os.path.dirname(__file__),
                 "theme_files",
                 "purple.json",
-            )
+            ),
         )
 
 
@@ -8,8 +8,21 @@ __all__ = [
 class Validator(metaclass=ABCMeta):
     """
     Abstract class for validators.
+
+    The ``validate`` method can also be a coroutine function: such
+    validators are run concurrently and, if ``timeout`` is set, they fail
+    with ``timeout_message`` when they take longer than ``timeout`` seconds.
+
+    When a question stops at the first error, its validators run from the
+    one with the lowest ``cost``. Validators with ``skip_empty`` set accept
+    empty values (None or an empty string) and are not run for them.
     """
 
+    timeout = None
+    timeout_message = "this field could not be validated in time"
+    cost = 1
+    skip_empty = False
+
     def __init__(self, message="invalid input"):
         self.message = message
 
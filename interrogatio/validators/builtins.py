@@ -1,8 +1,6 @@
 import re
 from datetime import datetime
 
-import validators
-
 from interrogatio.core.exceptions import ValidationError
 from interrogatio.validators.base import Validator
 from interrogatio.validators.registry import register
@@ -27,6 +25,8 @@ __all__ = [
 
 @register("required")
 class RequiredValidator(Validator):
+    cost = 0
+
     def __init__(self, message=None):
         """
         Initialise the ``required`` validator.
@@ -71,6 +71,9 @@ class RegexValidator(Validator):
 
 @register("email")
 class EmailValidator(Validator):
+    cost = 2
+    skip_empty = True
+
     def __init__(self, message=None):
         """
         Initialise the ``email`` validator.
@@ -82,22 +85,31 @@ class EmailValidator(Validator):
         )
 
     def validate(self, value, context=None):
+        import validators
+
         if value and validators.email(value) is not True:
             raise ValidationError(self.message)
 
 
 @register("url")
 class URLValidator(Validator):
+    cost = 2
+    skip_empty = True
+
     def __init__(self, message=None):
         super().__init__(message=message or "this field must be an url")
 
     def validate(self, value, context=None):
+        import validators
+
         if value and validators.url(value) is not True:
             raise ValidationError(self.message)
 
 
 @register("min-length")
 class MinLengthValidator(Validator):
+    skip_empty = True
+
     def __init__(self, min_length, message=None):
         """
         Initialise the ``min-length`` validator.
@@ -116,6 +128,8 @@ class MinLengthValidator(Validator):
         )
 
     def validate(self, value, context=None):
+        import validators
+
         try:
             if value and validators.length(value, min=self.min_length) is not True:
                 raise ValidationError(message=self.message)
@@ -125,6 +139,8 @@ class MinLengthValidator(Validator):
 
 @register("max-length")
 class MaxLengthValidator(Validator):
+    skip_empty = True
+
     def __init__(self, max_length, message=None):
         """
         Initialise the ``max-length`` validator.
@@ -141,6 +157,8 @@ class MaxLengthValidator(Validator):
         )
 
     def validate(self, value, context=None):
+        import validators
+
         try:
             if value and validators.length(value, max=self.max_length) is not True:
                 raise ValidationError(message=self.message)
@@ -177,16 +195,23 @@ class IntegerValidator(Validator):
 
 @register("ipv4")
 class IPv4Validator(Validator):
+    cost = 2
+    skip_empty = True
+
     def __init__(self, message=None):
         self.message = message or "this field must be an IPv4 address"
 
     def validate(self, value, context=None):
+        import validators
+
         if value and validators.ipv4(value) is not True:
             raise ValidationError(message=self.message)
 
 
 @register("range")
 class RangeValidator(Validator):
+    skip_empty = True
+
     def __init__(self, min=None, max=None, message=None):
         self.min = min
         self.max = max
@@ -195,6 +220,8 @@ class RangeValidator(Validator):
         )
 
     def validate(self, value, context=None):
+        import validators
+
         try:
             if (
                 value is not None
@@ -213,11 +240,15 @@ class RangeValidator(Validator):
 
 @register("min")
 class MinValidator(Validator):
+    skip_empty = True
+
     def __init__(self, min=None, message=None):
         self.min = min
         self.message = message or f"this field must be greater or equal to {min}"
 
     def validate(self, value, context=None):
+        import validators
+
         try:
             if (
                 value is not None
@@ -235,11 +266,15 @@ class MinValidator(Validator):
 
 @register("max")
 class MaxValidator(Validator):
+    skip_empty = True
+
     def __init__(self, max=None, message=None):
         self.max = max
         self.message = message or f"this field must be smaller or equal to {max}"
 
     def validate(self, value, context=None):
+        import validators
+
         try:
             if (
                 value is not None
@@ -257,6 +292,8 @@ class MaxValidator(Validator):
 
 @register("datetime")
 class DateTimeValidator(Validator):
+    skip_empty = True
+
     def __init__(self, format_pattern="%Y-%m-%dT%H:%M:%S", message=None):
         self.format_pattern = format_pattern
         self.message = message or "this field is not a valid datetime"
@@ -272,6 +309,8 @@ class DateTimeValidator(Validator):
 
 @register("datetimerange")
 class DateTimeRangeValidator(Validator):
+    skip_empty = True
+
     def __init__(self, format_pattern="%Y-%m-%d", message=None):
         self.format_pattern = format_pattern
         self.message = message or "this field is not a valid datetime range"
@@ -13,9 +13,10 @@ class ValidatorsRegistry(dict):
 
     def get_instance(self, v):
         clazz = self[v["name"]]
-        if "args" in v:
-            return clazz(**v["args"])
-        return clazz()
+        validator = clazz(**v["args"]) if "args" in v else clazz()
+        if "timeout" in v:
+            validator.timeout = v["timeout"]
+        return validator
 
 
 _registry = ValidatorsRegistry()
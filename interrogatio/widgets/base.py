@@ -1,4 +1,6 @@
 import string
+from itertools import compress
+from types import SimpleNamespace
 
 from prompt_toolkit.application import get_app
 from prompt_toolkit.buffer import Buffer
@@ -13,8 +15,123 @@ from prompt_toolkit.layout.margins import ScrollbarMargin
 from prompt_toolkit.mouse_events import MouseEventType
 from prompt_toolkit.widgets import Label, TextArea
 
+from interrogatio.widgets.search import TypeAhead
+
+# Translation table used to flip a 0/1 selection bytearray in a single pass.
+_INVERT_TABLE = bytes([1, 0]) + bytes(254)
+
+
+class VirtualizedList:
+    """
+    Mixin for list widgets that render only the options that fit within
+    the window, plus a few lines of overscan, when the list is long.
+    """
+
+    VIRTUALIZE_THRESHOLD = 1000
+    OVERSCAN = 10
+    DEFAULT_PAGE_SIZE = 50
+
+    _first_visible = 0
+
+    def _get_visible_range(self):
+        """
+        Returns the range of options to render, keeping the selected option
+        within the visible part of the window.
+
+        :return: the (start, end) positions of the options to render.
+        :rtype: tuple
+        """
+        total = len(self.values)
+        if total <= self.VIRTUALIZE_THRESHOLD:
+            return 0, total
+
+        render_info = self.window.render_info
+        page_size = render_info.window_height if render_info else self.DEFAULT_PAGE_SIZE
+        first = self._first_visible
+        if self._selected_index < first:
+            first = self._selected_index
+        elif self._selected_index >= first + page_size:
+            first = self._selected_index - page_size + 1
+        first = max(0, min(first, total - page_size))
+        self._first_visible = first
+
+        start = max(0, first - self.OVERSCAN)
+        end = min(total, first + page_size + self.OVERSCAN)
+        # Scroll the window to the first visible option of the rendered slice.
+        self.window.vertical_scroll = first - start
+        return start, end
+
+
+class VirtualizedScrollbarMargin(ScrollbarMargin):
+    """
+    Scrollbar of a :class:`VirtualizedList`.
+    The window only contains the rendered slice of a long list, so the
+    size and the position of the scrollbar are computed from the whole
+    list and the first visible option instead.
+    """
+
+    def __init__(self, widget, display_arrows=False):
+        super().__init__(display_arrows=display_arrows)
+        self.widget = widget
+
+    def create_margin(self, window_render_info, width, height):
+        total = len(self.widget.values)
+        if total > self.widget.VIRTUALIZE_THRESHOLD:
+            window_render_info = SimpleNamespace(
+                content_height=total,
+                window_height=window_render_info.window_height,
+                displayed_lines=window_render_info.displayed_lines,
+                vertical_scroll=self.widget._first_visible,
+            )
+        return super().create_margin(window_render_info, width, height)
+
+
+class IndexedOptions:
+    """
+    Mixin for list widgets that keeps a map from the value of each option
+    to its position. The map is rebuilt the first time it is needed after
+    ``values`` has been assigned.
+    """
 
-class SelectOne:
+    _positions = None
+
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        self._values = values
+        self._positions = None
+        self._type_ahead.reset()
+
+    def get_position(self, value):
+        """
+        Returns the position of the option with the given value.
+
+        :return: the position of the option or None if not found.
+        :rtype: int
+        """
+        if self._positions is None:
+            positions = {}
+            for idx, option in enumerate(self._values or []):
+                positions.setdefault(option[0], idx)
+            self._positions = positions
+        return self._positions.get(value)
+
+    def get_label(self, value):
+        """
+        Returns the label of the option with the given value.
+
+        :return: the label of the option or None if not found.
+        """
+        idx = self.get_position(value)
+        if idx is None:
+            return None
+        return self._values[idx][1]
+
+
+class SelectOne(IndexedOptions, VirtualizedList):
     def __init__(  # noqa: CCR001
         self,
         values=None,
@@ -22,6 +139,7 @@ class SelectOne:
         accept_handler=None,
         style="",
     ):
+        self._type_ahead = TypeAhead()
         self.values = values or []
         self.current_value = values[0][0] if values and not callable(values) else None
         self._selected_index = 0
@@ -73,11 +191,13 @@ class SelectOne:
         def _(event):
             if not self.values:
                 return
-            # We first check values after the selected value, then all values.
-            for value in self.values[self._selected_index + 1 :] + self.values:
-                if value[1].startswith(event.data):
-                    self._selected_index = self.values.index(value)
-                    return
+            idx = self._type_ahead.search(
+                self.values,
+                event.data,
+                self._selected_index,
+            )
+            if idx is not None:
+                self._selected_index = idx
 
         # Control and window.
         self.control = FormattedTextControl(
@@ -87,7 +207,7 @@ class SelectOne:
         self.window = Window(
             content=self.control,
             style="class:radio-list",
-            right_margins=[ScrollbarMargin(display_arrows=True)],
+            right_margins=[VirtualizedScrollbarMargin(self, display_arrows=True)],
             dont_extend_height=True,
         )
 
@@ -97,24 +217,26 @@ class SelectOne:
 
     @value.setter
     def value(self, value):
-        for i in range(len(self.values)):
-            if self.values[i][0] == value:
-                self._selected_index = i
-                self.current_value = self.values[i][0]
-                break
+        idx = self.get_position(value)
+        if idx is not None:
+            self._selected_index = idx
+            self.current_value = self.values[idx][0]
 
     def _get_text_fragments(self, out_style):  # pragma: no cover
+        start, end = self._get_visible_range()
+
         def mouse_handler(mouse_event):
             """
             Set `_selected_index` and `current_value` according to the y
             position of the mouse click event.
             """
             if mouse_event.event_type == MouseEventType.MOUSE_UP:
-                self._selected_index = mouse_event.position.y
+                self._selected_index = start + mouse_event.position.y
                 self.current_value = self.values[self._selected_index][0]
 
         result = []
-        for i, value in enumerate(self.values):
+        for i in range(start, end):
+            value = self.values[i]
             checked = value[0] == self.current_value
             selected = i == self._selected_index
             style = out_style
@@ -150,7 +272,7 @@ class SelectOne:
         return self.window
 
 
-class SelectMany:
+class SelectMany(IndexedOptions, VirtualizedList):
     def __init__(  # noqa: CCR001
         self,
         values=None,
@@ -158,12 +280,16 @@ class SelectMany:
         accept_handler=None,
         style="",
     ):
+        self._type_ahead = TypeAhead()
+        self._values = None
+        self._selection = bytearray()
+        self._pending = []
+        self._value_cache = None
         self.values = values
-        self.checked = None
         self._selected_index = 0
         self.accept_handler = accept_handler
 
-        self.value = default or set()
+        self.value = default or []
 
         # Key bindings.
         kb = KeyBindings()
@@ -204,20 +330,19 @@ class SelectMany:
         def _(event):
             if not self.values:
                 return
-            if self.values[self._selected_index][0] in self.checked:
-                self.checked.remove(self.values[self._selected_index][0])
-            else:
-                self.checked.add(self.values[self._selected_index][0])
+            self.toggle(self._selected_index)
 
         @kb.add(Keys.Any)
         def _(event):
             if not self.values:
                 return
-            # We first check values after the selected value, then all values.
-            for value in self.values[self._selected_index + 1 :] + self.values:
-                if value[1].startswith(event.data):
-                    self._selected_index = self.values.index(value)
-                    return
+            idx = self._type_ahead.search(
+                self.values,
+                event.data,
+                self._selected_index,
+            )
+            if idx is not None:
+                self._selected_index = idx
 
         # Control and window.
         self.control = FormattedTextControl(
@@ -227,32 +352,111 @@ class SelectMany:
         self.window = Window(
             content=self.control,
             style="class:checkbox-list",
-            right_margins=[ScrollbarMargin(display_arrows=True)],
+            right_margins=[VirtualizedScrollbarMargin(self, display_arrows=True)],
             dont_extend_height=True,
         )
 
         if default:
             self.value = default
 
+    @property
+    def values(self):
+        return self._values
+
+    @values.setter
+    def values(self, values):
+        selected = self.value
+        IndexedOptions.values.fset(self, values)
+        self._selection = bytearray(len(values or ()))
+        self._select_values(selected)
+
     @property
     def value(self):
-        return list(self.checked)
+        if self._value_cache is None:
+            if self._values is None:
+                self._value_cache = list(self._pending)
+            else:
+                self._value_cache = [
+                    option[0] for option in compress(self._values, self._selection)
+                ]
+        return list(self._value_cache)
 
     @value.setter
     def value(self, value):
-        self.checked = set(value)
+        self._selection = bytearray(len(self._values or ()))
+        self._select_values(value)
+
+    def _select_values(self, values):
+        """
+        Marks the options with the given values as selected. If the options
+        are not known yet, the values are kept until ``values`` is assigned.
+        Values that don't match any option are discarded.
+        """
+        self._value_cache = None
+        if self._values is None:
+            self._pending = list(values)
+            return
+        self._pending = []
+        for value in values:
+            idx = self.get_position(value)
+            if idx is not None:
+                self._selection[idx] = 1
+
+    def is_selected(self, index):
+        """
+        Returns True if the option at the given position is selected.
+
+        :rtype: bool
+        """
+        return self._selection[index] == 1
+
+    def toggle(self, index):
+        """
+        Toggles the selection of the option at the given position.
+        """
+        self._selection[index] ^= 1
+        self._value_cache = None
+
+    def select_range(self, start, end, selected=True):
+        """
+        Selects (or deselects) the options with positions between ``start``
+        (included) and ``end`` (excluded).
+        """
+        size = len(range(len(self._selection))[start:end])
+        self._selection[start:end] = (b"\x01" if selected else b"\x00") * size
+        self._value_cache = None
+
+    @property
+    def checked(self):
+        """
+        Returns the set of the selected values. Changing the returned set
+        doesn't change the selection.
+
+        :rtype: set
+        """
+        return set(self.value)
 
     def select_all(self):
-        for v in self.values:
-            self.checked.add(v[0])
+        self._selection = bytearray(b"\x01") * len(self._selection)
+        self._value_cache = None
 
     def select_none(self):
-        self.checked.clear()
+        self._selection = bytearray(len(self._selection))
+        self._value_cache = None
 
-    def _generate_fragments(self, out_style):
+    def invert(self):
+        """
+        Selects the options that are not selected and deselects the others.
+        """
+        self._selection = self._selection.translate(_INVERT_TABLE)
+        self._value_cache = None
+
+    def _generate_fragments(self, out_style, start=0, end=None):
         result = []
-        for i, value in enumerate(self.values):
-            checked = value[0] in self.checked
+        end = len(self.values) if end is None else end
+        for i in range(start, end):
+            value = self.values[i]
+            checked = self._selection[i]
             selected = i == self._selected_index
             style = out_style
             if checked:
@@ -282,19 +486,18 @@ class SelectMany:
         return result
 
     def _get_text_fragments(self, out_style):  # pragma: no cover
+        start, end = self._get_visible_range()
+
         def mouse_handler(mouse_event):
             """
             Set `_selected_index` and `current_value` according to the y
             position of the mouse click event.
             """
             if mouse_event.event_type == MouseEventType.MOUSE_UP:
-                self._selected_index = mouse_event.position.y
-                if self.values[self._selected_index][0] in self.checked:
-                    self.checked.remove(self.values[self._selected_index][0])
-                else:
-                    self.checked.add(self.values[self._selected_index][0])
+                self._selected_index = start + mouse_event.position.y
+                self.toggle(self._selected_index)
 
-        result = self._generate_fragments(out_style)
+        result = self._generate_fragments(out_style, start, end)
         # Add mouse handler to all fragments.
         for i, fragment in enumerate(result):
             result[i] = (fragment[0], fragment[1], mouse_handler)
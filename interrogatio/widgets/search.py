@@ -0,0 +1,153 @@
+import sys
+import time
+from bisect import bisect_left
+
+from prompt_toolkit.formatted_text import fragment_list_to_text, to_formatted_text
+
+__all__ = ["PrefixIndex", "TypeAhead"]
+
+
+def _get_text(label):
+    if isinstance(label, str):
+        return label
+    return fragment_list_to_text(to_formatted_text(label))
+
+
+def _prefix_end(prefix):
+    # The smallest string greater than all the strings starting with prefix,
+    # or None if there is no such string.
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class PrefixIndex:
+    """
+    Index of the labels of a list of options.
+    The labels starting with a given prefix are a range of the sorted
+    labels, found with a binary search. A merge sort tree over the sorted
+    labels keeps, for each aligned block of them, the positions of their
+    options in order, so that the first position after a given one inside
+    the range is found with a binary search in each of the O(log n) blocks
+    that cover it.
+    """
+
+    def __init__(self, labels):
+        labels = [_get_text(label) for label in labels]
+        order = sorted(range(len(labels)), key=labels.__getitem__)
+        self._sorted_labels = [labels[idx] for idx in order]
+        # Level i holds the positions in sorted runs of 2 ** i items.
+        self._levels = [order]
+        size = 1
+        while size < len(order):
+            previous = self._levels[-1]
+            level = []
+            for idx in range(0, len(previous), size * 2):
+                level.extend(sorted(previous[idx : idx + size * 2]))
+            self._levels.append(level)
+            size *= 2
+
+    def _blocks(self, lo, hi):
+        # Yields the level and the bounds of the sorted runs of positions
+        # that cover the sorted labels between lo (included) and hi
+        # (excluded).
+        depth = 0
+        while lo < hi:
+            size = 1 << depth
+            level = self._levels[depth]
+            if lo & 1:
+                yield level, lo * size, (lo + 1) * size
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                yield level, hi * size, (hi + 1) * size
+            lo >>= 1
+            hi >>= 1
+            depth += 1
+
+    def find(self, prefix, start=0):
+        """
+        Returns the position of the first option, starting from ``start``
+        and wrapping around, whose label starts with ``prefix``.
+
+        :param prefix: the prefix to search for.
+        :type prefix: str
+        :param start: the position from which to start the search.
+        :type start: int
+
+        :return: the position of the option or None if no label matches.
+        :rtype: int
+        """
+        labels = self._sorted_labels
+        lo = bisect_left(labels, prefix)
+        if lo == len(labels) or not labels[lo].startswith(prefix):
+            return None
+        end = _prefix_end(prefix)
+        hi = len(labels) if end is None else bisect_left(labels, end, lo)
+        following = None
+        first = None
+        for level, begin, end in self._blocks(lo, hi):
+            idx = bisect_left(level, start, begin, end)
+            if idx < end and (following is None or level[idx] < following):
+                following = level[idx]
+            if first is None or level[begin] < first:
+                first = level[begin]
+        return first if following is None else following
+
+
+class TypeAhead:
+    """
+    Incremental search over the labels of a list of options.
+    Characters typed within ``timeout`` seconds from the previous one are
+    appended to the search text, otherwise a new search starts.
+    """
+
+    def __init__(self, timeout=1.0):
+        self.timeout = timeout
+        self._index = None
+        self._text = ""
+        self._last_time = 0
+
+    def reset(self):
+        """
+        Drops the index. It must be called when the list of options changes.
+        """
+        self._index = None
+        self._text = ""
+
+    def search(self, values, data, selected_index):
+        """
+        Search the next option matching the typed characters.
+
+        :param values: the list of (value, label) options.
+        :type values: list
+        :param data: the typed characters.
+        :type data: str
+        :param selected_index: the position of the currently selected option.
+        :type selected_index: int
+
+        :return: the position of the matching option or None.
+        :rtype: int
+        """
+        if self._index is None:
+            self._index = PrefixIndex([value[1] for value in values])
+        now = time.monotonic()
+        idx = None
+        text = self._text + data
+        if (
+            self._text
+            and now - self._last_time <= self.timeout
+            and text != data * len(text)
+        ):
+            # Refine the current search, the selected option may still match.
+            # Repeating the same character cycles through the options
+            # starting with it instead.
+            idx = self._index.find(text, selected_index)
+            if idx is not None:
+                self._text = text
+        if idx is None:
+            idx = self._index.find(data, selected_index + 1)
+            self._text = data if idx is not None else ""
+        self._last_time = now
+        return idx
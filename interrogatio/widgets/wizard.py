@@ -1,4 +1,6 @@
+import asyncio
 import string
+from functools import partial
 
 from prompt_toolkit.application import get_app
 from prompt_toolkit.filters import has_focus
@@ -15,7 +17,63 @@ from prompt_toolkit.layout.containers import (
 )
 from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.layout.dimension import Dimension as D
-from prompt_toolkit.widgets import Box, Button, Frame, Label, Shadow
+from prompt_toolkit.widgets import Box, Button, Frame, Label, Shadow, TextArea
+
+from interrogatio.widgets.base import VirtualizedList
+
+
+class StepsSidebar(VirtualizedList):
+    """
+    The list of the steps of a wizard within a single window.
+
+    Only the labels that fit within the window are rendered, so the cost of
+    a frame doesn't depend on the number of steps, and the list scrolls to
+    keep the current step in view.
+    """
+
+    VIRTUALIZE_THRESHOLD = 0
+
+    def __init__(self, wizard, width=33):
+        self.wizard = wizard
+        self._labels = {}
+        self.control = FormattedTextControl(self._get_text_fragments)
+        self.window = Window(
+            content=self.control,
+            width=width,
+            wrap_lines=False,
+        )
+
+    @property
+    def values(self):
+        return self.wizard.steps
+
+    @property
+    def _selected_index(self):
+        return self.wizard.current_step_idx
+
+    def _get_label(self, idx):
+        # Label fragments are rebuilt only when the style of the step
+        # changes, i.e. it becomes the current one or it's disabled.
+        style = self.wizard._get_step_style(idx)
+        cached = self._labels.get(idx)
+        if cached is None or cached[0] != style:
+            cached = (style, (style, f'{idx + 1}. {self.values[idx]["label"]}'))
+            self._labels[idx] = cached
+        return cached[1]
+
+    def _get_text_fragments(self):
+        start, end = self._get_visible_range()
+        result = []
+        for idx in range(start, end):
+            if idx == self._selected_index:
+                result.append(("[SetCursorPosition]", ""))
+            result.append(self._get_label(idx))
+            if idx < end - 1:
+                result.append(("", "\n"))
+        return result
+
+    def __pt_container__(self):
+        return self.window
 
 
 class WizardDialog:
@@ -30,10 +88,25 @@ class WizardDialog:
         cancel_text="Cancel",
         finish_text="Finish",
         fast_forward=False,
+        run_async=False,
+        on_change=None,
+        release_steps=False,
     ):
         self.title = title
         self.handlers = handlers
+        self.run_async = run_async
+        self.on_change = on_change
+        self.release_steps = release_steps
+        self._lock = None
+        self._validated = {}
+        self._restored_values = {}
+        self._last_step_idx = 0
         self.answers = {}
+        self._answers_version = 0
+        self._answer_versions = {}
+        self._disabled_cache = {}
+        self._jumping = False
+        self._summary = None
         self.intro = intro
         self.summary = summary
         self.steps = []
@@ -53,15 +126,23 @@ class WizardDialog:
         )
         self.previous_btn = Button(
             text=self.label_previous,
-            handler=self.previous,
+            handler=lambda: self._dispatch(self.previous),
         )
         self.next_btn = Button(
             text=self.label_next if len(self.steps) > 1 else self.label_finish,
-            handler=self.next,
+            handler=lambda: self._dispatch(self.next),
         )
 
         self.buttons = [self.next_btn, self.cancel_btn]
 
+        self.sidebar = StepsSidebar(self)
+        self.jump_input = TextArea(
+            multiline=False,
+            prompt="Go to step: ",
+            style="class:input.answer",
+            accept_handler=self._accept_jump,
+        )
+
         if fast_forward:
             self.fast_forward()
 
@@ -113,6 +194,9 @@ class WizardDialog:
         kb = KeyBindings()
         kb.add(Keys.Tab)(focus_next)
         kb.add(Keys.BackTab)(focus_previous)
+        kb.add("c-g", filter=~has_focus(self.jump_input))(self._start_jump)
+        kb.add("c-g", filter=has_focus(self.jump_input))(self._cancel_jump)
+        kb.add("escape", filter=has_focus(self.jump_input))(self._cancel_jump)
 
         frame = Shadow(
             body=Frame(
@@ -143,31 +227,19 @@ class WizardDialog:
         if idx == self.current_step_idx:
             return "class:dialog.step.current"
 
-        if self.steps[idx].get("handler") and self.steps[idx]["handler"].is_disabled(
-            context=self.answers
+        if self.steps[idx].get("handler") and self._is_disabled(
+            self.steps[idx]["handler"]
         ):
             return "class:dialog.step.disabled"
 
         return "class:dialog.step"
 
     def get_steps_labels(self):
-        steps_labels = []
-        for idx, step in enumerate(self.steps, start=1):
-            label = f'{idx}. {step["label"]}'
-            steps_labels.append(
-                Window(
-                    FormattedTextControl(
-                        to_formatted_text(
-                            label,
-                            style=self._get_step_style(idx - 1),
-                        ),
-                    ),
-                    height=1,
-                ),
-            )
-        return HSplit(steps_labels, width=33)
+        return self.sidebar
 
     def get_status(self):
+        if self._jumping:
+            return self.jump_input
         if self.error_messages:
             return Window(
                 FormattedTextControl(
@@ -178,6 +250,14 @@ class WizardDialog:
         return Label("")
 
     def get_summary(self):
+        """
+        Returns the summary of the answers.
+
+        The summary is built again only when an answer has changed since
+        the last call.
+        """
+        if self._summary is not None and self._summary[0] == self._answers_version:
+            return self._summary[1]
         if isinstance(self.summary, bool):
             text = "\n".join(
                 [
@@ -203,13 +283,32 @@ class WizardDialog:
                     for handler in self.handlers
                 },
             )
-        return Window(
+        summary = Window(
             FormattedTextControl(to_formatted_text(HTML(text))),
             wrap_lines=True,
         )
+        self._summary = (self._answers_version, summary)
+        return summary
 
     def get_current_step_container(self):
-        return self.current_step["layout"]
+        return self._get_layout(self.current_step)
+
+    def _get_layout(self, step):
+        # The layouts of the questions are built the first time the step is
+        # shown, so that the widgets of the steps not visited yet aren't.
+        if step["layout"] is None:
+            layout = step["handler"].get_layout()
+            layout.align = HorizontalAlign.JUSTIFY
+            step["layout"] = layout
+        return step["layout"]
+
+    def _answer(self, step):
+        handler = step["handler"]
+        answer = handler.get_answer()
+        if self.release_steps:
+            step["layout"] = None
+            handler.release_widget(dict(self.answers))
+        self._update_answers(answer)
 
     def get_buttons_container(self):
         return VSplit(
@@ -233,11 +332,9 @@ class WizardDialog:
             )
 
         for handler in self.handlers:
-            layout = handler.get_layout()
-            layout.align = HorizontalAlign.JUSTIFY
             self.steps.append(
                 {
-                    "layout": layout,
+                    "layout": None,
                     "label": handler.get_label(),
                     "handler": handler,
                 },
@@ -257,12 +354,53 @@ class WizardDialog:
                 },
             )
 
+    def _start_jump(self, event=None):
+        self._jumping = True
+        get_app().layout.focus(self.jump_input)
+
+    def _cancel_jump(self, event=None):
+        self._jumping = False
+        self.jump_input.text = ""
+        get_app().layout.focus(self._get_layout(self.current_step))
+
+    def _accept_jump(self, buffer):
+        text = buffer.text.strip()
+        self._cancel_jump()
+        if text.isdigit():
+            self._dispatch(partial(self.go_to_step, int(text) - 1))
+        return False
+
+    def go_to_step(self, idx):
+        """
+        Moves to the step at the given index. Moving forward, the steps in
+        between are validated as :meth:`fast_forward` does, stopping at the
+        first invalid one.
+
+        :param idx: the index of the step.
+        :type idx: int
+        """
+        idx = max(0, min(idx, len(self.steps) - 1))
+        if idx < self.current_step_idx:
+            self.current_step_idx = idx + 1
+            return self.previous()
+        if idx == self.current_step_idx:
+            return
+        self.fast_forward(until=idx)
+        if self.current_step_idx == idx:
+            handler = self.current_step["handler"]
+            if handler and self._is_disabled(handler):
+                return self.next()
+            if handler:
+                handler.set_context(self.answers)
+        if not self.summary or self.current_step != self.steps[-1]:
+            get_app().layout.focus(self._get_layout(self.current_step))
+
     def _check_no_next_steps(self):
         idx = self.current_step_idx + 1
         while idx <= len(self.steps) - 1:
             next_step = self.steps[idx]
             next_handler = next_step["handler"]
-            if next_handler and not next_handler.is_disabled(self.answers):
+            if next_handler and not self._is_disabled(next_handler):
                 return False
             idx += 1
 
@@ -295,59 +433,248 @@ class WizardDialog:
             self.current_step_idx -= 1
             self.current_step = self.steps[self.current_step_idx]
             handler = self.current_step["handler"]
-            if handler and handler.is_disabled(self.answers):
+            if handler and self._is_disabled(handler):
                 return self.previous()
-            get_app().layout.focus(self.current_step["layout"])
+            get_app().layout.focus(self._get_layout(self.current_step))
 
         self.set_buttons_labels()
 
     def next(self):  # noqa: CCR001
         if self.validate():
             if self.current_step_idx < len(self.steps) - 1:
-                handler = self.current_step["handler"]
-                if handler:
-                    self.answers.update(handler.get_answer())
+                if self.current_step["handler"]:
+                    self._answer(self.current_step)
                 self.current_step_idx += 1
                 self.current_step = self.steps[self.current_step_idx]
                 handler = self.current_step["handler"]
                 if handler:
-                    if handler.is_disabled(context=self.answers):
-                        return self.next()  # noqa: B305
-                    handler.set_context(self.answers)
+                    if self._is_disabled(handler):
+                        return self._dispatch(self.next)
+                    if not self._restore_value(handler):
+                        handler.set_context(self.answers)
                 if not self.summary or self.current_step != self.steps[-1]:
-                    get_app().layout.focus(self.current_step["layout"])
+                    get_app().layout.focus(self._get_layout(self.current_step))
             else:
                 get_app().exit(result=True)
 
         self.set_buttons_labels()
 
-    def fast_forward(self):
-        while self.current_step_idx < len(self.steps) - 1:
+    def fast_forward(self, until=None):
+        last_idx = len(self.steps) - 1
+        if until is not None:
+            last_idx = min(until, last_idx)
+        first_idx = self.current_step_idx
+        while self.current_step_idx < last_idx:
+            step = self.steps[self.current_step_idx]
+            handler = step["handler"]
+            restored = self._restore_value(handler)
+            if (
+                handler
+                and not restored
+                and self.current_step_idx > max(first_idx, self._last_step_idx)
+                and not self._is_disabled(handler)
+            ):
+                # The step has never been shown, so its values and default
+                # have not been computed from the answers given so far.
+                handler.set_context(self.answers)
             if self.validate():
-                step = self.steps[self.current_step_idx]
-                handler = step["handler"]
-                if handler and not handler.is_disabled(self.answers):
-                    self.answers.update(handler.get_answer())
-                    handler.set_context(self.answers)
+                if handler and not self._is_disabled(handler):
+                    self._answer(step)
+                    if not restored and not self.release_steps:
+                        handler.set_context(self.answers)
                 self.current_step_idx += 1
             else:
                 break
 
         self.current_step = self.steps[self.current_step_idx]
+        self._restore_value(self.current_step["handler"])
+        self._last_step_idx = max(self._last_step_idx, self.current_step_idx)
         self.set_buttons_labels()
 
+    def _restore_value(self, handler):
+        if not handler or handler.get_variable_name() not in self._restored_values:
+            return False
+        handler.set_context(self.answers)
+        handler.set_value(self._restored_values.pop(handler.get_variable_name()))
+        return True
+
+    def get_checkpoint(self):
+        """
+        Returns a JSON serializable snapshot of the current step and of the
+        values of all the steps visited so far, to be restored later with
+        :meth:`restore`. The values of sensitive questions, like passwords,
+        are left out.
+
+        :rtype: dict
+        """
+        values = {}
+        for step in self.steps[: self._last_step_idx + 1]:
+            handler = step["handler"]
+            if handler and not handler.SENSITIVE:
+                values[handler.get_variable_name()] = handler.get_value()
+        return {
+            "names": [handler.get_variable_name() for handler in self.handlers],
+            "step": self.current_step_idx,
+            "values": values,
+        }
+
+    def restore(self, checkpoint):
+        """
+        Restores a snapshot returned by :meth:`get_checkpoint` and fast
+        forwards to the step it was taken at, or to the first step with
+        an invalid value or a sensitive question, whose answer is not saved
+        and must be asked again.
+
+        A snapshot taken for different questions is ignored.
+
+        :param checkpoint: the snapshot to restore.
+        :type checkpoint: dict
+
+        :return: True if the snapshot has been restored.
+        :rtype: bool
+        """
+        names = [handler.get_variable_name() for handler in self.handlers]
+        if checkpoint.get("names") != names:
+            return False
+        self._clear_answers()
+        self.current_step_idx = 0
+        self._restored_values = dict(checkpoint["values"])
+        step = checkpoint["step"]
+        stops = [
+            idx
+            for idx, item in enumerate(self.steps[:step])
+            if item["handler"] and item["handler"].SENSITIVE
+        ]
+        for idx in stops:
+            self.fast_forward(until=idx)
+            handler = self.current_step["handler"]
+            if self.current_step_idx != idx or not self._is_disabled(handler):
+                return True
+        self.fast_forward(until=step)
+        return True
+
+    def _update_answers(self, answer):
+        for name, value in answer.items():
+            if name not in self.answers or self.answers[name] != value:
+                self.answers[name] = value
+                self._answer_versions[name] = self._answer_versions.get(name, 0) + 1
+                self._answers_version += 1
+
+    def _clear_answers(self):
+        for name in self.answers:
+            self._answer_versions[name] = self._answer_versions.get(name, 0) + 1
+        self._answers_version += 1
+        self.answers = {}
+
+    def _get_versions(self, names):
+        if names is None:
+            return self._answers_version
+        return {name: self._answer_versions.get(name, 0) for name in names}
+
+    def _is_disabled(self, handler):
+        """
+        Returns whether a question is disabled by the current answers.
+
+        The result is reused until any of the answers read by the
+        ``disabled`` condition of the question changes.
+        """
+        cached = self._disabled_cache.get(handler)
+        if cached is not None and cached[1] == self._get_versions(
+            handler.get_dependencies("disabled"),
+        ):
+            return cached[0]
+        disabled = handler.is_disabled(self.answers)
+        self._disabled_cache[handler] = (
+            disabled,
+            self._get_versions(handler.get_dependencies("disabled")),
+        )
+        return disabled
+
+    def _changed(self):
+        self._last_step_idx = max(self._last_step_idx, self.current_step_idx)
+        if self.on_change:
+            self.on_change(self)
+
+    def _is_valid(self, handler):
+        validated = self._validated.pop(self.current_step_idx, None)
+        if validated is not None and validated[0] == handler.get_value():
+            return validated[1]
+        return handler.is_valid(self.answers)
+
     def validate(self):
         step = self.steps[self.current_step_idx]
         handler = step["handler"]
-        if (
-            handler
-            and not handler.is_valid(self.answers)
-            and not handler.is_disabled(self.answers)
-        ):
+        if handler and not self._is_valid(handler) and not self._is_disabled(handler):
             self.error_messages = ",".join(handler.errors)
             return False
         self.error_messages = ""
         return True
 
+    def _dispatch(self, action):
+        """
+        Runs a navigation action. When running asynchronously, the
+        coroutine attributes of the questions are resolved in a background
+        task before the action is run, so the UI is not blocked meanwhile.
+        """
+        if not self.run_async:
+            result = action()
+            self._changed()
+            return result
+        get_app().create_background_task(self._dispatch_async(action))
+
+    async def _dispatch_async(self, action):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if action == self.next:
+                await self.prevalidate()
+            await self.prefetch()
+            action()
+            self._changed()
+            get_app().invalidate()
+
+    async def prevalidate(self):
+        """
+        Runs the validators of the current step within the event loop, so
+        that the following call to :meth:`validate` does not block it.
+        """
+        handler = self.current_step["handler"]
+        if handler:
+            value = handler.get_value()
+            valid = await handler.validate_value_async(value, context=self.answers)
+            self._validated = {self.current_step_idx: (value, valid)}
+
+    async def prefetch(self):
+        """
+        Resolves the ``disabled`` attribute of all the questions against both
+        the current answers and the answers as they would be after the
+        current step, and the attributes of the next enabled question.
+
+        The answer of the current step is taken into account only if
+        :meth:`prevalidate` has found it valid.
+        """
+        answers = dict(self.answers)
+        handler = self.current_step["handler"]
+        if handler and self._validated.get(self.current_step_idx) == (
+            handler.get_value(),
+            True,
+        ):
+            try:
+                answers.update(handler.get_answer())
+            except (TypeError, ValueError):
+                pass
+        await asyncio.gather(
+            *(
+                handler.resolve(context, ("disabled",))
+                for handler in self.handlers
+                for context in (self.answers, answers)
+            ),
+        )
+        for step in self.steps[self.current_step_idx + 1 :]:
+            handler = step["handler"]
+            if handler and not handler.is_disabled(answers):
+                await handler.resolve(answers)
+                break
+
     def __pt_container__(self):  # pragma: no cover
         return self.container
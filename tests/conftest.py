@@ -42,7 +42,7 @@ def test_handler():
         def get_layout(self):
             pass
 
-        def get_value(self):
+        def get_widget_value(self):
             pass
 
         def get_widget_init_kwargs(self):
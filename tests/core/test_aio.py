@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from interrogatio.core.aio import maybe_await, run_sync
+
+
+async def get_value():
+    await asyncio.sleep(0)
+    return "value"
+
+
+async def raise_error():
+    raise ValueError("error")
+
+
+def test_maybe_await():
+    assert asyncio.run(maybe_await("value")) == "value"
+    assert asyncio.run(maybe_await(get_value())) == "value"
+
+
+def test_run_sync_no_loop():
+    assert run_sync("value") == "value"
+    assert run_sync(get_value()) == "value"
+
+
+def test_run_sync_running_loop():
+    async def run():
+        return run_sync(get_value())
+
+    assert asyncio.run(run()) == "value"
+
+
+def test_run_sync_error():
+    async def run():
+        return run_sync(raise_error())
+
+    with pytest.raises(ValueError):
+        run_sync(raise_error())
+    with pytest.raises(ValueError):
+        asyncio.run(run())
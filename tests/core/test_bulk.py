@@ -0,0 +1,82 @@
+import io
+import json
+
+import pytest
+
+from interrogatio.core.bulk import BulkValidator, read_csv, read_jsonl
+from interrogatio.validators import Validator
+
+QUESTIONS = [
+    {
+        "name": "name",
+        "type": "input",
+        "validators": [{"name": "required"}],
+    },
+    {
+        "name": "env",
+        "type": "selectone",
+        "values": [["dev", "Development"], ["prod", "Production"]],
+    },
+]
+
+
+def test_read_jsonl():
+    f = io.StringIO('{"name": "a"}\n\n{"name": "b"}\n')
+    assert list(read_jsonl(f)) == ['{"name": "a"}\n', '{"name": "b"}\n']
+
+
+def test_read_csv():
+    f = io.StringIO("name,env\nJohn,dev\n")
+    assert list(read_csv(f)) == [{"name": "John", "env": "dev"}]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_bulk_validator(jobs):
+    records = [
+        json.dumps({"name": "John", "env": "dev"}),
+        json.dumps({"name": "", "env": "prod"}),
+        "not json",
+        json.dumps(["a list"]),
+        {"name": "Jane", "env": "test"},
+    ] * 3
+
+    validator = BulkValidator(QUESTIONS, jobs=jobs, chunk_size=2)
+    results = list(validator.validate(iter(records)))
+
+    assert validator.total == 15
+    assert validator.invalid == 12
+    assert [r["record"] for r in results] == [2, 3, 4, 5, 7, 8, 9, 10, 12, 13, 14, 15]
+    assert results[0]["errors"] == {"name": ["this field is required"]}
+    assert results[1]["errors"]["__record__"][0].startswith("invalid record:")
+    assert results[2]["errors"] == {"__record__": ["record must be an object"]}
+    assert results[3]["errors"] == {"env": ["this field is not a valid choice"]}
+
+
+class BrokenValidator(Validator):
+    def validate(self, value, context=None):
+        if value == "boom":
+            raise RuntimeError("broken validator")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_bulk_validator_record_exception(jobs):
+    questions = [
+        {"name": "name", "type": "input", "validators": [BrokenValidator()]},
+    ]
+    records = [{"name": "John"}, {"name": "boom"}, {"name": "Jane"}]
+
+    validator = BulkValidator(questions, jobs=jobs, chunk_size=2)
+    results = list(validator.validate(iter(records)))
+
+    assert validator.total == 3
+    assert results == [
+        {
+            "record": 2,
+            "errors": {
+                "__record__": [
+                    "record could not be validated: "
+                    "RuntimeError('broken validator')",
+                ],
+            },
+        },
+    ]
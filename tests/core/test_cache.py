@@ -0,0 +1,147 @@
+import json
+import os
+
+import pytest
+
+from interrogatio.core.cache import (
+    QuestionsCache,
+    get_default_cache_dir,
+    get_package_fingerprint,
+)
+from interrogatio.core.plan import QuestionsPlan
+from interrogatio.validators import RequiredValidator
+
+QUESTIONS = [
+    {
+        "name": "name",
+        "type": "input",
+        "validators": [{"name": "required"}],
+    },
+]
+
+
+def _write_questions(path, questions):
+    path.write_text(json.dumps(questions))
+
+
+def _load(cache, path, deserialize=json.load):
+    with open(path) as f:
+        return cache.load(f, deserialize)
+
+
+def test_get_default_cache_dir(monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", "/tmp/xdg")
+    assert get_default_cache_dir() == "/tmp/xdg/interrogatio"
+
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", "/home/user")
+    assert get_default_cache_dir() == "/home/user/.cache/interrogatio"
+
+
+def test_cache_load(mocker, tmp_path):
+    path = tmp_path / "questions.json"
+    _write_questions(path, QUESTIONS)
+    cache = QuestionsCache(str(tmp_path / "cache"))
+    deserialize = mocker.MagicMock(side_effect=json.load)
+
+    plan = _load(cache, path, deserialize)
+    cached = _load(cache, path, deserialize)
+
+    assert isinstance(cached, QuestionsPlan)
+    assert cached.names == plan.names == ("name",)
+    assert isinstance(cached[0]["validators"][0], RequiredValidator)
+    deserialize.assert_called_once()
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+
+def test_cache_load_changed_file(mocker, tmp_path):
+    path = tmp_path / "questions.json"
+    _write_questions(path, QUESTIONS)
+    cache = QuestionsCache(str(tmp_path / "cache"))
+    _load(cache, path)
+
+    _write_questions(path, QUESTIONS + [{"name": "other", "type": "input"}])
+    os.utime(path, ns=(1, 1))
+
+    assert _load(cache, path).names == ("name", "other")
+
+
+def test_cache_load_touched_file(mocker, tmp_path):
+    path = tmp_path / "questions.json"
+    _write_questions(path, QUESTIONS)
+    cache = QuestionsCache(str(tmp_path / "cache"))
+    _load(cache, path)
+    os.utime(path, ns=(1, 1))
+    deserialize = mocker.MagicMock(side_effect=json.load)
+
+    _load(cache, path, deserialize)
+
+    deserialize.assert_called_once()
+
+
+def test_cache_load_corrupted_entry(tmp_path):
+    path = tmp_path / "questions.json"
+    _write_questions(path, QUESTIONS)
+    cache = QuestionsCache(str(tmp_path / "cache"))
+    _load(cache, path)
+    for name in os.listdir(tmp_path / "cache"):
+        (tmp_path / "cache" / name).write_bytes(b"corrupted")
+
+    assert _load(cache, path).names == ("name",)
+
+
+def test_cache_load_unwritable_dir(tmp_path):
+    path = tmp_path / "questions.json"
+    _write_questions(path, QUESTIONS)
+    cache_file = tmp_path / "not_a_dir"
+    cache_file.write_text("")
+    cache = QuestionsCache(str(cache_file))
+
+    assert _load(cache, path).names == ("name",)
+
+
+def test_cache_load_other_package_version(mocker, tmp_path):
+    path = tmp_path / "questions.json"
+    _write_questions(path, QUESTIONS)
+    cache = QuestionsCache(str(tmp_path / "cache"))
+    _load(cache, path)
+    mocker.patch(
+        "interrogatio.core.cache.get_package_fingerprint",
+        return_value="other",
+    )
+    deserialize = mocker.MagicMock(side_effect=json.load)
+
+    _load(cache, path, deserialize)
+    _load(cache, path, deserialize)
+
+    deserialize.assert_called_once()
+
+
+def test_get_package_fingerprint(mocker):
+    get_package_fingerprint.cache_clear()
+    fingerprint = get_package_fingerprint()
+    get_package_fingerprint.cache_clear()
+    mocker.patch("interrogatio.get_version", return_value="99.0.0")
+
+    assert get_package_fingerprint() != fingerprint
+
+    get_package_fingerprint.cache_clear()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+@pytest.mark.parametrize("target", ["dir", "entry"])
+def test_cache_load_untrusted(mocker, tmp_path, target):
+    path = tmp_path / "questions.json"
+    _write_questions(path, QUESTIONS)
+    cache_dir = tmp_path / "cache"
+    cache = QuestionsCache(str(cache_dir))
+    _load(cache, path)
+    if target == "dir":
+        cache_dir.chmod(0o777)
+    else:
+        for name in os.listdir(cache_dir):
+            (cache_dir / name).chmod(0o666)
+    mocked_load = mocker.patch("interrogatio.core.cache.pickle.load")
+
+    assert _load(cache, path).names == ("name",)
+    mocked_load.assert_not_called()
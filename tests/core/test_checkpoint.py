@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from interrogatio.core.checkpoint import (
+    load_checkpoint,
+    remove_checkpoint,
+    save_checkpoint,
+)
+
+
+def test_save_load_checkpoint(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    checkpoint = {"names": ["question"], "step": 0, "values": {"question": "a"}}
+
+    save_checkpoint(path, checkpoint)
+
+    assert load_checkpoint(path) == dict(checkpoint, version=1)
+    assert [p.name for p in tmp_path.iterdir()] == ["checkpoint.json"]
+
+
+def test_save_checkpoint_replace(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    save_checkpoint(path, {"names": ["question"], "step": 0, "values": {}})
+    save_checkpoint(
+        path,
+        {"names": ["question"], "step": 1, "values": {"question": "a"}},
+    )
+
+    assert load_checkpoint(path)["step"] == 1
+
+
+def test_save_checkpoint_error(mocker, tmp_path):
+    path = tmp_path / "checkpoint.json"
+    mocker.patch(
+        "interrogatio.core.checkpoint.json.dump",
+        side_effect=TypeError("not serializable"),
+    )
+
+    with pytest.raises(TypeError):
+        save_checkpoint(str(path), {"names": [], "step": 0, "values": {}})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_checkpoint_missing(tmp_path):
+    assert load_checkpoint(str(tmp_path / "checkpoint.json")) is None
+
+
+def test_load_checkpoint_invalid(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    path.write_text("{not json")
+    assert load_checkpoint(str(path)) is None
+
+    path.write_text(json.dumps({"names": [], "step": 0, "values": {}}))
+    assert load_checkpoint(str(path)) is None
+
+    path.write_text(json.dumps({"version": 1, "names": [], "step": "0"}))
+    assert load_checkpoint(str(path)) is None
+
+
+def test_remove_checkpoint(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    path.write_text("{}")
+
+    remove_checkpoint(str(path))
+    remove_checkpoint(str(path))
+
+    assert not path.exists()
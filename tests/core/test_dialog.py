@@ -1,4 +1,14 @@
-from interrogatio.core.dialog import dialogus, show_dialog
+import asyncio
+import os
+
+from interrogatio.core.checkpoint import load_checkpoint, save_checkpoint
+from interrogatio.core.dialog import (
+    dialogus,
+    dialogus_async,
+    show_dialog,
+    show_dialog_async,
+)
+from interrogatio.core.plan import compile_questions
 
 
 def test_dialogus(mocker):
@@ -17,6 +27,8 @@ def test_dialogus(mocker):
         "previous_text": "previous_text",
         "cancel_text": "cancel_text",
         "finish_text": "finish_text",
+        "resume": None,
+        "release_steps": False,
     }
 
     dialogus(*args, **kwargs)
@@ -69,6 +81,7 @@ def test_show_dialog(mocker):
         "previous_text": "previous_text",
         "cancel_text": "cancel_text",
         "finish_text": "finish_text",
+        "release_steps": False,
     }
 
     answers = show_dialog(*args, **kwargs)
@@ -125,3 +138,149 @@ def test_show_dialog_cancel(mocker):
     answers = show_dialog(*args, **kwargs)
 
     assert answers is None
+
+
+def test_dialogus_async(mocker):
+    mocked_set_theme = mocker.patch("interrogatio.core.dialog.set_theme")
+    mocked_show_dialog = mocker.patch(
+        "interrogatio.core.dialog.show_dialog_async",
+        return_value={"question1": "answer"},
+    )
+    mocked_validate = mocker.patch(
+        "interrogatio.core.dialog.validate_questions",
+    )
+
+    args = ([{"name": "question1"}], "title")
+
+    answers = asyncio.run(dialogus_async(*args, intro="intro"))
+
+    assert answers == {"question1": "answer"}
+    mocked_set_theme.assert_called_once_with("default")
+    mocked_validate.assert_called_once_with(args[0])
+    mocked_show_dialog.assert_awaited_once_with(
+        *args,
+        intro="intro",
+        summary=False,
+        fast_forward=False,
+        next_text="Next",
+        previous_text="Previous",
+        cancel_text="Cancel",
+        finish_text="Finish",
+        resume=None,
+        release_steps=False,
+    )
+
+
+def test_show_dialog_async(mocker):
+    mocker.patch(
+        "interrogatio.core.dialog.for_dialog",
+        return_value="a style",
+    )
+    mocked_handler = mocker.MagicMock()
+    mocked_handler.get_answer.return_value = {"question": "answer"}
+    mocked_handler.is_disabled.return_value = False
+    mocked_handler.resolve = mocker.AsyncMock()
+    mocker.patch(
+        "interrogatio.core.dialog.get_instance",
+        return_value=mocked_handler,
+    )
+    mocked_app = mocker.MagicMock()
+    mocked_app.run_async = mocker.AsyncMock(return_value=True)
+    mocker.patch(
+        "interrogatio.core.dialog.Application",
+        return_value=mocked_app,
+    )
+    mocked_wz_cls = mocker.patch(
+        "interrogatio.core.dialog.WizardDialog",
+    )
+    mocker.patch(
+        "interrogatio.core.dialog.Layout",
+    )
+
+    answers = asyncio.run(show_dialog_async([{"name": "question"}], "title"))
+
+    assert answers == {"question": "answer"}
+    assert mocked_wz_cls.call_args.kwargs["run_async"] is True
+    assert mocked_handler.resolve.await_count == 2
+    assert mocked_handler.resolve.await_args.args[1] == ("disabled",)
+
+
+def test_dialogus_plan(mocker):
+    mocker.patch("interrogatio.core.dialog.set_theme")
+    mocked_show_dialog = mocker.patch("interrogatio.core.dialog.show_dialog")
+    mocked_validate = mocker.patch(
+        "interrogatio.core.dialog.validate_questions",
+    )
+    plan = compile_questions([{"name": "question1", "type": "input"}])
+
+    dialogus(plan, "title")
+
+    mocked_validate.assert_not_called()
+    assert mocked_show_dialog.call_args.args[0] is plan
+
+
+def test_show_dialog_resume(mocker, tmp_path):
+    mocker.patch("interrogatio.core.dialog.for_dialog")
+    mocked_layout = mocker.patch("interrogatio.core.dialog.Layout")
+    mocked_app = mocker.MagicMock()
+    mocker.patch(
+        "interrogatio.core.dialog.Application",
+        return_value=mocked_app,
+    )
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {"name": "question2", "type": "input", "message": "message"},
+    ]
+    path = str(tmp_path / "checkpoint.json")
+    save_checkpoint(
+        path,
+        {
+            "names": ["question1", "question2"],
+            "step": 1,
+            "values": {"question1": "answer1", "question2": "ans"},
+        },
+    )
+
+    def run():
+        wizard = mocked_layout.call_args.args[0]
+        assert wizard.current_step_idx == 1
+        assert wizard.answers == {"question1": "answer1"}
+        wizard.handlers[1].get_widget().text = "answer2"
+        wizard._dispatch(wizard.previous)
+        assert load_checkpoint(path)["values"] == {
+            "question1": "answer1",
+            "question2": "answer2",
+        }
+        return True
+
+    mocked_app.run.side_effect = run
+
+    answers = show_dialog(questions, "title", resume=path)
+
+    assert answers == {"question1": "answer1", "question2": "answer2"}
+    assert not os.path.exists(path)
+
+
+def test_show_dialog_resume_cancel(mocker, tmp_path):
+    mocker.patch("interrogatio.core.dialog.for_dialog")
+    mocked_layout = mocker.patch("interrogatio.core.dialog.Layout")
+    mocked_app = mocker.MagicMock()
+    mocker.patch(
+        "interrogatio.core.dialog.Application",
+        return_value=mocked_app,
+    )
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [{"name": "question1", "type": "input", "message": "message"}]
+    path = str(tmp_path / "checkpoint.json")
+
+    def run():
+        wizard = mocked_layout.call_args.args[0]
+        wizard.handlers[0].get_widget().text = "answer"
+        wizard._dispatch(wizard.next)
+        return False
+
+    mocked_app.run.side_effect = run
+
+    assert show_dialog(questions, "title", resume=path) is None
+    assert load_checkpoint(path)["values"] == {"question1": "answer"}
@@ -0,0 +1,120 @@
+import pickle
+
+import pytest
+
+from interrogatio.core.exceptions import InvalidQuestionError
+from interrogatio.core.expressions import compile_expression
+
+
+@pytest.mark.parametrize(
+    ("source", "answers", "expected"),
+    [
+        ("answers.env != 'prod'", {"env": "prod"}, False),
+        ("answers.env != 'prod'", {"env": "dev"}, True),
+        ("answers['env'] == 'prod'", {"env": "prod"}, True),
+        ("answers.env is None", {}, True),
+        ("answers.count > 1 and answers.count <= 10", {"count": 5}, True),
+        ("answers.a or answers.b", {"a": 0, "b": "b"}, "b"),
+        ("answers.a and answers.b", {"a": 0, "b": "b"}, 0),
+        ("not answers.a", {"a": True}, False),
+        ("1 < answers.count < 3", {"count": 2}, True),
+        ("1 < answers.count < 3", {"count": 3}, False),
+        ("'py' in answers.languages", {"languages": ["py", "go"]}, True),
+        ("'rb' not in answers.languages", {"languages": ["py"]}, True),
+        ("(answers.a + 1) * 2 - 1", {"a": 2}, 5),
+        ("-answers.a // 2 % 3", {"a": 5}, 0),
+        ("answers.a / 2", {"a": 5}, 2.5),
+        ("'x' if answers.a else 'y'", {"a": False}, "y"),
+        ("len(answers.languages)", {"languages": ["py", "go"]}, 2),
+        ("max(int(answers.a), 3)", {"a": "7"}, 7),
+        ("answers.range['from']", {"range": {"from": "2020-01-01"}}, "2020-01-01"),
+        ("int(answers.age) < 18", {}, False),
+        ("int(answers.age) >= 18", {}, False),
+        ("answers.env + '.example.com'", {}, None),
+        ("-answers.a * 2", {}, None),
+        ("len(answers.a)", {}, None),
+        ("bool(answers.a)", {}, False),
+        ("'ab' * 3", {}, "ababab"),
+        ("[0] * answers.count", {"count": 2}, [0, 0]),
+        ("answers.a % 3", {"a": 5}, 2),
+        ("'py' in answers.langs", {}, None),
+        ("'py' not in answers.langs", {}, None),
+        ("answers.range['from']", {}, None),
+        ("int(answers.age) < 18", {"age": ""}, None),
+        ("answers.a < 3", {"a": "x"}, None),
+        ("answers.range['to']", {"range": {"from": "2020-01-01"}}, None),
+        ("answers.langs[2]", {"langs": ["py"]}, None),
+        ("answers.a / answers.b", {"a": 1, "b": 0}, None),
+        ("answers.a + 1", {"a": "x"}, None),
+    ],
+)
+def test_expression_evaluate(source, answers, expected):
+    assert compile_expression(source)(answers) == expected
+
+
+def test_expression_literals():
+    expression = compile_expression(
+        "[('a', 'A'), ('b', answers.label)] + [{'k': {1, 2}}]",
+    )
+    assert expression({"label": "B"}) == [("a", "A"), ("b", "B"), {"k": {1, 2}}]
+    assert expression() == [("a", "A"), ("b", None), {"k": {1, 2}}]
+
+
+def test_expression_dependencies():
+    expression = compile_expression(
+        "answers.env == 'prod' and answers['region'] in ['eu', answers.other]",
+    )
+    assert expression.dependencies == frozenset({"env", "region", "other"})
+    assert compile_expression("True").dependencies == frozenset()
+
+
+def test_expression_pickle():
+    expression = compile_expression("answers.env != 'prod'")
+    restored = pickle.loads(pickle.dumps(expression))
+    assert restored == expression
+    assert restored.source == "answers.env != 'prod'"
+    assert restored({"env": "dev"}) is True
+
+
+@pytest.mark.parametrize(
+    ("source", "error"),
+    [
+        ("answers.env ==", "invalid syntax"),
+        ("__import__('os')", "only the functions"),
+        ("answers.env.__class__", "attributes can only be read from answers"),
+        ("().__class__.__bases__", "attributes can only be read from answers"),
+        ("open", "unknown name open"),
+        ("answers", "answers must be followed by a question name"),
+        ("answers[answers.key]", "answers must be indexed by a question name"),
+        ("[x for x in answers.a]", "unsupported syntax ListComp"),
+        ("lambda: 1", "unsupported syntax Lambda"),
+        ("2 ** 1000", "unsupported operator Pow"),
+        ("~answers.a", "unsupported operator Invert"),
+        ("len(*answers.a)", "functions only accept positional arguments"),
+        ("str(answers.a, encoding='utf-8')", "positional arguments"),
+        ("{**answers.a}", "dictionary unpacking is not supported"),
+        ("b'bytes'", "unsupported constant"),
+        ("(a := 1)", "unsupported syntax NamedExpr"),
+    ],
+)
+def test_expression_invalid(source, error):
+    with pytest.raises(InvalidQuestionError) as cv:
+        compile_expression(source)
+    assert str(cv.value).startswith(f"Invalid expression {source}: ")
+    assert error in str(cv.value)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "'a' * 99999999999",
+        "99999999999 * [0]",
+        "('a' * 10000) * 2",
+        "[0] * answers.count",
+        "'%099999999d' % 1",
+        "len(str([['x' * 10000] * 10000] * 100))",
+        "[['x' * 5000] * 2] * 2",
+    ],
+)
+def test_expression_too_large(source):
+    assert compile_expression(source)({"count": 99999999999}) is None
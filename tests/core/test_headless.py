@@ -0,0 +1,233 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from interrogatio.core.exceptions import InvalidAnswersError, InvalidQuestionError
+from interrogatio.core.headless import evaluate, process
+from interrogatio.core.utils import validate_questions
+
+
+def test_evaluate(mocker):
+    mocked_get_widget = mocker.patch(
+        "interrogatio.handlers.base.QHandler.get_widget",
+    )
+    questions = [
+        {
+            "name": "name",
+            "type": "input",
+            "validators": [{"name": "required"}],
+        },
+        {
+            "name": "password",
+            "type": "password",
+            "default": "secret",
+        },
+        {
+            "name": "nationality",
+            "type": "selectone",
+            "values": [("IT", "Italian"), ("ES", "Spanish")],
+        },
+        {
+            "name": "languages",
+            "type": "selectmany",
+            "values": lambda ctx: [("py", "Python"), ("rs", "Rust")],
+        },
+        {
+            "name": "phone",
+            "type": "maskedinput",
+            "mask": "(___) ___",
+        },
+        {
+            "name": "birth_date",
+            "type": "date",
+        },
+        {
+            "name": "holidays",
+            "type": "daterange",
+            "default": {"from": datetime(2020, 8, 1)},
+        },
+    ]
+
+    answers = evaluate(
+        questions,
+        {
+            "name": "John",
+            "languages": ["rs"],
+            "phone": "(123) 456",
+            "birth_date": "2000-01-31",
+        },
+    )
+
+    assert answers == {
+        "name": "John",
+        "password": "secret",
+        "nationality": "IT",
+        "languages": ["rs"],
+        "phone": "(123) 456",
+        "birth_date": datetime(2000, 1, 31, tzinfo=timezone.utc),
+        "holidays": {
+            "from": datetime(2020, 8, 1, tzinfo=timezone.utc),
+            "to": None,
+        },
+    }
+    mocked_get_widget.assert_not_called()
+
+
+def test_evaluate_disabled_and_dynamic_default():
+    questions = [
+        {
+            "name": "env",
+            "type": "selectone",
+            "values": [("dev", "Development"), ("prod", "Production")],
+        },
+        {
+            "name": "approver",
+            "type": "input",
+            "disabled": lambda ctx: ctx["env"] != "prod",
+        },
+        {
+            "name": "hostname",
+            "type": "input",
+            "default": lambda ctx: f"{ctx['env']}.example.com",
+        },
+    ]
+
+    assert evaluate(questions, {}) == {
+        "env": "dev",
+        "hostname": "dev.example.com",
+    }
+    assert evaluate(questions, {"env": "prod", "approver": "Jane"}) == {
+        "env": "prod",
+        "approver": "Jane",
+        "hostname": "prod.example.com",
+    }
+
+
+def test_evaluate_invalid():
+    questions = [
+        {
+            "name": "name",
+            "type": "input",
+            "validators": [{"name": "required"}],
+        },
+        {
+            "name": "nationality",
+            "type": "selectone",
+            "values": [("IT", "Italian")],
+        },
+        {
+            "name": "languages",
+            "type": "selectmany",
+            "values": [("py", "Python")],
+        },
+    ]
+
+    with pytest.raises(InvalidAnswersError) as cv:
+        evaluate(questions, {"nationality": "FR", "languages": ["py"]})
+
+    assert cv.value.errors == {
+        "name": ["this field is required"],
+        "nationality": ["this field is not a valid choice"],
+    }
+    assert str(cv.value) == (
+        "name: this field is required; nationality: this field is not a valid choice"
+    )
+
+
+def test_process():
+    questions = [
+        {
+            "name": "age",
+            "type": "input",
+            "validators": [{"name": "integer"}],
+        },
+        {
+            "name": "birth_date",
+            "type": "date",
+        },
+    ]
+    validate_questions(questions)
+
+    result, errors = process(questions, {"age": "ten", "birth_date": "2000-13-01"})
+
+    assert result == {}
+    assert errors == {
+        "age": ["this field must be an integer"],
+        "birth_date": ["this field is not a valid date"],
+    }
+
+
+def test_evaluate_expressions():
+    questions = [
+        {
+            "name": "env",
+            "type": "selectone",
+            "values": [("dev", "Development"), ("prod", "Production")],
+        },
+        {
+            "name": "approver",
+            "type": "input",
+            "disabled": "answers.env != 'prod'",
+        },
+        {
+            "name": "region",
+            "type": "selectone",
+            "values": "[('eu', 'Europe')] if answers.env == 'prod' "
+            "else [('local', 'Local')]",
+        },
+        {
+            "name": "hostname",
+            "type": "input",
+            "default": {"expr": "answers.region + '.' + answers['env']"},
+        },
+    ]
+
+    assert evaluate(questions, {}) == {
+        "env": "dev",
+        "region": "local",
+        "hostname": "local.dev",
+    }
+    assert evaluate(questions, {"env": "prod", "approver": "Jane"}) == {
+        "env": "prod",
+        "approver": "Jane",
+        "region": "eu",
+        "hostname": "eu.prod",
+    }
+
+
+def test_evaluate_expression_not_evaluable():
+    questions = [
+        {"name": "age", "type": "input"},
+        {
+            "name": "guardian",
+            "type": "input",
+            "disabled": "int(answers.age) >= 18",
+        },
+    ]
+
+    assert evaluate(questions, {"age": "", "guardian": "Jane"}) == {
+        "age": "",
+        "guardian": "Jane",
+    }
+
+
+def test_evaluate_invalid_expression():
+    questions = [
+        {
+            "name": "approver",
+            "type": "input",
+            "disabled": "__import__('os').system('true')",
+        },
+    ]
+
+    with pytest.raises(InvalidQuestionError):
+        evaluate(questions, {})
+
+
+def test_evaluate_invalid_default_expression():
+    questions = [{"name": "name", "type": "input", "default": {"expr": 1}}]
+
+    with pytest.raises(InvalidQuestionError) as cv:
+        evaluate(questions, {})
+
+    assert str(cv.value) == "Default expression must be a string."
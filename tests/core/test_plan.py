@@ -0,0 +1,198 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from interrogatio.core.exceptions import InvalidQuestionError
+from interrogatio.core.headless import evaluate
+from interrogatio.core.plan import QuestionsPlan, compile_questions, get_handlers
+from interrogatio.core.prompt import interrogatio
+from interrogatio.handlers import SelectOneHandler, StringHandler
+from interrogatio.validators import RequiredValidator
+
+
+def is_disabled(answers):
+    return answers["name"] == "skip"
+
+
+QUESTIONS = [
+    {
+        "name": "name",
+        "type": "input",
+        "validators": [{"name": "required"}],
+    },
+    {
+        "name": "color",
+        "type": "selectone",
+        "label": "Favorite color",
+        "values": [("red", "Red"), ("blue", "Blue")],
+        "disabled": is_disabled,
+    },
+    {
+        "name": "nickname",
+        "type": "input",
+        "default": "nick",
+        "depends_on": ["name"],
+    },
+]
+
+
+def test_compile_questions():
+    questions = [dict(q) for q in QUESTIONS]
+
+    plan = compile_questions(questions)
+
+    assert questions == QUESTIONS
+    assert isinstance(plan, QuestionsPlan)
+    assert len(plan) == 3
+    assert plan.names == ("name", "color", "nickname")
+    assert plan.get_label("name") == "Name"
+    assert plan.get_label("color") == "Favorite color"
+    assert isinstance(plan[0]["validators"], tuple)
+    assert isinstance(plan[0]["validators"][0], RequiredValidator)
+    assert compile_questions(plan) is plan
+
+
+def test_compile_questions_frozen():
+    plan = compile_questions(QUESTIONS)
+
+    with pytest.raises(TypeError):
+        plan[0]["name"] = "other"
+    with pytest.raises(TypeError):
+        plan.dependencies["name"] = frozenset()
+
+
+def test_compile_questions_dependencies():
+    plan = compile_questions(QUESTIONS)
+
+    assert plan.dependencies == {
+        "name": frozenset(),
+        "color": frozenset(["name"]),
+        "nickname": frozenset(["name"]),
+    }
+    assert plan.dependents["name"] == frozenset(["color", "nickname"])
+    assert plan.dependents["color"] == frozenset()
+
+
+def test_compile_questions_invalid_dependency():
+    questions = [
+        {"name": "first", "type": "input", "depends_on": ["second"]},
+        {"name": "second", "type": "input"},
+    ]
+
+    with pytest.raises(InvalidQuestionError) as cv:
+        compile_questions(questions)
+
+    assert str(cv.value) == (
+        "Question first depends on unknown or following questions: second."
+    )
+
+
+def test_compile_questions_duplicated_name():
+    questions = [
+        {"name": "first", "type": "input"},
+        {"name": "first", "type": "input"},
+    ]
+
+    with pytest.raises(InvalidQuestionError) as cv:
+        compile_questions(questions)
+
+    assert str(cv.value) == "Duplicated question name: first."
+
+
+def test_plan_create_handlers():
+    plan = compile_questions(QUESTIONS)
+
+    handlers = plan.create_handlers()
+
+    assert [type(h) for h in handlers] == [
+        StringHandler,
+        SelectOneHandler,
+        StringHandler,
+    ]
+    assert handlers is not plan.create_handlers()
+    assert [type(h) for h in get_handlers(plan)] == [type(h) for h in handlers]
+
+
+def test_plan_create_handlers_share_choices():
+    plan = compile_questions(QUESTIONS)
+
+    evaluate(plan, {"name": "name", "color": "blue"})
+    first = plan.create_handlers()[1]._memo["choice_values"]
+    evaluate(plan, {"name": "name", "color": "red"})
+
+    assert plan.create_handlers()[1]._memo["choice_values"] is first
+    assert first[1] == {"red", "blue"}
+
+
+def test_plan_pickle():
+    plan = compile_questions(QUESTIONS)
+
+    unpickled = pickle.loads(pickle.dumps(plan))
+
+    assert unpickled.names == plan.names
+    assert unpickled.dependencies == plan.dependencies
+
+
+def test_evaluate_plan_threads():
+    plan = compile_questions(QUESTIONS)
+
+    def run(idx):
+        return evaluate(plan, {"name": f"name{idx}", "color": "blue"})
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run, range(20)))
+
+    assert results[7] == {"name": "name7", "color": "blue", "nickname": "nick"}
+
+
+def test_interrogatio_plan(mock_input):
+    plan = compile_questions(QUESTIONS)
+
+    mock_input.send_text("skip\n\n")
+    answers = interrogatio(plan)
+
+    assert answers == {"name": "skip", "nickname": "nick"}
+
+
+def test_compile_questions_invalid_depends_on():
+    with pytest.raises(InvalidQuestionError) as cv:
+        compile_questions([{"name": "first", "type": "input", "depends_on": "x"}])
+
+    assert str(cv.value) == "Depends on must be a list of question names."
+
+
+def test_compile_questions_expression_dependencies():
+    plan = compile_questions(
+        [
+            {"name": "env", "type": "input"},
+            {"name": "region", "type": "input"},
+            {"name": "approver", "type": "input", "disabled": "answers.env == 'dev'"},
+            {
+                "name": "hostname",
+                "type": "input",
+                "disabled": "answers.env == 'dev'",
+                "default": {"expr": "answers.region"},
+            },
+        ],
+    )
+
+    assert plan.dependencies["approver"] == frozenset({"env"})
+    assert plan.dependencies["hostname"] == frozenset({"env", "region"})
+    assert plan.dependents["env"] == frozenset({"approver", "hostname"})
+    restored = pickle.loads(pickle.dumps(plan))
+    assert restored[2]["disabled"]({"env": "dev"}) is True
+
+
+def test_compile_questions_expression_unknown_question():
+    with pytest.raises(InvalidQuestionError) as cv:
+        compile_questions(
+            [
+                {"name": "first", "type": "input", "disabled": "answers.second"},
+                {"name": "second", "type": "input"},
+            ],
+        )
+
+    assert str(cv.value) == (
+        "Question first depends on unknown or following questions: second."
+    )
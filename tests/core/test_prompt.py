@@ -1,9 +1,16 @@
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
 
+from interrogatio.core import prompt as prompt_module
 from interrogatio.core.exceptions import InvalidQuestionError
-from interrogatio.core.prompt import interrogatio
+from interrogatio.core.prompt import (
+    SingleAppSession,
+    interrogatio,
+    interrogatio_async,
+)
+from interrogatio.validators import RequiredValidator, Validator
 
 
 def test_string_handler(mock_input):
@@ -228,6 +235,46 @@ def test_selectone_handler_page_up(mock_input):
     assert answers["question"] == "first"
 
 
+def test_selectone_handler_type_ahead(mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "selectone",
+            "message": "message",
+            "values": [
+                ("first", "First"),
+                ("second", "Second"),
+                ("third", "Third"),
+            ],
+        },
+    ]
+
+    mock_input.send_text("T " + chr(13))
+    answers = interrogatio(questions)
+
+    assert answers["question"] == "third"
+
+
+def test_selectmany_handler_type_ahead(mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "selectmany",
+            "message": "message",
+            "values": [
+                ("first", "First"),
+                ("second", "Second"),
+                ("third", "Third"),
+            ],
+        },
+    ]
+
+    mock_input.send_text("\t\tS " + chr(13))
+    answers = interrogatio(questions)
+
+    assert answers["question"] == ["second"]
+
+
 def test_selectone_handler_value_initial(mock_input):
     questions = [
         {
@@ -728,7 +775,7 @@ def test_disabled_handler_invalid(mock_input):
             "type": "input",
             "message": "message",
             "description": "description",
-            "disabled": "not callable or boolean",
+            "disabled": ["not callable or boolean"],
         },
     ]
 
@@ -738,3 +785,403 @@ def test_disabled_handler_invalid(mock_input):
         interrogatio(questions)
 
     assert str(cv.value) == "Disabled flag must be a boolean or callable."
+
+
+def test_single_app(mocker, mock_input):
+    questions = [
+        {
+            "name": "question1",
+            "type": "input",
+            "message": "message",
+        },
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+            "disabled": lambda ctx: ctx["question1"] == "first",
+        },
+        {
+            "name": "question3",
+            "type": "selectone",
+            "message": "message",
+            "values": [
+                ("first", "First"),
+                ("second", "Second"),
+            ],
+        },
+    ]
+    mocked_app_cls = mocker.spy(prompt_module, "Application")
+
+    mock_input.send_text("first\n\x1b[B \r")
+    answers = interrogatio(questions, single_app=True)
+
+    assert answers == {"question1": "first", "question3": "second"}
+    assert mocked_app_cls.call_count == 1
+
+
+def test_single_app_invalid(mocker):
+    questions = [
+        {
+            "name": "question1",
+            "type": "input",
+            "message": "message",
+            "validators": [RequiredValidator()],
+        },
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+        },
+    ]
+    session = SingleAppSession(questions)
+
+    assert session.advance() is True
+    first_handler = session.handler
+    event = mocker.MagicMock()
+
+    session.accept(event)
+
+    assert session.error == "this field is required"
+    assert session.handler is first_handler
+    assert session.get_error() == [("class:error", "this field is required")]
+
+    first_handler.get_widget().text = "answer"
+    session.accept(event)
+
+    assert session.error == ""
+    assert session.handler is not first_handler
+    assert session.answers == {"question1": "answer"}
+    event.app.layout.focus.assert_called_once_with(session.container)
+
+    session.handler.get_widget().text = "other"
+    session.accept(event)
+
+    event.app.exit.assert_called_once_with(result=True)
+
+
+def test_single_app_keybindings_built_once(mocker):
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {"name": "question2", "type": "input", "message": "message"},
+    ]
+    session = SingleAppSession(questions)
+
+    session.advance()
+    first_bindings = session.get_keybindings()
+    spy = mocker.spy(session.handler, "get_keybindings")
+
+    assert session.get_keybindings() is first_bindings
+    spy.assert_not_called()
+
+    session.handler.get_widget().text = "answer"
+    session.accept(mocker.MagicMock())
+
+    assert session.get_keybindings() is not first_bindings
+    assert session.get_keybindings() is session.get_keybindings()
+
+
+def test_single_app_ctrl_c(mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "input",
+            "message": "message",
+        },
+    ]
+
+    mock_input.send_text("\x03")
+    answers = interrogatio(questions, single_app=True)
+
+    assert answers is None
+
+
+def test_single_app_all_disabled(mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "input",
+            "message": "message",
+            "disabled": True,
+        },
+    ]
+
+    answers = interrogatio(questions, single_app=True)
+
+    assert answers == {}
+
+
+def test_interrogatio_async(mock_input):
+    async def get_values(answers):
+        return [("first", "First"), ("second", "Second")]
+
+    async def is_disabled(answers):
+        return answers["question1"] == "first"
+
+    questions = [
+        {
+            "name": "question1",
+            "type": "input",
+            "message": "message",
+        },
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+            "disabled": is_disabled,
+        },
+        {
+            "name": "question3",
+            "type": "selectone",
+            "message": "message",
+            "values": get_values,
+        },
+    ]
+
+    mock_input.send_text("first\n\x1b[B \r")
+    answers = asyncio.run(interrogatio_async(questions))
+
+    assert answers == {"question1": "first", "question3": "second"}
+
+
+def test_interrogatio_async_ctrl_c(mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "input",
+            "message": "message",
+        },
+    ]
+
+    mock_input.send_text("\x03")
+    answers = asyncio.run(interrogatio_async(questions))
+
+    assert answers is None
+
+
+async def _wait_for(condition):
+    while not condition():
+        await asyncio.sleep(0.01)
+
+
+def _is_showing(session, name):
+    return (
+        session.handler is not None
+        and session.handler.get_variable_name() == name
+        and not session.loading
+    )
+
+
+def test_single_app_async(mocker, mock_input):
+    async def get_default(answers):
+        return answers["question1"].upper()
+
+    questions = [
+        {
+            "name": "question1",
+            "type": "input",
+            "message": "message",
+        },
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+            "default": get_default,
+        },
+    ]
+    mocked_app_cls = mocker.spy(prompt_module, "Application")
+    session = SingleAppSession(questions)
+
+    async def answer_second_question():
+        await _wait_for(lambda: _is_showing(session, "question2"))
+        mock_input.send_text("\n")
+
+    async def run():
+        mock_input.send_text("first\n")
+        task = asyncio.ensure_future(answer_second_question())
+        answers = await session.run_async()
+        await task
+        return answers
+
+    answers = asyncio.run(run())
+
+    assert answers == {"question1": "first", "question2": "FIRST"}
+    assert mocked_app_cls.call_count == 1
+
+
+def test_single_app_async_type_ahead(mock_input):
+    class SlowValidator(Validator):
+        async def validate(self, value, context=None):
+            await asyncio.sleep(0.2)
+
+    questions = [
+        {
+            "name": "question1",
+            "type": "input",
+            "message": "message",
+            "validators": [SlowValidator()],
+        },
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+            "validators": [SlowValidator()],
+        },
+        {
+            "name": "question3",
+            "type": "input",
+            "message": "message",
+        },
+    ]
+
+    mock_input.send_text("first\n\n\n")
+    answers = asyncio.run(interrogatio_async(questions, single_app=True))
+
+    assert answers == {"question1": "first", "question2": "", "question3": ""}
+
+
+def test_single_app_async_type_ahead_invalid(mock_input):
+    class SlowRequiredValidator(RequiredValidator):
+        async def validate(self, value, context=None):
+            await asyncio.sleep(0.2)
+            super().validate(value, context=context)
+
+    questions = [
+        {
+            "name": "question1",
+            "type": "input",
+            "message": "message",
+            "validators": [SlowRequiredValidator()],
+        },
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+        },
+    ]
+
+    session = SingleAppSession(questions)
+
+    async def answer_questions():
+        await _wait_for(lambda: session.error and not session.loading)
+        mock_input.send_text("first\n")
+        await _wait_for(lambda: _is_showing(session, "question2"))
+        mock_input.send_text("\n")
+
+    async def run():
+        mock_input.send_text("\n\n")
+        task = asyncio.ensure_future(answer_questions())
+        answers = await session.run_async()
+        await task
+        return answers
+
+    answers = asyncio.run(run())
+
+    assert answers == {"question1": "first", "question2": ""}
+
+
+def test_validator_timeout_invalid(mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "input",
+            "message": "message",
+            "validators": [{"name": "required", "timeout": "1"}],
+        },
+    ]
+
+    with pytest.raises(InvalidQuestionError) as cv:
+        interrogatio(questions)
+
+    assert str(cv.value) == "Validator timeout must be a number."
+
+
+def test_fail_fast_invalid(mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "input",
+            "message": "message",
+            "fail_fast": "yes",
+        },
+    ]
+
+    with pytest.raises(InvalidQuestionError) as cv:
+        interrogatio(questions)
+
+    assert str(cv.value) == "Fail fast flag must be a boolean."
+
+
+class AsyncRequiredValidator(RequiredValidator):
+    async def validate(self, value, context=None):
+        super().validate(value, context=context)
+
+
+def test_async_validator(mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "input",
+            "message": "message",
+            "validators": [AsyncRequiredValidator()],
+        },
+    ]
+
+    mock_input.send_text("\nanswer\n")
+    answers = interrogatio(questions)
+
+    assert answers == {"question": "answer"}
+
+
+def test_async_validator_interrogatio_async(mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "input",
+            "message": "message",
+            "validators": [AsyncRequiredValidator()],
+        },
+    ]
+
+    mock_input.send_text("\nanswer\n")
+    answers = asyncio.run(interrogatio_async(questions))
+
+    assert answers == {"question": "answer"}
+
+
+@pytest.mark.parametrize("single_app", [False, True])
+def test_on_answer(mocker, mock_input, single_app):
+    questions = [
+        {
+            "name": "question1",
+            "type": "input",
+            "message": "message",
+        },
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+        },
+    ]
+    on_answer = mocker.MagicMock()
+
+    mock_input.send_text("first\n\x03")
+    answers = interrogatio(questions, single_app=single_app, on_answer=on_answer)
+
+    assert answers is None
+    on_answer.assert_called_once_with("question1", "first")
+
+
+def test_on_answer_async(mocker, mock_input):
+    questions = [
+        {
+            "name": "question",
+            "type": "input",
+            "message": "message",
+        },
+    ]
+    on_answer = mocker.MagicMock()
+
+    mock_input.send_text("answer\n")
+    asyncio.run(interrogatio_async(questions, on_answer=on_answer))
+
+    on_answer.assert_called_once_with("question", "answer")
@@ -0,0 +1,23 @@
+from interrogatio.core.tracking import TrackingDict
+
+
+def test_tracking_dict_keys():
+    d = TrackingDict({"a": 1, "b": 2})
+
+    assert d["a"] == 1
+    assert d.get("c") is None
+    assert "b" in d
+
+    assert d.accessed_keys == frozenset({"a", "b", "c"})
+
+
+def test_tracking_dict_all_keys():
+    for read in (list, len, dict, lambda d: d.items(), lambda d: d == {}):
+        d = TrackingDict({"a": 1})
+        read(d)
+        assert d.accessed_keys is None
+
+
+def test_tracking_dict_nothing_read():
+    d = TrackingDict({"a": 1})
+    assert d.accessed_keys == frozenset()
@@ -1,4 +1,10 @@
-from interrogatio.validators import RequiredValidator
+import asyncio
+
+import pytest
+
+from interrogatio.core.exceptions import ValidationError
+from interrogatio.core.expressions import compile_expression
+from interrogatio.validators import RequiredValidator, Validator
 
 
 def test_qhandler_errors(test_handler):
@@ -43,3 +49,369 @@ def test_qhandler_is_valid_invalid(mocker, test_handler):
     )
     t.get_value = mocker.MagicMock(return_value="")
     assert t.is_valid() is False
+
+
+def test_qhandler_get_default(test_handler):
+    assert test_handler({}).get_default() is None
+    assert test_handler({"default": "value"}).get_default() == "value"
+    t = test_handler({"default": lambda ctx: ctx["other"]})
+    assert t.get_default({"other": "value"}) == "value"
+
+
+def test_qhandler_validate_value(test_handler):
+    t = test_handler(
+        {
+            "name": "test_field",
+            "validators": [RequiredValidator()],
+        }
+    )
+    assert t.validate_value("value") is True
+    assert t.validate_value("") is False
+    assert t.errors == ["this field is required"]
+
+
+def test_qhandler_is_valid_no_validators(mocker, test_handler):
+    t = test_handler({"name": "test_field"})
+    t.get_value = mocker.MagicMock()
+    assert t.is_valid() is True
+    t.get_value.assert_not_called()
+
+
+def test_qhandler_evaluate_attribute_coroutine(test_handler):
+    async def get_default(ctx):
+        return ctx["other"]
+
+    t = test_handler({"default": get_default})
+
+    assert t.get_default({"other": "value"}) == "value"
+
+
+def test_qhandler_resolve(mocker, test_handler):
+    disabled = mocker.AsyncMock(return_value=True)
+    t = test_handler({"default": "value", "disabled": disabled})
+
+    asyncio.run(t.resolve({"other": "value"}))
+    asyncio.run(t.resolve({"other": "value"}))
+
+    assert t.is_disabled({"other": "value"}) is True
+    assert t.get_default({"other": "value"}) == "value"
+    disabled.assert_awaited_once_with({"other": "value"})
+
+
+def test_qhandler_resolve_other_context(mocker, test_handler):
+    disabled = mocker.AsyncMock(side_effect=lambda ctx: ctx["other"] == "a")
+    t = test_handler({"disabled": disabled})
+
+    asyncio.run(t.resolve({"other": "a"}))
+
+    assert t.is_disabled({"other": "a"}) is True
+    assert t.is_disabled({"other": "b"}) is False
+    assert disabled.await_count == 2
+
+
+class SlowValidator(Validator):
+    def __init__(self, delay, error=None, timeout=None):
+        super().__init__(message=error)
+        self.delay = delay
+        self.timeout = timeout
+        self.started = False
+        self.cancelled = False
+
+    async def validate(self, value, context=None):
+        self.started = True
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.message:
+            raise ValidationError(self.message)
+
+
+class Rendezvous:
+    """
+    Lets a number of validators go on only once all of them have started.
+    """
+
+    def __init__(self, parties):
+        self.parties = parties
+        self.arrived = 0
+        self.event = None
+
+    async def wait(self):
+        if self.event is None:
+            self.event = asyncio.Event()
+        self.arrived += 1
+        if self.arrived == self.parties:
+            self.event.set()
+        await self.event.wait()
+
+
+class RendezvousValidator(Validator):
+    def __init__(self, rendezvous, error):
+        super().__init__(message=error)
+        self.rendezvous = rendezvous
+        self.timeout = 5
+
+    async def validate(self, value, context=None):
+        await self.rendezvous.wait()
+        raise ValidationError(self.message)
+
+
+def test_qhandler_validate_value_async_validators(test_handler):
+    # Run one after the other, the first validator would wait for the
+    # other one until its timeout.
+    rendezvous = Rendezvous(2)
+    t = test_handler(
+        {
+            "name": "test_field",
+            "validators": [
+                RendezvousValidator(rendezvous, "first"),
+                RequiredValidator(),
+                RendezvousValidator(rendezvous, "third"),
+            ],
+        }
+    )
+
+    assert t.validate_value("") is False
+    assert t.errors == ["first", "this field is required", "third"]
+
+
+def test_qhandler_validate_value_timeout(test_handler):
+    t = test_handler(
+        {
+            "name": "test_field",
+            "validators": [SlowValidator(1, timeout=0.01)],
+        }
+    )
+
+    assert t.validate_value("value") is False
+    assert t.errors == ["this field could not be validated in time"]
+
+
+def test_qhandler_validate_value_fail_fast(test_handler):
+    t = test_handler(
+        {
+            "name": "test_field",
+            "fail_fast": True,
+            "validators": [RequiredValidator(), RequiredValidator("second")],
+        }
+    )
+
+    assert t.validate_value("") is False
+    assert t.errors == ["this field is required"]
+
+
+def test_qhandler_validate_value_async_fail_fast(test_handler):
+    slow = SlowValidator(1)
+    t = test_handler(
+        {
+            "name": "test_field",
+            "fail_fast": True,
+            "validators": [slow, SlowValidator(0, "fast")],
+        }
+    )
+
+    assert t.validate_value("value") is False
+    assert t.errors == ["fast"]
+    assert slow.cancelled is True
+
+
+def test_qhandler_is_valid_async(mocker, test_handler):
+    t = test_handler(
+        {
+            "name": "test_field",
+            "validators": [SlowValidator(0, "error")],
+        }
+    )
+    t.get_value = mocker.MagicMock(return_value="value")
+
+    assert asyncio.run(t.is_valid_async()) is False
+    assert t.errors == ["error"]
+    t.get_value.assert_called_once()
+
+
+def test_get_dependencies(test_handler):
+    handler = test_handler(
+        {
+            "disabled": lambda answers: answers.get("a") or answers["b"],
+            "default": "default",
+        },
+    )
+
+    assert handler.get_dependencies("default") == frozenset()
+    assert handler.get_dependencies("disabled") is None
+
+    assert handler.is_disabled({"a": True, "b": False})
+    assert handler.get_dependencies("disabled") == frozenset({"a"})
+
+    assert not handler.is_disabled({"a": False, "b": False})
+    assert handler.get_dependencies("disabled") == frozenset({"a", "b"})
+
+
+def test_get_dependencies_all(test_handler):
+    handler = test_handler(
+        {
+            "disabled": lambda answers: len(answers) > 1,
+        },
+    )
+
+    handler.is_disabled({"a": True})
+    assert handler.get_dependencies("disabled") is None
+
+
+def test_get_dependencies_resolve(test_handler):
+    async def values(answers):
+        return [(answers["a"], answers["a"])]
+
+    handler = test_handler(
+        {
+            "values": values,
+        },
+    )
+
+    asyncio.run(handler.resolve({"a": "x", "b": "y"}))
+
+    assert handler.get_dependencies("values") == frozenset({"a"})
+
+
+def test_get_dependencies_expression(test_handler):
+    handler = test_handler(
+        {"disabled": compile_expression("answers.a == 1 or answers.b == 2")},
+    )
+
+    assert handler.get_dependencies("disabled") == frozenset({"a", "b"})
+    assert handler.is_disabled({"a": 1})
+    assert not handler.is_disabled({})
+
+
+def test_release_widget(test_handler, mocker):
+    t = test_handler({})
+    mocker.patch.object(t, "get_widget_class", return_value=mocker.MagicMock)
+    mocker.patch.object(t, "get_widget_init_kwargs", return_value={})
+    widget = t.get_widget()
+    mocked_get_widget_value = mocker.patch.object(
+        t,
+        "get_widget_value",
+        return_value="value",
+    )
+    mocked_set_context = mocker.patch.object(t, "set_context", create=True)
+    mocked_set_value = mocker.patch.object(t, "set_value")
+
+    t.release_widget({"question": "answer"})
+    mocked_get_widget_value.reset_mock()
+
+    assert t._widget is None
+    assert t.get_value() == "value"
+    assert t.get_formatted_value() == "value"
+    assert t._widget is None
+    mocked_get_widget_value.assert_not_called()
+    assert t.get_widget() is not widget
+    mocked_set_context.assert_called_once_with({"question": "answer"})
+    mocked_set_value.assert_called_once_with("value")
+
+    t.get_widget()
+    mocked_set_value.assert_called_once()
+
+
+def test_release_widget_not_created(test_handler):
+    t = test_handler({})
+    t.release_widget()
+    assert t._released is None
+
+
+class CountingValidator(Validator):
+    def __init__(self, message=None, cost=1, skip_empty=False):
+        super().__init__(message=message)
+        self.cost = cost
+        self.skip_empty = skip_empty
+        self.calls = 0
+
+    def validate(self, value, context=None):
+        self.calls += 1
+        if self.message:
+            raise ValidationError(self.message)
+
+
+def test_qhandler_validate_value_fail_fast_cost(test_handler):
+    expensive = CountingValidator("expensive", cost=5)
+    t = test_handler(
+        {
+            "name": "test_field",
+            "fail_fast": True,
+            "validators": [expensive, RequiredValidator()],
+        }
+    )
+
+    assert t.validate_value("") is False
+    assert t.errors == ["this field is required"]
+    assert expensive.calls == 0
+
+    assert t.validate_value("value") is False
+    assert t.errors == ["expensive"]
+
+
+def test_qhandler_validate_value_declared_order(test_handler):
+    t = test_handler(
+        {
+            "name": "test_field",
+            "validators": [
+                CountingValidator("expensive", cost=5),
+                CountingValidator("cheap", cost=0),
+            ],
+        }
+    )
+
+    assert t.validate_value("value") is False
+    assert t.errors == ["expensive", "cheap"]
+
+
+@pytest.mark.parametrize("fail_fast", [False, True])
+def test_qhandler_validate_value_skip_empty(test_handler, fail_fast):
+    skipped = CountingValidator("skipped", skip_empty=True)
+    t = test_handler(
+        {
+            "name": "test_field",
+            "fail_fast": fail_fast,
+            "validators": [skipped, RequiredValidator()],
+        }
+    )
+
+    assert t.validate_value(None) is False
+    assert t.errors == ["this field is required"]
+    assert t.validate_value("") is False
+    assert skipped.calls == 0
+
+    assert t.validate_value("value") is False
+    assert t.errors == ["skipped"]
+    assert skipped.calls == 1
+
+
+def test_qhandler_validate_value_skip_empty_async(test_handler):
+    slow = SlowValidator(1, "slow")
+    slow.skip_empty = True
+    t = test_handler(
+        {
+            "name": "test_field",
+            "validators": [RequiredValidator(), slow],
+        }
+    )
+
+    assert t.validate_value("") is False
+    assert t.errors == ["this field is required"]
+    assert slow.started is False
+
+
+def test_qhandler_validate_value_async_fail_fast_sync_first(test_handler):
+    slow = SlowValidator(1, "slow")
+    t = test_handler(
+        {
+            "name": "test_field",
+            "fail_fast": True,
+            "validators": [slow, RequiredValidator()],
+        }
+    )
+
+    assert t.validate_value("") is False
+    assert t.errors == ["this field is required"]
+    assert slow.started is False
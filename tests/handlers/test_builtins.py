@@ -1,4 +1,5 @@
 import string
+from datetime import date, datetime, timezone
 
 import pytest
 from prompt_toolkit.key_binding import KeyBindings
@@ -6,6 +7,8 @@ from prompt_toolkit.keys import Keys
 from prompt_toolkit.layout import HSplit, VSplit, Window
 from prompt_toolkit.widgets import TextArea
 
+from interrogatio.core.exceptions import ValidationError
+from interrogatio.handlers import builtins
 from interrogatio.handlers.builtins import (
     DateHandler,
     DateRangeHandler,
@@ -638,3 +641,256 @@ def test_daterange_handler_get_value(mocker):
     widget_mock.value = "value"
     s.get_widget = mocker.MagicMock(return_value=widget_mock)
     assert s.get_value() == "value"
+
+
+@pytest.mark.parametrize(
+    ("handler", "question", "value", "expected"),
+    [
+        (StringHandler, {}, None, ""),
+        (StringHandler, {}, 10, "10"),
+        (PasswordHandler, {}, "secret", "secret"),
+        (SelectOneHandler, {"values": [("a", "A")]}, "a", "a"),
+        (SelectOneHandler, {"values": []}, None, None),
+        (SelectManyHandler, {"values": [("a", "A"), ("b", "B")]}, ("b",), ["b"]),
+        (SelectManyHandler, {"values": [("a", "A")]}, None, []),
+        (SelectOneHandler, {"values": [(["a"], "A")]}, ["a"], ["a"]),
+        (MaskedInputHandler, {"mask": "__-__"}, "12-34", "12-34"),
+        (MaskedInputHandler, {"mask": "__-__"}, "", None),
+        (DateHandler, {}, datetime(2020, 1, 2), "2020-01-02"),
+        (DateHandler, {}, "2020-01-02", "2020-01-02"),
+        (DateRangeHandler, {}, None, {"from": None, "to": None}),
+        (
+            DateRangeHandler,
+            {},
+            {"from": date(2020, 1, 2)},
+            {"from": "2020-01-02", "to": None},
+        ),
+    ],
+)
+def test_handler_clean_value(handler, question, value, expected):
+    assert handler(question).clean_value(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("handler", "question", "value", "message"),
+    [
+        (
+            SelectOneHandler,
+            {"values": [("a", "A")]},
+            "b",
+            "this field is not a valid choice",
+        ),
+        (
+            SelectOneHandler,
+            {"values": [("a", "A")]},
+            ["a"],
+            "this field is not a valid choice",
+        ),
+        (
+            SelectManyHandler,
+            {"values": [("a", "A")]},
+            "a",
+            "this field must be a list of choices",
+        ),
+        (
+            SelectManyHandler,
+            {"values": [("a", "A")]},
+            [["a"]],
+            "this field contains an invalid choice",
+        ),
+        (
+            SelectManyHandler,
+            {"values": [("a", "A")]},
+            ["a", "b"],
+            "this field contains an invalid choice",
+        ),
+        (
+            MaskedInputHandler,
+            {"mask": "__-__"},
+            "12345",
+            "this field does not match the mask __-__",
+        ),
+        (
+            MaskedInputHandler,
+            {"mask": "__-__"},
+            "123",
+            "this field does not match the mask __-__",
+        ),
+        (DateHandler, {}, "2020-02-30", "this field is not a valid date"),
+        (DateRangeHandler, {}, "2020-02-01", "this field must be a date range"),
+    ],
+)
+def test_handler_clean_value_invalid(handler, question, value, message):
+    with pytest.raises(ValidationError) as cv:
+        handler(question).clean_value(value)
+
+    assert str(cv.value) == message
+
+
+@pytest.mark.parametrize("handler", [SelectOneHandler, SelectManyHandler])
+def test_select_handler_clean_value_choices_cached(handler):
+    values = [(f"v{i}", f"V{i}") for i in range(3)]
+    h = handler({"values": values})
+
+    h.clean_value("v1" if handler is SelectOneHandler else ["v1"])
+    cached = h._memo["choice_values"]
+    h.clean_value("v2" if handler is SelectOneHandler else ["v2"])
+
+    assert h._memo["choice_values"] is cached
+    assert cached[1] == {"v0", "v1", "v2"}
+
+
+@pytest.mark.parametrize(
+    ("handler", "question", "expected"),
+    [
+        (StringHandler, {}, ""),
+        (SelectOneHandler, {"values": [("a", "A"), ("b", "B")]}, "a"),
+        (SelectOneHandler, {"values": lambda ctx: []}, None),
+        (SelectManyHandler, {"values": [("a", "A")]}, []),
+        (MaskedInputHandler, {"mask": "__"}, None),
+        (DateRangeHandler, {}, {"from": None, "to": None}),
+    ],
+)
+def test_handler_get_empty_value(handler, question, expected):
+    assert handler(question).get_empty_value() == expected
+
+
+def test_selectone_handler_get_formatted_value():
+    handler = SelectOneHandler(
+        {"values": lambda ctx: [("a", "A"), ("b", "B")]},
+    )
+    handler.set_context({})
+    handler.get_widget().value = "b"
+
+    assert handler.get_formatted_value() == "B (b)"
+
+
+def test_selectmany_handler_get_formatted_value():
+    handler = SelectManyHandler(
+        {
+            "values": [(f"v{i}", f"L{i}") for i in range(20)],
+            "formatting_template": "${label}",
+        },
+    )
+    assert handler.get_formatted_value() == ""
+
+    handler.get_widget().value = [f"v{i}" for i in range(16)]
+
+    formatted = handler.get_formatted_value().split(", ")
+    assert len(formatted) == 16
+    assert formatted[-1] == "..."
+    assert set(formatted[:-1]) <= {f"L{i}" for i in range(16)}
+
+
+@pytest.mark.parametrize(
+    ("handler", "question", "value"),
+    [
+        (StringHandler, {}, "text"),
+        (PasswordHandler, {}, "secret"),
+        (SelectOneHandler, {"values": [("a", "A"), ("b", "B")]}, "b"),
+        (SelectManyHandler, {"values": [("a", "A"), ("b", "B")]}, ["b"]),
+        (MaskedInputHandler, {"mask": "__-__"}, "12-34"),
+        (DateHandler, {}, "2020-01-02"),
+        (DateRangeHandler, {}, {"from": "2020-01-02", "to": "2020-02-03"}),
+    ],
+)
+def test_handler_set_value(handler, question, value):
+    s = handler(dict(question, name="question", message="message"))
+    s.set_value(value)
+    assert s.get_value() == value
+
+
+@pytest.mark.parametrize(
+    ("handler", "value", "expected"),
+    [
+        (DateHandler, None, None),
+        (DateHandler, "2020-01-02", datetime(2020, 1, 1, 23, tzinfo=timezone.utc)),
+        (DateHandler, "2020-1-2", datetime(2020, 1, 1, 23, tzinfo=timezone.utc)),
+        (DateHandler, "2020-07-02", datetime(2020, 7, 1, 22, tzinfo=timezone.utc)),
+        (
+            DateRangeHandler,
+            {"from": "2020-01-02", "to": None},
+            {"from": datetime(2020, 1, 1, 23, tzinfo=timezone.utc), "to": None},
+        ),
+        (
+            DateRangeHandler,
+            {"from": "2020-01-02", "to": "2020-07-02"},
+            {
+                "from": datetime(2020, 1, 1, 23, tzinfo=timezone.utc),
+                "to": datetime(2020, 7, 1, 22, tzinfo=timezone.utc),
+            },
+        ),
+    ],
+)
+def test_date_handlers_value_to_python(handler, value, expected):
+    assert handler({"timezone": "Europe/Rome"}).value_to_python(value) == expected
+
+
+def test_date_handler_value_to_python_invalid():
+    with pytest.raises(ValueError):
+        DateHandler({}).value_to_python("2020-02-30")
+
+
+def test_get_timezone_cached(mocker):
+    builtins._get_timezone.cache_clear()
+    mocked = mocker.patch("tzlocal.get_localzone_name", return_value="Europe/Rome")
+
+    assert builtins._get_timezone() is builtins._get_timezone("Europe/Rome")
+    assert builtins._get_timezone() is builtins._get_timezone()
+    mocked.assert_called_once()
+
+    builtins._get_timezone.cache_clear()
+
+
+def test_date_handler_value_to_python_zoneinfo(mocker):
+    zoneinfo = pytest.importorskip("zoneinfo")
+    builtins._get_timezone.cache_clear()
+    builtins._date_to_python.cache_clear()
+    mocker.patch.dict("sys.modules", {"pytz": None})
+
+    try:
+        handler = DateHandler({"timezone": "Europe/Rome"})
+        summer = handler.value_to_python("2020-07-02")
+        winter = handler.value_to_python("2020-01-02")
+    finally:
+        builtins._get_timezone.cache_clear()
+        builtins._date_to_python.cache_clear()
+
+    assert summer.tzinfo == zoneinfo.ZoneInfo("Europe/Rome")
+    assert summer == datetime(2020, 7, 1, 22, tzinfo=timezone.utc)
+    assert winter == datetime(2020, 1, 1, 23, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("question", [{}, {"timezone": "Europe/Rome"}])
+def test_date_handler_values_to_python(question):
+    handler = DateHandler(question)
+    values = ["2020-01-02", None, "2020-07-02", "", "2020-1-2", "2020-01-02"]
+
+    result = handler.values_to_python(values)
+
+    assert result == [handler.value_to_python(value) for value in values]
+    assert result[0] is result[5]
+
+
+def test_daterange_handler_values_to_python():
+    handler = DateRangeHandler({"timezone": "Europe/Rome"})
+    values = [
+        {"from": "2020-01-02", "to": "2020-07-02"},
+        {"from": None, "to": "2020-01-02"},
+        {},
+    ]
+
+    result = handler.values_to_python(iter(values))
+
+    assert result == [handler.value_to_python(value) for value in values]
+    assert result[0]["from"] is result[1]["to"]
+
+
+def test_date_handler_values_to_python_invalid():
+    with pytest.raises(ValueError):
+        DateHandler({}).values_to_python(["2020-01-02", "2020-02-30"])
+
+
+def test_handler_values_to_python():
+    handler = SelectManyHandler({"values": [("a", "A")]})
+    assert handler.values_to_python([["a"], []]) == [["a"], []]
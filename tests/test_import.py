@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+import interrogatio
+
+
+def _imported_modules(statement):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "prompt_toolkit",
+        "pytz",
+        "tzlocal",
+        "validators",
+        "importlib_metadata",
+        "yaml",
+        "interrogatio.themes",
+    ],
+)
+def test_import_is_lazy(module):
+    assert module not in _imported_modules("import interrogatio")
+
+
+@pytest.mark.parametrize("module", ["prompt_toolkit", "validators", "pytz"])
+def test_headless_import_is_lazy(module):
+    assert module not in _imported_modules("import interrogatio.core.headless")
+
+
+def test_lazy_attributes():
+    from interrogatio.core.dialog import dialogus
+    from interrogatio.core.headless import evaluate
+    from interrogatio.core.prompt import interrogatio as prompt
+
+    assert interrogatio.dialogus is dialogus
+    assert interrogatio.evaluate is evaluate
+    assert interrogatio.interrogatio is prompt
+    assert interrogatio.get_version() == interrogatio.__version__
+    assert "evaluate" in dir(interrogatio)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        interrogatio.unknown  # noqa: B018
@@ -0,0 +1,80 @@
+import json
+
+from interrogatio.themes import Theme
+from interrogatio.themes.builtins import DefaultTheme
+
+
+def test_theme_deferred_load(mocker):
+    theme = DefaultTheme()
+    mocked_load = mocker.patch.object(theme, "load", wraps=theme.load)
+
+    theme.for_prompt()
+    theme.for_dialog()
+
+    mocked_load.assert_called_once()
+
+
+def test_theme_for_prompt_cached():
+    theme = DefaultTheme()
+    style = theme.for_prompt()
+
+    assert theme.for_prompt() is style
+    assert theme.for_dialog() is not style
+    assert theme.for_dialog() is theme.for_dialog()
+
+
+def test_theme_set_prompt_style_invalidates():
+    theme = DefaultTheme()
+    prompt_style = theme.for_prompt()
+    dialog_style = theme.for_dialog()
+
+    theme.set_prompt_style("input.question", "red")
+
+    assert theme.for_prompt() is not prompt_style
+    assert theme.for_dialog() is dialog_style
+    assert theme.for_prompt().get_attrs_for_style_str("class:input.question").color == (
+        "ff0000"
+    )
+
+
+def test_theme_set_dialog_style_invalidates():
+    theme = DefaultTheme()
+    prompt_style = theme.for_prompt()
+    dialog_style = theme.for_dialog()
+
+    theme.set_dialog_style("dialog.body", "blue")
+
+    assert theme.for_dialog() is not dialog_style
+    assert theme.for_prompt() is prompt_style
+
+
+def test_theme_load_invalidates(tmp_path):
+    filename = tmp_path / "theme.json"
+    filename.write_text(
+        json.dumps(
+            {
+                "name": "custom",
+                "prompt": {"error": "blue"},
+                "dialog": {"error": "blue"},
+            },
+        ),
+    )
+    theme = DefaultTheme()
+    style = theme.for_prompt()
+
+    theme.load(filename)
+
+    assert theme.for_prompt() is not style
+    assert theme.for_prompt().get_attrs_for_style_str("class:error").color == "0000ff"
+
+
+def test_theme_save(tmp_path):
+    filename = tmp_path / "theme.json"
+    theme = DefaultTheme()
+    theme.save(filename)
+
+    loaded = Theme()
+    loaded.load(filename)
+
+    assert loaded._prompt_styles == theme._prompt_styles
+    assert loaded._dialog_styles == theme._dialog_styles
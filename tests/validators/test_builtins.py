@@ -365,3 +365,24 @@ def test_daterange_validator_invalid(value):
     r = DateTimeRangeValidator(format_pattern="%Y-%m-%dT%H:%M:%S")
     with pytest.raises(ValidationError):
         r.validate(value)
+
+
+@pytest.mark.parametrize(
+    "validator",
+    [
+        EmailValidator(),
+        URLValidator(),
+        MinLengthValidator(8),
+        MaxLengthValidator(8),
+        IPv4Validator(),
+        RangeValidator(min=1, max=8),
+        MinValidator(min=1),
+        MaxValidator(max=8),
+        DateTimeValidator(),
+        DateTimeRangeValidator(),
+    ],
+)
+@pytest.mark.parametrize("value", [None, ""])
+def test_skip_empty_validators_accept_empty_values(validator, value):
+    assert validator.skip_empty is True
+    assert validator.validate(value) is None
@@ -132,3 +132,16 @@ def test_get_instance(validators_registry, args):
     instance = get_instance(validator)
 
     assert isinstance(instance, TestClass)
+
+
+def test_registry_get_instance_timeout():
+    reg = ValidatorsRegistry()
+
+    class TestClass(Validator):
+        async def validate(self, value, context=None):
+            pass
+
+    reg.register("test", TestClass)
+
+    assert reg.get_instance({"name": "test"}).timeout is None
+    assert reg.get_instance({"name": "test", "timeout": 2.5}).timeout == 2.5
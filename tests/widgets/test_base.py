@@ -0,0 +1,196 @@
+from types import SimpleNamespace
+
+import pytest
+
+from interrogatio.widgets import SelectMany, SelectOne
+
+VALUES = [(f"value{i}", f"Option {i}") for i in range(2000)]
+
+
+@pytest.mark.parametrize("widget_class", [SelectOne, SelectMany])
+def test_visible_range_short_list(widget_class):
+    widget = widget_class(values=VALUES[:10])
+    widget._selected_index = 9
+
+    assert widget._get_visible_range() == (0, 10)
+
+
+@pytest.mark.parametrize("widget_class", [SelectOne, SelectMany])
+def test_visible_range_default_page(widget_class):
+    widget = widget_class(values=VALUES)
+
+    assert widget._get_visible_range() == (0, 60)
+    assert widget.window.vertical_scroll == 0
+
+
+@pytest.mark.parametrize("widget_class", [SelectOne, SelectMany])
+def test_visible_range_follows_selection(mocker, widget_class):
+    widget = widget_class(values=VALUES)
+    mocker.patch.object(
+        widget.window,
+        "render_info",
+        mocker.MagicMock(window_height=20),
+    )
+
+    widget._selected_index = 100
+    assert widget._get_visible_range() == (71, 111)
+    assert widget.window.vertical_scroll == 10
+
+    widget._selected_index = 90
+    assert widget._get_visible_range() == (71, 111)
+
+    widget._selected_index = 50
+    assert widget._get_visible_range() == (40, 80)
+
+    widget._selected_index = 1999
+    assert widget._get_visible_range() == (1970, 2000)
+    assert widget.window.vertical_scroll == 10
+
+
+def test_selectmany_generate_fragments_range():
+    widget = SelectMany(values=VALUES)
+
+    fragments = widget._generate_fragments("", 10, 12)
+
+    labels = [text for _, text in fragments if text.startswith("Option")]
+    assert labels == ["Option 10", "Option 11"]
+
+
+def test_selectone_render_large_list():
+    widget = SelectOne(values=VALUES)
+    widget._selected_index = 1500
+
+    content = widget.control.create_content(width=80, height=20)
+
+    assert content.line_count == 70
+    # The selected option is the last one of the first page: (1441, 1511).
+    assert content.cursor_position.y == 59
+
+
+def _scrollbar_rows(widget, vertical_scroll, content_height):
+    margin = widget.window.right_margins[0]
+    render_info = SimpleNamespace(
+        window_height=22,
+        displayed_lines=list(range(20)),
+        content_height=content_height,
+        vertical_scroll=vertical_scroll,
+    )
+    fragments = margin.create_margin(render_info, 1, 22)
+    rows = [style for style, text in fragments if text == " "]
+    return [idx for idx, style in enumerate(rows) if "scrollbar.button" in style]
+
+
+@pytest.mark.parametrize("widget_class", [SelectOne, SelectMany])
+def test_scrollbar_virtualized(widget_class):
+    widget = widget_class(values=VALUES)
+    widget._first_visible = 1000
+
+    assert _scrollbar_rows(widget, 10, 40) == [10, 11]
+
+    widget.values = VALUES[:100]
+    assert _scrollbar_rows(widget, 50, 100) == list(range(10, 15))
+
+
+@pytest.mark.parametrize("widget_class", [SelectOne, SelectMany])
+def test_get_position_and_label(widget_class):
+    widget = widget_class(values=[("a", "A"), ("b", "B"), ("a", "Duplicated")])
+
+    assert widget.get_position("b") == 1
+    assert widget.get_position("a") == 0
+    assert widget.get_position("c") is None
+    assert widget.get_label("a") == "A"
+    assert widget.get_label("c") is None
+
+
+@pytest.mark.parametrize("widget_class", [SelectOne, SelectMany])
+def test_get_position_values_reassigned(widget_class):
+    widget = widget_class(values=[("a", "A")])
+    assert widget.get_position("a") == 0
+
+    widget.values = [("b", "B"), ("a", "A")]
+
+    assert widget.get_position("a") == 1
+    assert widget.get_label("b") == "B"
+
+
+def test_selectone_value_setter():
+    widget = SelectOne(values=VALUES)
+
+    widget.value = "value1500"
+    assert widget._selected_index == 1500
+    assert widget.value == "value1500"
+
+    widget.value = "unknown"
+    assert widget.value == "value1500"
+
+
+def test_selectmany_value_in_option_order():
+    widget = SelectMany(values=VALUES[:5], default=["value3", "value1", "unknown"])
+
+    assert widget.value == ["value1", "value3"]
+
+    widget.toggle(0)
+    widget.toggle(3)
+    assert widget.value == ["value0", "value1"]
+    assert widget.is_selected(0) is True
+    assert widget.is_selected(3) is False
+
+
+def test_selectmany_value_is_a_copy():
+    widget = SelectMany(values=VALUES[:5], default=["value1"])
+
+    widget.value.append("value2")
+
+    assert widget.value == ["value1"]
+
+
+def test_selectmany_checked():
+    widget = SelectMany(values=VALUES[:5], default=["value3", "value1"])
+
+    assert widget.checked == {"value1", "value3"}
+
+    widget.checked.add("value2")
+    widget.toggle(1)
+    assert widget.checked == {"value3"}
+
+    with pytest.raises(AttributeError):
+        widget.checked = {"value0"}
+
+
+def test_selectmany_select_all_none_invert():
+    widget = SelectMany(values=VALUES[:5], default=["value1"])
+
+    widget.invert()
+    assert widget.value == ["value0", "value2", "value3", "value4"]
+
+    widget.select_all()
+    assert widget.value == [value[0] for value in VALUES[:5]]
+
+    widget.select_none()
+    assert widget.value == []
+
+
+def test_selectmany_select_range():
+    widget = SelectMany(values=VALUES[:10])
+
+    widget.select_range(2, 5)
+    assert widget.value == ["value2", "value3", "value4"]
+
+    widget.select_range(3, 20, selected=False)
+    assert widget.value == ["value2"]
+
+    widget.select_range(8, 20)
+    assert widget.value == ["value2", "value8", "value9"]
+
+
+def test_selectmany_pending_value():
+    widget = SelectMany(default=["b", "z"])
+
+    assert widget.value == ["b", "z"]
+
+    widget.values = [("a", "A"), ("b", "B")]
+    assert widget.value == ["b"]
+
+    widget.values = [("b", "B"), ("c", "C")]
+    assert widget.value == ["b"]
+    assert widget.is_selected(0) is True
@@ -0,0 +1,121 @@
+import sys
+
+from prompt_toolkit.formatted_text import HTML
+
+from interrogatio.widgets.search import PrefixIndex, TypeAhead
+
+VALUES = [
+    ("us", "United States"),
+    ("it", "Italy"),
+    ("uk", "United Kingdom"),
+    ("in", "India"),
+    ("ie", "Ireland"),
+]
+
+
+def test_prefix_index_find():
+    index = PrefixIndex([value[1] for value in VALUES])
+
+    assert index.find("I") == 1
+    assert index.find("I", 2) == 3
+    assert index.find("I", 4) == 4
+    assert index.find("I", 5) == 1
+    assert index.find("Ir") == 4
+    assert index.find("United K") == 2
+    assert index.find("X") is None
+
+
+def test_prefix_index_formatted_labels():
+    index = PrefixIndex([HTML("<b>Bold</b>"), "Plain"])
+
+    assert index.find("Bo") == 0
+
+
+def test_prefix_index_find_longer_prefix_wraps():
+    index = PrefixIndex(["ab", "b", "ac", "ab", "a"])
+
+    assert index.find("ab", 1) == 3
+    assert index.find("ab", 4) == 0
+    assert index.find("ac", 3) == 2
+    assert index.find("ad") is None
+    assert index.find("a", 5) == 0
+
+
+def test_prefix_index_find_matches_scan():
+    labels = [f"SKU-{(idx * 7919) % 1000:04d}" for idx in range(1000)]
+    index = PrefixIndex(labels)
+
+    for prefix in ("S", "SKU-", "SKU-0", "SKU-05", "SKU-0999", "SKU-1"):
+        for start in (0, 1, 333, 998, 999, 1000):
+            expected = next(
+                (
+                    idx % len(labels)
+                    for idx in range(start, start + len(labels))
+                    if labels[idx % len(labels)].startswith(prefix)
+                ),
+                None,
+            )
+            assert index.find(prefix, start) == expected
+
+
+def test_prefix_index_find_max_code_point():
+    last = chr(sys.maxunicode)
+    index = PrefixIndex(["a", last, last * 2, "b"])
+
+    assert index.find(last, 2) == 2
+    assert index.find(last * 2) == 2
+
+
+def test_type_ahead_single_char(mocker):
+    mocked_time = mocker.patch("interrogatio.widgets.search.time")
+    mocked_time.monotonic.side_effect = [0, 10, 20, 30]
+    type_ahead = TypeAhead()
+
+    assert type_ahead.search(VALUES, "I", 0) == 1
+    assert type_ahead.search(VALUES, "I", 1) == 3
+    assert type_ahead.search(VALUES, "I", 3) == 4
+    assert type_ahead.search(VALUES, "I", 4) == 1
+
+
+def test_type_ahead_incremental(mocker):
+    mocked_time = mocker.patch("interrogatio.widgets.search.time")
+    mocked_time.monotonic.side_effect = [0, 0.5, 1, 1.5]
+    type_ahead = TypeAhead()
+
+    assert type_ahead.search(VALUES, "U", 0) == 2
+    assert type_ahead.search(VALUES, "n", 2) == 2
+    assert type_ahead.search(VALUES, "i", 2) == 2
+    assert type_ahead.search(VALUES, "X", 2) is None
+
+
+def test_type_ahead_repeated_char_cycles(mocker):
+    mocked_time = mocker.patch("interrogatio.widgets.search.time")
+    mocked_time.monotonic.side_effect = [0, 0.1, 0.2]
+    type_ahead = TypeAhead()
+
+    assert type_ahead.search(VALUES, "I", 0) == 1
+    assert type_ahead.search(VALUES, "I", 1) == 3
+    assert type_ahead.search(VALUES, "I", 3) == 4
+
+
+def test_type_ahead_reset(mocker):
+    mocked_time = mocker.patch("interrogatio.widgets.search.time")
+    mocked_time.monotonic.side_effect = [0, 0.1]
+    type_ahead = TypeAhead()
+
+    assert type_ahead.search(VALUES, "U", 0) == 2
+    type_ahead.reset()
+    assert type_ahead.search([("a", "Uno")], "n", 0) is None
+
+
+def test_type_ahead_repeated_char_cycles_over_longer_matches(mocker):
+    mocked_time = mocker.patch("interrogatio.widgets.search.time")
+    mocked_time.monotonic.side_effect = [0, 0.1, 0.2, 0.3, 0.4]
+    values = [(name, name) for name in ("abe", "aaron", "adam", "aaliyah")]
+    type_ahead = TypeAhead()
+
+    assert type_ahead.search(values, "a", 0) == 1
+    assert type_ahead.search(values, "a", 1) == 2
+    assert type_ahead.search(values, "a", 2) == 3
+    assert type_ahead.search(values, "a", 3) == 0
+    assert type_ahead.search(values, "d", 0) == 2
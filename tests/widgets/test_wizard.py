@@ -1,5 +1,10 @@
+import asyncio
+
+import pytest
+
+from interrogatio.core.expressions import compile_expression
 from interrogatio.handlers import QHandler, get_instance
-from interrogatio.validators import RequiredValidator
+from interrogatio.validators import DateTimeValidator, RequiredValidator
 from interrogatio.widgets.wizard import WizardDialog
 
 
@@ -103,14 +108,143 @@ def test_wizard_get_steps_label():
     ]
     handlers = [get_instance(q) for q in questions]
     wz = WizardDialog("title", handlers)
-    steps_lables = wz.get_steps_labels()
-    class_current = steps_lables.children[0].content.text[0][0]
-    assert "class:dialog.step.current " == class_current
-    assert "1. Question1" == steps_lables.children[0].content.text[0][1]
-    assert "class:dialog.step " == steps_lables.children[1].content.text[0][0]
-    assert "2. Question2" == steps_lables.children[1].content.text[0][1]
-    assert "disabled" in steps_lables.children[2].content.text[0][0]
-    assert "3. Question3" == steps_lables.children[2].content.text[0][1]
+    assert wz.get_steps_labels() is wz.sidebar
+    assert wz.sidebar._get_text_fragments() == [
+        ("[SetCursorPosition]", ""),
+        ("class:dialog.step.current", "1. Question1"),
+        ("", "\n"),
+        ("class:dialog.step", "2. Question2"),
+        ("", "\n"),
+        ("class:dialog.step.disabled", "3. Question3"),
+    ]
+
+
+def test_wizard_get_steps_label_cached(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {"name": "question2", "type": "input", "message": "message"},
+        {"name": "question3", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+    labels = wz.sidebar._get_text_fragments()[1::2]
+
+    assert all(
+        new is old for new, old in zip(wz.sidebar._get_text_fragments()[1::2], labels)
+    )
+
+    wz.next()
+
+    new_labels = wz.sidebar._get_text_fragments()
+    assert new_labels[0] == ("class:dialog.step", "1. Question1")
+    assert new_labels[3] == ("class:dialog.step.current", "2. Question2")
+    assert new_labels[5] is labels[2]
+
+
+def test_wizard_sidebar_virtualized(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": f"question{i}", "type": "input", "message": "message"}
+        for i in range(300)
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+    wz.sidebar.window.render_info = mocker.MagicMock(window_height=20)
+
+    fragments = wz.sidebar._get_text_fragments()
+    assert fragments[1] == ("class:dialog.step.current", "1. Question0")
+    assert fragments[-1][1] == "30. Question29"
+
+    wz.go_to_step(149)
+
+    assert wz.current_step_idx == 149
+    fragments = wz.sidebar._get_text_fragments()
+    labels = [text for _, text in fragments if text.strip()]
+    assert len(labels) == 40
+    assert labels[0] == "121. Question120"
+    assert labels[-1] == "160. Question159"
+    assert ("class:dialog.step.current", "150. Question149") in fragments
+    assert wz.sidebar.window.vertical_scroll == 10
+
+
+def test_wizard_go_to_step(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {"name": "question2", "type": "input", "message": "message", "disabled": True},
+        {
+            "name": "question3",
+            "type": "input",
+            "message": "message",
+            "validators": [RequiredValidator()],
+        },
+        {"name": "question4", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+
+    wz.go_to_step(1)
+    assert wz.current_step_idx == 2
+
+    wz.go_to_step(10)
+    assert wz.current_step_idx == 2
+    assert wz.error_messages
+
+    handlers[2].get_widget().text = "answer"
+    wz.go_to_step(3)
+    assert wz.current_step_idx == 3
+    assert wz.answers["question3"] == "answer"
+
+    wz.go_to_step(1)
+    assert wz.current_step_idx == 0
+    assert wz.next_btn.text == "Next"
+
+
+def test_wizard_go_to_step_unseen_steps_context(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {
+            "name": f"q{i}",
+            "type": "selectone",
+            "message": "message",
+            "values": lambda answers, i=i: [(f"v{i}", f"V{i}")],
+        }
+        for i in range(4)
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+    handlers[0].set_context(wz.answers)
+
+    wz.go_to_step(3)
+
+    assert wz.current_step_idx == 3
+    assert wz.answers == {"q0": "v0", "q1": "v1", "q2": "v2"}
+
+
+def test_wizard_jump(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": f"question{i}", "type": "input", "message": "message"}
+        for i in range(5)
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+
+    wz._start_jump()
+    assert wz.get_status() is wz.jump_input
+
+    wz.jump_input.text = "4"
+    wz.jump_input.buffer.validate_and_handle()
+
+    assert wz.current_step_idx == 3
+    assert wz.get_status() is not wz.jump_input
+    assert wz.jump_input.text == ""
+
+    wz._start_jump()
+    wz.jump_input.text = "x"
+    wz.jump_input.buffer.validate_and_handle()
+    assert wz.current_step_idx == 3
 
 
 def test_wizard_get_status():
@@ -421,6 +555,42 @@ def test_get_summary(mocker):
     assert "Question2: value2" in expected_text2
 
 
+def test_get_summary_cached(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {"name": "question2", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    mocked_formatted_value = mocker.patch.object(
+        QHandler,
+        "get_formatted_value",
+        return_value="value",
+    )
+    wz = WizardDialog("title", handlers, summary=True)
+    handlers[0].get_widget().text = "answer1"
+    wz.next()
+    wz.next()
+
+    summary = wz.get_summary()
+
+    assert wz.get_summary() is summary
+    assert mocked_formatted_value.call_count == 2
+
+    wz.previous()
+    wz.next()
+
+    assert wz.get_summary() is summary
+    assert mocked_formatted_value.call_count == 2
+
+    wz.previous()
+    handlers[1].get_widget().text = "answer2"
+    wz.next()
+
+    assert wz.get_summary() is not summary
+    assert mocked_formatted_value.call_count == 4
+
+
 def test_single_step(mocker):
     mocked_app = mocker.MagicMock()
     mocker.patch("interrogatio.widgets.wizard.get_app", return_value=mocked_app)
@@ -568,3 +738,495 @@ def test_wizard_fast_forward_with_error(mocker):
     wz = WizardDialog("title", handlers, summary=True, fast_forward=True)
     assert wz.current_step_idx == 2
     assert wz.current_step == wz.steps[2]
+
+
+def test_wizard_next_async(mocker):
+    tasks = []
+    mocked_app = mocker.MagicMock()
+    mocked_app.create_background_task.side_effect = tasks.append
+    mocker.patch("interrogatio.widgets.wizard.get_app", return_value=mocked_app)
+    mocker.patch(
+        "interrogatio.handlers.base.run_sync",
+        side_effect=AssertionError("not resolved"),
+    )
+    disabled = mocker.AsyncMock(return_value=True)
+    questions = [
+        {
+            "name": "question1",
+            "type": "input",
+            "message": "message",
+        },
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+            "disabled": disabled,
+        },
+        {
+            "name": "question3",
+            "type": "input",
+            "message": "message",
+        },
+    ]
+    handlers = [get_instance(q) for q in questions]
+    mocker.patch.object(WizardDialog, "validate", return_value=True)
+    wz = WizardDialog("title", handlers, run_async=True)
+
+    async def run_tasks():
+        while tasks:
+            await tasks.pop(0)
+
+    wz._dispatch(wz.next)
+    assert wz.current_step_idx == 0
+    asyncio.run(run_tasks())
+
+    assert wz.current_step_idx == 2
+    assert wz.next_btn.text == wz.label_finish
+    disabled.assert_awaited()
+
+
+def test_wizard_prevalidate(mocker):
+    class AsyncRequiredValidator(RequiredValidator):
+        async def validate(self, value, context=None):
+            super().validate(value, context=context)
+
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {
+            "name": "question1",
+            "type": "input",
+            "message": "message",
+            "validators": [AsyncRequiredValidator()],
+        },
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+        },
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers, run_async=True)
+    mocked_is_valid = mocker.patch.object(handlers[0], "is_valid")
+
+    asyncio.run(wz.prevalidate())
+
+    assert wz.validate() is False
+    assert wz.error_messages == "this field is required"
+    mocked_is_valid.assert_not_called()
+
+
+def test_wizard_get_checkpoint(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {
+            "name": "question2",
+            "type": "selectone",
+            "message": "message",
+            "values": [("a", "A"), ("b", "B")],
+        },
+        {"name": "question3", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    on_change = mocker.MagicMock()
+    wz = WizardDialog("title", handlers, intro="intro", on_change=on_change)
+
+    wz._dispatch(wz.next)
+    handlers[0].get_widget().text = "answer"
+    wz._dispatch(wz.next)
+
+    on_change.assert_called_with(wz)
+    assert on_change.call_count == 2
+    assert wz.get_checkpoint() == {
+        "names": ["question1", "question2", "question3"],
+        "step": 2,
+        "values": {"question1": "answer", "question2": "a"},
+    }
+
+    wz._dispatch(wz.previous)
+    assert wz.get_checkpoint()["values"] == {
+        "question1": "answer",
+        "question2": "a",
+    }
+
+
+def test_wizard_restore(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {
+            "name": "question2",
+            "type": "selectmany",
+            "message": "message",
+            "values": lambda answers: [("a", "A"), ("b", answers["question1"])],
+        },
+        {
+            "name": "question3",
+            "type": "input",
+            "message": "message",
+            "disabled": lambda answers: "a" in answers["question2"],
+        },
+        {"name": "question4", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+
+    assert wz.restore(
+        {
+            "names": ["question1", "question2", "question3", "question4"],
+            "step": 3,
+            "values": {
+                "question1": "B",
+                "question2": ["a", "b"],
+                "question3": "ignored",
+                "question4": "answer4",
+            },
+        },
+    )
+
+    assert wz.current_step_idx == 3
+    assert wz.answers == {"question1": "B", "question2": ["a", "b"]}
+    assert handlers[1].get_widget().values == [("a", "A"), ("b", "B")]
+    assert handlers[3].get_value() == "answer4"
+    assert wz.next_btn.text == "Finish"
+
+
+def test_wizard_restore_stops_at_invalid_step(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {
+            "name": "question2",
+            "type": "input",
+            "message": "message",
+            "validators": [RequiredValidator()],
+        },
+        {"name": "question3", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+
+    assert wz.restore(
+        {
+            "names": ["question1", "question2", "question3"],
+            "step": 2,
+            "values": {"question1": "answer1", "question2": "", "question3": "c"},
+        },
+    )
+
+    assert wz.current_step_idx == 1
+    assert wz.error_messages
+
+    handlers[1].get_widget().text = "answer2"
+    wz.next()
+
+    assert wz.current_step_idx == 2
+    assert handlers[2].get_value() == "c"
+
+
+def test_wizard_restore_other_questions(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [{"name": "question1", "type": "input", "message": "message"}]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+
+    assert not wz.restore(
+        {"names": ["question2"], "step": 0, "values": {"question2": "a"}},
+    )
+    assert handlers[0].get_value() == ""
+
+
+def test_wizard_disabled_cache(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    disabled2 = mocker.MagicMock(
+        side_effect=lambda answers: answers.get("q1") == "skip"
+    )
+    disabled3 = mocker.MagicMock(side_effect=lambda answers: answers.get("q2") == "")
+    questions = [
+        {"name": "q1", "type": "input", "message": "message"},
+        {"name": "q2", "type": "input", "message": "message", "disabled": disabled2},
+        {"name": "q3", "type": "input", "message": "message", "disabled": disabled3},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers, intro="intro")
+    wz.next()
+    handlers[0].get_widget().text = "answer"
+    wz.next()
+    assert wz.current_step_idx == 2
+    disabled2.reset_mock()
+    disabled3.reset_mock()
+
+    for _ in range(3):
+        wz.sidebar._get_text_fragments()
+        wz.set_buttons_labels()
+
+    disabled2.assert_not_called()
+    disabled3.assert_not_called()
+
+    handlers[1].get_widget().text = "answer"
+    wz.next()
+
+    disabled2.assert_not_called()
+    disabled3.assert_called_once()
+    assert not wz._is_disabled(handlers[2])
+
+    wz.previous()
+    wz.previous()
+    handlers[0].get_widget().text = "skip"
+    wz.next()
+
+    disabled2.assert_called_once()
+    assert wz.current_step_idx == 3
+
+
+def test_wizard_lazy_layouts(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": f"question{i}", "type": "input", "message": "message"}
+        for i in range(3)
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+
+    assert all(step["layout"] is None for step in wz.steps)
+    assert all(handler._widget is None for handler in handlers[1:])
+
+    layout = wz.get_current_step_container()
+
+    assert wz.steps[0]["layout"] is layout
+    assert wz.get_current_step_container() is layout
+    assert all(handler._widget is None for handler in handlers[1:])
+
+
+def test_wizard_release_steps(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {
+            "name": "question2",
+            "type": "selectone",
+            "message": "message",
+            "values": lambda answers: [("a", "A"), ("b", answers["question1"])],
+        },
+        {"name": "question3", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers, summary=True, release_steps=True)
+    handlers[0].get_widget().text = "B"
+    wz.next()
+    handlers[1].get_widget().value = "b"
+    wz.next()
+
+    assert wz.steps[0]["layout"] is None
+    assert wz.steps[1]["layout"] is None
+    assert handlers[0]._widget is None
+    assert handlers[1]._widget is None
+    assert wz.answers == {"question1": "B", "question2": "b"}
+
+    wz.previous()
+
+    assert wz.get_current_step_container() is not None
+    assert handlers[1].get_widget().values == [("a", "A"), ("b", "B")]
+    assert handlers[1].get_value() == "b"
+
+    wz.next()
+    wz.next()
+
+    assert wz.current_step_idx == 3
+    assert "Question2: </b>B (b)" not in wz.get_summary().content.text
+    assert handlers[1].get_formatted_value() == "B (b)"
+
+
+def test_wizard_release_steps_answers_without_widgets(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {
+            "name": "question2",
+            "type": "selectone",
+            "message": "message",
+            "values": [("a", "A"), ("b", "B")],
+        },
+        {"name": "question3", "type": "date", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers, summary=True, release_steps=True)
+    handlers[0].get_widget().text = "text"
+    wz.next()
+    handlers[1].get_widget().value = "b"
+    wz.next()
+    handlers[2].get_widget().value = "2020-01-02"
+    wz.next()
+    wz._changed()
+
+    assert wz.current_step_idx == 3
+    assert all(handler._widget is None for handler in handlers)
+
+    checkpoint = wz.get_checkpoint()
+    assert all(handler._widget is None for handler in handlers)
+
+    summary = wz.get_summary().content.text
+    assert all(handler._widget is None for handler in handlers)
+
+    answers = {}
+    for handler in handlers:
+        answers.update(handler.get_answer())
+    assert all(handler._widget is None for handler in handlers)
+
+    assert checkpoint["values"] == {
+        "question1": "text",
+        "question2": "b",
+        "question3": "2020-01-02",
+    }
+    assert "B (b)" in str(summary)
+    assert answers["question1"] == "text"
+    assert answers["question2"] == "b"
+    assert answers["question3"] == handlers[2].value_to_python("2020-01-02")
+
+
+@pytest.mark.parametrize("action", ["next", "previous"])
+def test_wizard_prefetch_invalid_answer(mocker, action):
+    tasks = []
+    mocked_app = mocker.MagicMock()
+    mocked_app.create_background_task.side_effect = tasks.append
+    mocker.patch("interrogatio.widgets.wizard.get_app", return_value=mocked_app)
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {
+            "name": "question2",
+            "type": "date",
+            "message": "message",
+            "validators": [DateTimeValidator("%Y-%m-%d")],
+        },
+        {"name": "question3", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers, run_async=True)
+    wz.next()
+    handlers[1].get_widget().value = "2020-13-45"
+
+    async def run_tasks():
+        while tasks:
+            await tasks.pop(0)
+
+    wz._dispatch(getattr(wz, action))
+    asyncio.run(run_tasks())
+
+    assert wz.current_step_idx == (1 if action == "next" else 0)
+    if action == "next":
+        assert wz.error_messages == "this field is not a valid datetime"
+
+
+def test_wizard_expression_unanswered(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "age", "type": "input", "message": "message"},
+        {
+            "name": "guardian",
+            "type": "input",
+            "message": "message",
+            "disabled": compile_expression("int(answers.age) >= 18"),
+        },
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers, summary=True)
+    handlers[0].get_widget().text = "20"
+
+    assert wz.sidebar._get_text_fragments()
+    wz.next()
+
+    assert wz.current_step_idx == 2
+
+
+def test_wizard_expression_not_evaluable(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "age", "type": "input", "message": "message"},
+        {
+            "name": "guardian",
+            "type": "input",
+            "message": "message",
+            "disabled": compile_expression("int(answers.age) >= 18"),
+        },
+        {
+            "name": "framework",
+            "type": "input",
+            "message": "message",
+            "disabled": compile_expression("'py' not in answers.langs"),
+        },
+        {
+            "name": "langs",
+            "type": "selectmany",
+            "message": "message",
+            "values": [("py", "Python"), ("go", "Go")],
+        },
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers, summary=True)
+
+    assert wz.sidebar._get_text_fragments()
+    wz.next()
+
+    assert wz.current_step_idx == 1
+
+
+def test_wizard_checkpoint_sensitive(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {"name": "password", "type": "password", "message": "message"},
+        {
+            "name": "question3",
+            "type": "input",
+            "message": "message",
+            "disabled": lambda answers: answers.get("question1") == "skip",
+        },
+        {"name": "secret", "type": "password", "message": "message"},
+        {"name": "question5", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+    handlers[0].get_widget().text = "answer1"
+    wz._dispatch(wz.next)
+    handlers[1].get_widget().text = "secret"
+    wz._dispatch(wz.next)
+    wz._dispatch(wz.next)
+
+    checkpoint = wz.get_checkpoint()
+
+    assert checkpoint["values"] == {"question1": "answer1", "question3": ""}
+
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+
+    assert wz.restore(dict(checkpoint, step=4))
+    assert wz.current_step_idx == 1
+    assert handlers[0].get_value() == "answer1"
+    assert handlers[1].get_value() == ""
+
+
+def test_wizard_restore_sensitive_disabled(mocker):
+    mocker.patch("interrogatio.widgets.wizard.get_app")
+    questions = [
+        {"name": "question1", "type": "input", "message": "message"},
+        {
+            "name": "password",
+            "type": "password",
+            "message": "message",
+            "disabled": lambda answers: answers.get("question1") == "skip",
+        },
+        {"name": "question3", "type": "input", "message": "message"},
+    ]
+    handlers = [get_instance(q) for q in questions]
+    wz = WizardDialog("title", handlers)
+
+    assert wz.restore(
+        {
+            "names": ["question1", "password", "question3"],
+            "step": 2,
+            "values": {"question1": "skip", "question3": "answer3"},
+        },
+    )
+
+    assert wz.current_step_idx == 2
+    assert handlers[2].get_value() == "answer3"